@@ -0,0 +1,96 @@
+"""
+Benchmarks parsing of the free-proxy-list.net table: the original BeautifulSoup row-by-row DataFrame build against
+the single-pass streaming parser.
+
+Usage:
+    python -m benchmarks.proxy_table [--html saved_page.html] [--rows 300] [--repeat 5]
+
+Without --html a synthetic page with the same layout as free-proxy-list.net is generated.
+"""
+
+import argparse
+import random
+import time
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from orb.common.proxies.get_proxies import GetProxies
+from orb.common.proxies.parser import parse_proxy_records
+
+
+def build_page(rows: int) -> str:
+    header = "".join(
+        f"<th>{name}</th>" for name in
+        ["IP Address", "Port", "Code", "Country", "Anonymity", "Google", "Https", "Last Checked"]
+    )
+    body = "".join(
+        "<tr>"
+        f"<td>{'.'.join(str(random.randint(1, 254)) for _ in range(4))}</td>"
+        f"<td>{random.choice([80, 3128, 8080, 8888])}</td><td>US</td><td>United States</td>"
+        f"<td>{random.choice(['anonymous', 'elite proxy', 'transparent'])}</td>"
+        f"<td>{random.choice(['yes', 'no'])}</td><td>{random.choice(['yes', 'no'])}</td>"
+        f"<td>{random.randint(1, 59)} mins ago</td>"
+        "</tr>"
+        for _ in range(rows)
+    )
+    navigation = "".join(f"<li><a href='/page/{i}'>Link {i}</a></li>" for i in range(200))
+    return (
+        f"<html><head><title>Free Proxy List</title></head><body><nav><ul>{navigation}</ul></nav>"
+        f"<div class='table-responsive'><table class='table table-striped table-bordered'>"
+        f"<thead><tr>{header}</tr></thead><tbody>{body}</tbody></table></div>"
+        f"<textarea>{'1.2.3.4:8080 ' * rows}</textarea></body></html>"
+    )
+
+
+def legacy_return_proxy_table(html: str) -> pd.DataFrame:
+    df = pd.DataFrame()
+    headers = None
+    for tr in BeautifulSoup(html, 'html.parser').find('table').find_all('tr'):
+        if not headers:
+            headers = [td.text.upper().replace(" ", "_") for td in tr.find_all(['th', 'td'])]
+            df = pd.DataFrame(columns=headers)
+            continue
+        df.loc[len(df)] = [td.text for td in tr.find_all(['th', 'td'])]
+    return df
+
+
+def rows_per_second(func, rows: int, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return rows * repeat / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--html", help="Path to a saved copy of the proxy page.")
+    parser.add_argument("--rows", type=int, default=300, help="Rows in the synthetic page.")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.html:
+        with open(args.html, encoding='utf-8', errors='replace') as file:
+            html = file.read()
+    else:
+        html = build_page(args.rows)
+
+    getproxies = GetProxies()
+    rows = len(parse_proxy_records(html))
+    with patch.object(getproxies, 'request_proxies', return_value=MagicMock(text=html)):
+        results = {
+            "legacy (bs4 + df.loc)": rows_per_second(lambda: legacy_return_proxy_table(html), rows, args.repeat),
+            "return_proxy_table": rows_per_second(
+                lambda: getproxies.return_proxy_table(https_only=False), rows, args.repeat),
+            "return_proxy_records": rows_per_second(
+                lambda: getproxies.return_proxy_records(https_only=False), rows, args.repeat),
+        }
+
+    print(f"{rows} rows, {args.repeat} repeats")
+    for name, rate in results.items():
+        print(f"{name:>24}: {rate:>12,.0f} rows/sec")
+
+
+if __name__ == '__main__':
+    main()
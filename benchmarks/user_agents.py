@@ -0,0 +1,45 @@
+"""
+Benchmarks the per-call cost of building spoofed headers: a fresh fake_useragent.UserAgent per GetUserAgent, as
+before, against the shared user agent corpus.
+
+Usage:
+    python -m benchmarks.user_agents [--calls 200]
+"""
+
+import argparse
+import time
+
+from fake_useragent import UserAgent
+
+from orb.common.user_agents.header_profiles import get_header_profile_factory
+from orb.common.user_agents.user_agents import GetUserAgent, get_user_agent_corpus
+
+
+def per_call_microseconds(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    get_header_profile_factory()
+    results = {
+        "UserAgent().random": per_call_microseconds(lambda: UserAgent().random, args.calls),
+        "GetUserAgent().headers_dict": per_call_microseconds(lambda: GetUserAgent().headers_dict, args.calls),
+        "HeaderProfileFactory.headers": per_call_microseconds(
+            lambda: get_header_profile_factory().headers(), args.calls),
+        "corpus.random": per_call_microseconds(lambda: get_user_agent_corpus().random, args.calls),
+        "corpus.weighted_random": per_call_microseconds(lambda: get_user_agent_corpus().weighted_random, args.calls),
+    }
+
+    for name, cost in results.items():
+        print(f"{name:>28}: {cost:>10,.1f} us/call")
+
+
+if __name__ == '__main__':
+    main()
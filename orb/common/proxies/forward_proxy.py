@@ -0,0 +1,710 @@
+"""
+This script provides a local rotating forward proxy that owns the upstream proxy pool.
+
+Clients such as Chrome and `spoof_request` point at the local address once; the proxy picks an upstream per request
+or per session, reuses upstream connections and tracks the health of every upstream, so clients never need to be
+rebuilt to change their exit IP.
+
+The proxy runs in-process on a background thread, or as a separate process:
+
+    python -m orb.common.proxies.forward_proxy --port 8899 --rotation request
+"""
+
+import argparse
+import asyncio
+import base64
+import logging
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from orb.common.proxies.get_proxies import GetProxies
+from orb.common.proxies.health import ProxyHealthRegistry
+from orb.common.proxies.proxy_pool import ProxyPool
+
+log = logging.getLogger(__name__)
+
+MAX_HEADER_BYTES = 64 * 1024
+RELAY_CHUNK_SIZE = 64 * 1024
+MAX_IDLE_PER_UPSTREAM = 8
+IDLE_TIMEOUT = 30
+
+# Status codes that indicate the upstream proxy itself is blocked or broken
+UPSTREAM_FAILURE_STATUS_CODES = {403, 407, 429, 502, 503, 504}
+
+# Headers addressed to this proxy rather than the next hop; Expect is answered here as bodies are read up front
+_PROXY_HEADERS = {"proxy-authorization", "proxy-connection", "expect"}
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class _UpstreamError(Exception):
+    """
+    Raised when a request could not be delivered through an upstream and may be retried on another one.
+    """
+
+
+def _parse_head(head: bytes) -> Tuple[str, List[Tuple[str, str]]]:
+    lines = head.decode("latin-1").split("\r\n")
+    headers = []
+    for line in lines[1:]:
+        if not line:
+            continue
+        name, _, value = line.partition(":")
+        headers.append((name.strip(), value.strip()))
+    return lines[0], headers
+
+
+def _build_head(start_line: str, headers: List[Tuple[str, str]]) -> bytes:
+    lines = [start_line] + [f"{name}: {value}" for name, value in headers]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def _header(headers: List[Tuple[str, str]], name: str) -> Optional[str]:
+    name = name.lower()
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _session_key(headers: List[Tuple[str, str]]) -> str:
+    """
+    Returns the sticky session named by the Proxy-Authorization username, e.g. http://session-1:x@127.0.0.1:8899.
+    """
+    authorization = _header(headers, "Proxy-Authorization")
+    if not authorization or not authorization.lower().startswith("basic "):
+        return ""
+    try:
+        return base64.b64decode(authorization[6:]).decode("latin-1").split(":", 1)[0]
+    except ValueError:
+        return ""
+
+
+def _keep_alive(version: str, headers: List[Tuple[str, str]]) -> bool:
+    connection = (_header(headers, "Connection") or _header(headers, "Proxy-Connection") or "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+async def _copy_exact(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, size: int) -> None:
+    while size > 0:
+        chunk = await reader.read(min(size, RELAY_CHUNK_SIZE))
+        if not chunk:
+            raise asyncio.IncompleteReadError(b"", size)
+        writer.write(chunk)
+        size -= len(chunk)
+        await writer.drain()
+
+
+async def _read_body(reader: asyncio.StreamReader, headers: List[Tuple[str, str]]) -> bytes:
+    """
+    Reads a request body, keeping chunked framing as-is, so the request can be replayed on another upstream.
+    """
+    if "chunked" in (_header(headers, "Transfer-Encoding") or "").lower():
+        body = bytearray()
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            body += line
+            size = int(line.split(b";")[0].strip(), 16)
+            if size == 0:
+                break
+            body += await reader.readexactly(size + 2)
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            body += line
+            if line == b"\r\n":
+                return bytes(body)
+    length = _header(headers, "Content-Length")
+    return await reader.readexactly(int(length)) if length else b""
+
+
+async def _relay_response_body(
+    method: str,
+    status: int,
+    headers: List[Tuple[str, str]],
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> bool:
+    """
+    Relays a final response's body to the client. Returns False if the body was delimited by closing the connection.
+    """
+    if method == "HEAD" or status in (204, 304):
+        return True
+
+    if "chunked" in (_header(headers, "Transfer-Encoding") or "").lower():
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            writer.write(line)
+            size = int(line.split(b";")[0].strip(), 16)
+            if size == 0:
+                break
+            await _copy_exact(reader, writer, size + 2)
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            writer.write(line)
+            if line == b"\r\n":
+                break
+        await writer.drain()
+        return True
+
+    length = _header(headers, "Content-Length")
+    if length is not None:
+        await _copy_exact(reader, writer, int(length))
+        return True
+
+    while chunk := await reader.read(RELAY_CHUNK_SIZE):
+        writer.write(chunk)
+        await writer.drain()
+    return False
+
+
+class ForwardProxy:
+    """
+    An asyncio HTTP forward proxy listening on localhost that relays through a pool of upstream proxies.
+
+    HTTPS is tunnelled with CONNECT and plain HTTP requests are forwarded one at a time over pooled upstream
+    connections. Upstreams are picked from the ProxyPool, weighted by health, either for every request ("request"
+    rotation) or once per session until `rotate` is called or the upstream's breaker opens ("session" rotation).
+    Sessions are named by the Proxy-Authorization username, so one proxy can serve several sticky identities.
+
+    A fixed upstream set with `set_upstream` overrides the pool. Without either, requests go straight to the target.
+    """
+
+    ROTATIONS = ("request", "session")
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        upstream: Optional[str] = None,
+        pool: Optional[ProxyPool] = None,
+        rotation: str = "session",
+        max_attempts: int = 3,
+        connect_timeout: float = 10,
+    ) -> None:
+        """
+        Initialise the ForwardProxy.
+
+        Args:
+            host (str, optional): The interface to listen on. Defaults to "127.0.0.1".
+            port (int, optional): The port to listen on. Defaults to 0, an ephemeral port.
+            upstream (str, optional): A fixed upstream proxy as "host:port", overriding the pool. Defaults to None.
+            pool (ProxyPool, optional): The upstream proxies to rotate through. Defaults to None, no rotation.
+            rotation (str, optional): "request" for a new upstream per request or tunnel, "session" for a sticky
+                upstream per session. Defaults to "session".
+            max_attempts (int, optional): Upstreams tried per request before giving up with a 502. Defaults to 3.
+            connect_timeout (float, optional): Seconds allowed to connect to an upstream. Defaults to 10.
+
+        Raises:
+            ValueError: If the rotation mode is unknown.
+        """
+        if rotation not in self.ROTATIONS:
+            raise ValueError(f"Unknown rotation mode: {rotation}")
+
+        self.host = host
+        self.port = port
+        self.upstream = upstream
+        self.pool = pool
+        self.rotation = rotation
+        self.max_attempts = max_attempts
+        self.connect_timeout = connect_timeout
+        self.health = pool.health if pool is not None else ProxyHealthRegistry()
+
+        self._sessions: Dict[str, str] = {}
+        self._idle: Dict[str, List[Tuple[Connection, float]]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._clients: Set[asyncio.StreamWriter] = set()
+
+    def __enter__(self) -> 'ForwardProxy':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def address(self) -> str:
+        """
+        Returns the local address clients should use as their proxy.
+
+        Returns:
+            str: The address as "host:port".
+        """
+        return f"{self.host}:{self.port}"
+
+    @property
+    def proxies(self) -> Dict[str, str]:
+        """
+        Returns the local address as a requests-style proxy dictionary.
+
+        Returns:
+            Dict[str, str]: The dictionary containing HTTP and HTTPS proxy values.
+        """
+        return {
+            "http": f"http://{self.address}",
+            "https": f"http://{self.address}",
+        }
+
+    def set_upstream(self, upstream: Optional[str], drop_connections: bool = True) -> None:
+        """
+        Sets a fixed upstream proxy, overriding the pool.
+
+        Args:
+            upstream (str, optional): The new upstream proxy as "host:port", or None to go back to the pool (or direct
+                connections without one).
+            drop_connections (bool, optional): Whether to close open connections so kept-alive tunnels move to the
+                new upstream. Defaults to True.
+        """
+        log.info(f"Forward proxy upstream set to {upstream or ('pool' if self.pool else 'direct')}.")
+        self.upstream = upstream
+        if drop_connections:
+            self._call_in_loop(self._drop_connections)
+
+    def rotate(self, session: Optional[str] = None, drop_connections: bool = True) -> None:
+        """
+        Forgets the sticky upstream of one or every session, so the next request picks a new one from the pool.
+
+        Args:
+            session (str, optional): The session to rotate. Defaults to every session.
+            drop_connections (bool, optional): Whether to close open connections so kept-alive tunnels move to the
+                new upstream. Defaults to True.
+        """
+        if session is None:
+            self._sessions.clear()
+        else:
+            self._sessions.pop(session, None)
+        if drop_connections:
+            self._call_in_loop(self._drop_connections)
+
+    def _call_in_loop(self, callback) -> None:
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(callback)
+
+    def _drop_connections(self) -> None:
+        for writer in list(self._clients):
+            writer.close()
+        for connections in self._idle.values():
+            for (_, writer), _ in connections:
+                writer.close()
+        self._idle.clear()
+
+    async def serve(self) -> None:
+        """
+        Starts listening on the current event loop. Useful when embedding the proxy in an existing asyncio program.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        log.info(f"Forward proxy listening on {self.address}.")
+
+    def start(self, timeout: float = 10) -> 'ForwardProxy':
+        """
+        Starts the proxy on a background thread with its own event loop.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the proxy to start listening. Defaults to 10.
+
+        Returns:
+            ForwardProxy: The ForwardProxy instance for method chaining.
+
+        Raises:
+            OSError: If the proxy cannot listen, e.g. because the port is in use.
+            TimeoutError: If the proxy is not listening within the timeout.
+        """
+        started = threading.Event()
+        errors: List[BaseException] = []
+        loop = asyncio.new_event_loop()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            try:
+                loop.run_until_complete(self.serve())
+            except BaseException as e:
+                errors.append(e)
+                return
+            finally:
+                started.set()
+            loop.run_forever()
+
+        thread = threading.Thread(target=run, name="orb-forward-proxy", daemon=True)
+        thread.start()
+        if not started.wait(timeout):
+            raise TimeoutError(f"Forward proxy did not start listening within {timeout}s.")
+        if errors:
+            thread.join()
+            loop.close()
+            self._loop = None
+            raise errors[0]
+        self._thread = thread
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the proxy and closes every open connection.
+        """
+        if not self._loop:
+            return
+
+        async def shutdown() -> None:
+            self._server.close()
+            self._drop_connections()
+            await self._server.wait_closed()
+
+        if self._thread:
+            asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    async def _choose_upstream(self, session: str, excluded: Set[str]) -> Optional[str]:
+        if self.upstream:
+            return self.upstream
+        if self.pool is None:
+            return None
+        if not len(self.pool):
+            # Only the very first fetch blocks, so keep it off the event loop
+            await asyncio.to_thread(self.pool.fill)
+
+        if self.rotation == "session":
+            current = self._sessions.get(session)
+            if current and current not in excluded and self.health.is_available(current):
+                return current
+
+        candidates = [address for address in self.pool.addresses if address not in excluded] or self.pool.addresses
+        chosen = self.health.choose(candidates)
+        if self.pool.is_stale:
+            self.pool.refresh_in_background()
+        if self.rotation == "session":
+            self._sessions[session] = chosen
+        return chosen
+
+    def _record(self, upstream: Optional[str], latency: Optional[float], status: Optional[int] = None) -> None:
+        if not upstream:
+            return
+        if latency is None or status in UPSTREAM_FAILURE_STATUS_CODES:
+            self.health.record_failure(upstream)
+        else:
+            self.health.record_success(upstream, latency)
+
+    async def _connect(self, key: str) -> Tuple[Connection, bool]:
+        """
+        Returns a pooled idle connection to `key` ("host:port") if one is still open, else a new one.
+        """
+        idle = self._idle.get(key, [])
+        while idle:
+            (reader, writer), idle_since = idle.pop()
+            if not writer.is_closing() and not reader.at_eof() and time.monotonic() - idle_since < IDLE_TIMEOUT:
+                return (reader, writer), True
+            writer.close()
+
+        host, port = key.rsplit(":", 1)
+        connection = await asyncio.wait_for(asyncio.open_connection(host, int(port)), self.connect_timeout)
+        return connection, False
+
+    def _check_in(self, key: str, connection: Connection) -> None:
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < MAX_IDLE_PER_UPSTREAM:
+            idle.append((connection, time.monotonic()))
+        else:
+            connection[1].close()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._clients.add(writer)
+        try:
+            keep_alive = True
+            while keep_alive:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if len(head) > MAX_HEADER_BYTES:
+                    raise ValueError("Request head too large.")
+                start_line, headers = _parse_head(head)
+                method, target, version = start_line.split(" ", 2)
+
+                if method.upper() == "CONNECT":
+                    await self._handle_connect(target, version, headers, reader, writer)
+                    return
+                keep_alive = await self._handle_http(method.upper(), target, version, headers, reader, writer)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError, OSError) as e:
+            log.debug(f"Forward proxy connection closed: {e}")
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+    async def _bad_gateway(self, writer: asyncio.StreamWriter) -> None:
+        writer.write(b"HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+        await writer.drain()
+
+    async def _handle_connect(
+        self,
+        target: str,
+        version: str,
+        headers: List[Tuple[str, str]],
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        session = _session_key(headers)
+        tried: Set[str] = set()
+
+        for _ in range(self.max_attempts):
+            upstream = await self._choose_upstream(session, tried)
+            start = time.perf_counter()
+            try:
+                upstream_reader, upstream_writer = await asyncio.wait_for(
+                    asyncio.open_connection(*(upstream or target).rsplit(":", 1)), self.connect_timeout,
+                )
+            except (OSError, asyncio.TimeoutError) as e:
+                log.debug(f"Forward proxy failed to reach {upstream or target}: {e}")
+                self._record(upstream, None)
+                if not upstream:
+                    break
+                tried.add(upstream)
+                continue
+
+            if not upstream:
+                writer.write(b"HTTP/1.1 200 Connection Established\r\n\r\n")
+                await writer.drain()
+                await self._relay(reader, writer, upstream_reader, upstream_writer)
+                return
+
+            try:
+                upstream_writer.write(_build_head(f"CONNECT {target} {version}", [("Host", target)]))
+                await upstream_writer.drain()
+                reply = await asyncio.wait_for(upstream_reader.readuntil(b"\r\n\r\n"), self.connect_timeout)
+                status = int(reply.split(b" ", 2)[1])
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError, OSError, ValueError) as e:
+                log.debug(f"Upstream {upstream} failed to open a tunnel to {target}: {e}")
+                upstream_writer.close()
+                self._record(upstream, None)
+                tried.add(upstream)
+                continue
+
+            self._record(upstream, time.perf_counter() - start if status == 200 else None)
+            if status != 200:
+                upstream_writer.close()
+                tried.add(upstream)
+                continue
+
+            writer.write(reply)
+            await writer.drain()
+            await self._relay(reader, writer, upstream_reader, upstream_writer)
+            return
+
+        await self._bad_gateway(writer)
+
+    async def _handle_http(
+        self,
+        method: str,
+        target: str,
+        version: str,
+        headers: List[Tuple[str, str]],
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> bool:
+        """
+        Forwards one plain HTTP request. Returns whether the client connection can carry another request.
+        """
+        url = urlsplit(target)
+        if not url.hostname:
+            writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            return False
+
+        client_keep_alive = _keep_alive(version, headers)
+        session = _session_key(headers)
+        if (_header(headers, "Expect") or "").lower() == "100-continue":
+            writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+            await writer.drain()
+        body = await _read_body(reader, headers)
+        forwarded = [(name, value) for name, value in headers if name.lower() not in _PROXY_HEADERS]
+        origin = f"{url.hostname}:{url.port or 80}"
+        path = (url.path or "/") + (f"?{url.query}" if url.query else "")
+        tried: Set[str] = set()
+
+        for _ in range(self.max_attempts):
+            upstream = await self._choose_upstream(session, tried)
+            # Upstream proxies take the absolute URI, origins take origin-form
+            request = _build_head(f"{method} {target if upstream else path} {version}", forwarded) + body
+            start = time.perf_counter()
+            try:
+                response = await self._exchange(upstream or origin, request)
+            except _UpstreamError as e:
+                log.debug(f"Forward proxy failed to reach {upstream or origin}: {e}")
+                self._record(upstream, None)
+                if not upstream:
+                    break
+                tried.add(upstream)
+                continue
+
+            (upstream_reader, upstream_writer), response_head = response
+            try:
+                # Pass interim 1xx responses, e.g. 103 Early Hints, through until the final response arrives
+                while True:
+                    status_line, response_headers = _parse_head(response_head)
+                    response_version, status = status_line.split(" ", 2)[:2]
+                    writer.write(response_head)
+                    await writer.drain()
+                    if not 100 <= int(status) < 200 or int(status) == 101:
+                        break
+                    response_head = await asyncio.wait_for(
+                        upstream_reader.readuntil(b"\r\n\r\n"), self.connect_timeout
+                    )
+                self._record(upstream, time.perf_counter() - start, int(status))
+
+                if int(status) == 101:
+                    # The connection switched protocols, e.g. to a WebSocket, and is relayed as a raw stream
+                    await self._relay(reader, writer, upstream_reader, upstream_writer)
+                    return False
+                delimited = await _relay_response_body(method, int(status), response_headers, upstream_reader, writer)
+            except BaseException:
+                upstream_writer.close()
+                raise
+            if delimited and _keep_alive(response_version, response_headers):
+                self._check_in(upstream or origin, (upstream_reader, upstream_writer))
+            else:
+                upstream_writer.close()
+            return client_keep_alive and delimited
+
+        await self._bad_gateway(writer)
+        return False
+
+    async def _exchange(self, key: str, request: bytes) -> Tuple[Connection, bytes]:
+        """
+        Sends a request over a pooled or new connection and returns the connection with the response head.
+
+        A reused connection that turns out to be closed by the peer is retried once on a fresh connection.
+        """
+        for _ in range(2):
+            try:
+                (reader, writer), reused = await self._connect(key)
+            except (OSError, asyncio.TimeoutError) as e:
+                raise _UpstreamError(str(e)) from e
+            try:
+                writer.write(request)
+                await writer.drain()
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.connect_timeout)
+                return (reader, writer), head
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError, OSError) as e:
+                writer.close()
+                if not reused:
+                    raise _UpstreamError(str(e)) from e
+        raise _UpstreamError(f"No usable connection to {key}.")
+
+    async def _relay(
+        self,
+        client_reader: asyncio.StreamReader,
+        client_writer: asyncio.StreamWriter,
+        upstream_reader: asyncio.StreamReader,
+        upstream_writer: asyncio.StreamWriter,
+    ) -> None:
+        async def pipe(source: asyncio.StreamReader, sink: asyncio.StreamWriter) -> None:
+            try:
+                while True:
+                    chunk = await source.read(RELAY_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    sink.write(chunk)
+                    await sink.drain()
+            except (ConnectionError, OSError):
+                pass
+            finally:
+                if sink.can_write_eof():
+                    try:
+                        sink.write_eof()
+                    except (ConnectionError, OSError):
+                        pass
+
+        try:
+            await asyncio.gather(
+                pipe(client_reader, upstream_writer),
+                pipe(upstream_reader, client_writer),
+            )
+        finally:
+            upstream_writer.close()
+
+
+def spawn_forward_proxy(
+    port: int = 0,
+    rotation: str = "session",
+    upstream: Optional[str] = None,
+    direct: bool = False,
+    timeout: float = 30,
+) -> Tuple[subprocess.Popen, str]:
+    """
+    Starts the forward proxy in a separate Python process and waits until it is listening.
+
+    Args:
+        port (int, optional): The port to listen on. Defaults to 0, an ephemeral port.
+        rotation (str, optional): "request" or "session" rotation. Defaults to "session".
+        upstream (str, optional): A fixed upstream proxy as "host:port". Defaults to None.
+        direct (bool, optional): Whether to connect directly instead of through the shared proxy pool.
+            Defaults to False.
+        timeout (float, optional): Seconds to wait for the process to start listening. Defaults to 30.
+
+    Returns:
+        Tuple[subprocess.Popen, str]: The process, to be terminated by the caller, and its "host:port" address.
+
+    Raises:
+        RuntimeError: If the process exits or does not report its address in time.
+    """
+    command = [sys.executable, "-m", "orb.common.proxies.forward_proxy", "--port", str(port), "--rotation", rotation]
+    if upstream:
+        command += ["--upstream", upstream]
+    if direct:
+        command.append("--direct")
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    ready = threading.Event()
+    lines: List[str] = []
+
+    def read_address() -> None:
+        lines.append(process.stdout.readline().strip())
+        ready.set()
+
+    threading.Thread(target=read_address, daemon=True).start()
+    if not ready.wait(timeout) or not lines[0]:
+        process.kill()
+        raise RuntimeError("Forward proxy process failed to start.")
+    return process, lines[0]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Runs the forward proxy until interrupted, printing its address once listening.
+
+    Args:
+        argv (List[str], optional): Command line arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Local rotating forward proxy.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--rotation", choices=ForwardProxy.ROTATIONS, default="session")
+    parser.add_argument("--upstream", help="Fixed upstream proxy as host:port, overriding the pool.")
+    parser.add_argument("--direct", action="store_true", help="Connect directly instead of through the proxy pool.")
+    args = parser.parse_args(argv)
+
+    pool = None
+    if not args.direct and not args.upstream:
+        pool = GetProxies.proxy_pool()
+
+    proxy = ForwardProxy(host=args.host, port=args.port, upstream=args.upstream, pool=pool, rotation=args.rotation)
+
+    async def run() -> None:
+        await proxy.serve()
+        print(proxy.address, flush=True)
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 import logging
+import threading
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup, Tag
 
-from orb.common.proxies.test_proxies import test_proxy
+from orb.common.proxies.parser import (ProxyRecord, is_yes,
+                                       parse_last_checked, parse_proxy_columns,
+                                       parse_proxy_records)
+from orb.common.proxies.proxy_pool import ProxyPool
 
 log = logging.getLogger(__name__)
 
@@ -18,6 +22,13 @@ class GetProxies:
 
     PROXY_SITE = "https://free-proxy-list.net/"
 
+    # Settings for the process-wide proxy pool, applied when the pool is first created
+    POOL_TTL = 600
+    POOL_CACHE_PATH: Optional[str] = None
+
+    _pool: Optional[ProxyPool] = None
+    _pool_lock = threading.Lock()
+
     def __init__(self) -> None:
         """
         Initializes the GetProxies object and sets the current date and time.
@@ -55,7 +66,9 @@ class GetProxies:
 
     def return_proxy_table(self, https_only: bool = True) -> pd.DataFrame:
         """
-        Iterates through the HTML table to build a pandas DataFrame of proxies.
+        Parses the proxy page in a single streaming pass and builds a typed pandas DataFrame of proxies.
+
+        PORT is cast to int, HTTPS and GOOGLE to bool and LAST_CHECKED to a timestamp, where those columns exist.
 
         Args:
             https_only (bool, optional): Whether to return only proxies with HTTPS support.
@@ -63,28 +76,83 @@ class GetProxies:
         Returns:
             pd.DataFrame: The pandas DataFrame containing the proxy information.
         """
-        df = pd.DataFrame()
-        headers = None
-        for tr in self.extract_table_html().find_all('tr'):
-            if not headers:
-                headers = [
-                    td.text.upper().replace(" ", "_") for td in tr.find_all(['th', 'td'])
-                ]
-                df = pd.DataFrame(columns=headers)
-                continue
-
-            df.loc[len(df)] = [td.text for td in tr.find_all(['th', 'td'])]
+        df = pd.DataFrame(parse_proxy_columns(self.request_proxies().text))
+
+        if 'PORT' in df:
+            df['PORT'] = pd.to_numeric(df['PORT'], errors='coerce').astype('Int64')
+        for column in ('HTTPS', 'GOOGLE'):
+            if column in df:
+                df[column] = df[column].map(is_yes).astype(bool)
+        if 'LAST_CHECKED' in df:
+            now = datetime.now()
+            df['LAST_CHECKED'] = pd.to_datetime(
+                [parse_last_checked(value, now) for value in df['LAST_CHECKED']]
+            )
 
         if https_only:
-            return df[df['HTTPS'] == 'yes']
+            return df[df['HTTPS']]
         return df
 
+    def return_proxy_records(self, https_only: bool = True) -> List[ProxyRecord]:
+        """
+        Parses the proxy page into typed records without building a DataFrame.
+
+        Args:
+            https_only (bool, optional): Whether to return only proxies with HTTPS support.
+
+        Returns:
+            List[ProxyRecord]: The proxy records.
+        """
+        records = parse_proxy_records(self.request_proxies().text)
+        if https_only:
+            return [record for record in records if record.https]
+        return records
+
+    def return_proxy_addresses(self, https_only: bool = True) -> List[str]:
+        """
+        Returns the proxies from the proxy table as "ip:port" addresses, skipping rows without a valid port.
+
+        Args:
+            https_only (bool, optional): Whether to return only proxies with HTTPS support.
+
+        Returns:
+            List[str]: The proxy addresses.
+        """
+        proxy_table = self.return_proxy_table(https_only=https_only).dropna(subset=['PORT'])
+        return [
+            f"{ip_address}:{port}" for ip_address, port in zip(proxy_table['IP_ADDRESS'], proxy_table['PORT'])
+        ]
+
+    @classmethod
+    def proxy_pool(cls) -> ProxyPool:
+        """
+        Returns the process-wide proxy pool, creating it on first use.
+
+        Each refresh validates the scraped proxies and keeps only the working ones.
+
+        Returns:
+            ProxyPool: The shared pool of working HTTPS proxies scraped from PROXY_SITE.
+        """
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = ProxyPool(
+                    fetcher=lambda: cls().return_proxy_addresses(https_only=True),
+                    ttl=cls.POOL_TTL,
+                    cache_path=cls.POOL_CACHE_PATH,
+                    validate=True,
+                )
+            return cls._pool
+
     def build_proxy_dict(self) -> None:
         """
         Builds a dictionary of HTTP and HTTPS proxy values from the proxy table DataFrame.
+
+        The row is sampled weighted by the health of each proxy in the shared pool, skipping tripped proxies.
         """
-        proxy_table = self.return_proxy_table(https_only=True)
-        proxy_row = proxy_table.sample(1)
+        proxy_table = self.return_proxy_table(https_only=True).dropna(subset=['PORT'])
+        addresses = [f"{ip}:{port}" for ip, port in zip(proxy_table['IP_ADDRESS'], proxy_table['PORT'])]
+        weights = self.proxy_pool().health.weights(addresses)
+        proxy_row = proxy_table.sample(1, weights=weights if any(weights) else None)
         ip_address = proxy_row['IP_ADDRESS'].values[0]
         port = proxy_row['PORT'].values[0]
 
@@ -98,14 +166,11 @@ class GetProxies:
         """
         Property that returns the proxy dictionary.
 
+        The proxy comes from the shared pool without a network round trip: the pool only caches proxies that passed a
+        live check, and proxies that fail in use are skipped by their health circuit breaker.
+
         Returns:
             Dict[str, str]: The dictionary containing HTTP and HTTPS proxy values.
-
-        Raises:
-            RuntimeError: If a working proxy cannot be found after maximum retries.
         """
-
-        self.build_proxy_dict()
-        if test_proxy(proxies=self.proxies):
-            return self.proxies
-        raise RuntimeError("Failed to find a working proxy.")
+        self.proxies = self.proxy_pool().get_proxy()
+        return self.proxies
@@ -0,0 +1,290 @@
+import bisect
+import logging
+import random
+import threading
+import time
+from itertools import accumulate
+from typing import Dict, Optional, Sequence
+
+log = logging.getLogger(__name__)
+
+
+class ProxyHealth:
+    """
+    A rolling health record for a single proxy, with a simple circuit breaker.
+
+    The breaker opens after `failure_threshold` consecutive failures, rejecting the proxy until `cooldown` seconds
+    have passed. It then goes half-open and lets exactly one trial request through: success closes it, failure
+    re-opens it. A trial that never reports back is given up after another `cooldown`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, alpha: float = 0.3, failure_threshold: int = 3, cooldown: float = 300) -> None:
+        """
+        Initialise the ProxyHealth record with an optimistic prior so untried proxies still get picked.
+
+        Args:
+            alpha (float, optional): Smoothing factor for the latency and success EWMAs. Defaults to 0.3.
+            failure_threshold (int, optional): Consecutive failures that trip the breaker. Defaults to 3.
+            cooldown (float, optional): Seconds the breaker stays open before a trial request. Defaults to 300.
+        """
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.ewma_latency: Optional[float] = None
+        self.success_rate = 1.0
+        self.consecutive_failures = 0
+        self.last_failure: Optional[float] = None
+        self.opened_at: Optional[float] = None
+        self.probing_since: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        """
+        Returns the circuit-breaker state.
+
+        Returns:
+            str: One of CLOSED, OPEN or HALF_OPEN.
+        """
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.time() - self.opened_at >= self.cooldown:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    @property
+    def probe_in_flight(self) -> bool:
+        """
+        Whether the half-open trial request has been handed out and not yet reported.
+
+        Returns:
+            bool: True while the half-open breaker is waiting on its trial request.
+        """
+        if self.probing_since is None or self.state != self.HALF_OPEN:
+            return False
+        return time.time() - self.probing_since < self.cooldown
+
+    def acquire(self) -> bool:
+        """
+        Claims the proxy for a request, taking the trial slot if the breaker is half-open.
+
+        Returns:
+            bool: False if the breaker is open or its trial request is already in flight.
+        """
+        state = self.state
+        if state == self.OPEN or self.probe_in_flight:
+            return False
+        if state == self.HALF_OPEN:
+            self.probing_since = time.time()
+        return True
+
+    def record_success(self, latency: float) -> None:
+        """
+        Records a successful request through the proxy.
+
+        Args:
+            latency (float): The request latency in seconds.
+        """
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency += self.alpha * (latency - self.ewma_latency)
+        self.success_rate += self.alpha * (1.0 - self.success_rate)
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probing_since = None
+
+    def record_failure(self) -> None:
+        """
+        Records a failed request through the proxy, tripping the breaker if needed.
+        """
+        now = time.time()
+        self.success_rate -= self.alpha * self.success_rate
+        self.consecutive_failures += 1
+        self.last_failure = now
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.opened_at = now
+        self.probing_since = None
+
+    @property
+    def changes_at(self) -> Optional[float]:
+        """
+        When the passage of time alone next changes the proxy's weight: the end of the cooldown or of a trial request.
+
+        Returns:
+            Optional[float]: The epoch time, or None if only new outcomes change the weight.
+        """
+        if self.state == self.OPEN:
+            return self.opened_at + self.cooldown
+        if self.probe_in_flight:
+            return self.probing_since + self.cooldown
+        return None
+
+    def weight(self, default_latency: float = 1.0) -> float:
+        """
+        Returns the selection weight of the proxy: higher for fast, reliable proxies and zero while tripped or while
+        its trial request is in flight.
+
+        Args:
+            default_latency (float, optional): Latency assumed for proxies that have not been timed yet.
+                Defaults to 1.0.
+
+        Returns:
+            float: The selection weight.
+        """
+        if self.state == self.OPEN or self.probe_in_flight:
+            return 0.0
+        latency = self.ewma_latency if self.ewma_latency is not None else default_latency
+        return self.success_rate ** 2 / max(latency, 0.05)
+
+
+class ProxyHealthRegistry:
+    """
+    A thread-safe collection of ProxyHealth records keyed by "ip:port" address.
+
+    `choose` caches the cumulative weights of the last address list it was given and bisects them, so picks are
+    O(log n); the cache is rebuilt, in O(n), only after an outcome is recorded or a breaker's cooldown ends.
+    """
+
+    def __init__(self, alpha: float = 0.3, failure_threshold: int = 3, cooldown: float = 300) -> None:
+        """
+        Initialise the ProxyHealthRegistry.
+
+        Args:
+            alpha (float, optional): Smoothing factor for new records. Defaults to 0.3.
+            failure_threshold (int, optional): Consecutive failures that trip a breaker. Defaults to 3.
+            cooldown (float, optional): Seconds a tripped breaker stays open. Defaults to 300.
+        """
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._records: Dict[str, ProxyHealth] = {}
+        self._lock = threading.RLock()
+
+        self._version = 0
+        self._cached_addresses: Optional[Sequence[str]] = None
+        self._cached_version = -1
+        self._cached_until: Optional[float] = None
+        self._cumulative_weights: list = []
+
+    def get(self, address: str) -> ProxyHealth:
+        """
+        Returns the health record of a proxy, creating it if needed.
+
+        Args:
+            address (str): The proxy address.
+
+        Returns:
+            ProxyHealth: The health record.
+        """
+        record = self._records.get(address)
+        if record is None:
+            with self._lock:
+                record = self._records.setdefault(
+                    address,
+                    ProxyHealth(alpha=self.alpha, failure_threshold=self.failure_threshold, cooldown=self.cooldown),
+                )
+        return record
+
+    def record_success(self, address: str, latency: float) -> None:
+        """
+        Records a successful request through a proxy.
+
+        Args:
+            address (str): The proxy address.
+            latency (float): The request latency in seconds.
+        """
+        with self._lock:
+            self.get(address).record_success(latency)
+            self._version += 1
+
+    def record_failure(self, address: str) -> None:
+        """
+        Records a failed request through a proxy.
+
+        Args:
+            address (str): The proxy address.
+        """
+        with self._lock:
+            record = self.get(address)
+            record.record_failure()
+            self._version += 1
+            if record.state == ProxyHealth.OPEN:
+                log.debug(f"Circuit breaker open for proxy {address}.")
+
+    def is_available(self, address: str) -> bool:
+        """
+        Whether requests may currently be sent through the proxy.
+
+        Args:
+            address (str): The proxy address.
+
+        Returns:
+            bool: False while the proxy's breaker is open or its half-open trial request is in flight.
+        """
+        record = self.get(address)
+        return record.state != ProxyHealth.OPEN and not record.probe_in_flight
+
+    def weights(self, addresses: Sequence[str]) -> list:
+        """
+        Returns the selection weight of each address.
+
+        Args:
+            addresses (Sequence[str]): The proxy addresses.
+
+        Returns:
+            list: The weights, in the same order as `addresses`.
+        """
+        known = [self._records[a].ewma_latency for a in addresses if a in self._records]
+        timed = [latency for latency in known if latency is not None]
+        default_latency = sum(timed) / len(timed) if timed else 1.0
+        return [
+            self._records[a].weight(default_latency) if a in self._records else 1.0 / default_latency
+            for a in addresses
+        ]
+
+    def choose(self, addresses: Sequence[str]) -> str:
+        """
+        Picks an address weighted by health, skipping proxies whose breaker is open or already being probed.
+
+        Picking a half-open proxy claims its single trial request. Falls back to a uniform pick if every proxy is
+        tripped.
+
+        Args:
+            addresses (Sequence[str]): The candidate proxy addresses.
+
+        Returns:
+            str: The chosen address.
+        """
+        with self._lock:
+            cumulative = self._cumulative(addresses)
+            if not cumulative[-1]:
+                log.warning("All proxies are tripped, picking one uniformly.")
+                return random.choice(addresses)
+            chosen = addresses[bisect.bisect_right(cumulative, random.random() * cumulative[-1])]
+            record = self._records.get(chosen)
+            if record is not None and record.state == ProxyHealth.HALF_OPEN:
+                record.acquire()
+                self._version += 1
+            return chosen
+
+    def _cumulative(self, addresses: Sequence[str]) -> list:
+        # Reuse the cached weights while the address list, the recorded outcomes and every breaker are unchanged
+        if (
+            addresses is self._cached_addresses
+            and self._version == self._cached_version
+            and (self._cached_until is None or time.time() < self._cached_until)
+        ):
+            return self._cumulative_weights
+
+        records = [self._records[a] for a in addresses if a in self._records]
+        changes = [record.changes_at for record in records if record.changes_at is not None]
+        self._cumulative_weights = list(accumulate(self.weights(addresses)))
+        self._cached_addresses = addresses
+        self._cached_version = self._version
+        self._cached_until = min(changes) if changes else None
+        return self._cumulative_weights
@@ -0,0 +1,182 @@
+"""
+This script provides a single-pass parser for the proxy table served by free-proxy-list.net.
+"""
+
+import re
+from datetime import datetime, timedelta
+from html.parser import HTMLParser
+from typing import Dict, List, NamedTuple, Optional
+
+_AGE_PATTERN = re.compile(r"(\d+)\s*(sec|min|hour|day)", re.IGNORECASE)
+_AGE_UNITS = {"sec": "seconds", "min": "minutes", "hour": "hours", "day": "days"}
+
+# Characters fed to the parser at a time, so feeding can stop soon after the first table closes
+FEED_CHUNK_SIZE = 16 * 1024
+
+
+class ProxyRecord(NamedTuple):
+    """
+    A single typed row of the proxy table.
+    """
+    ip_address: str
+    port: int
+    code: str
+    country: str
+    anonymity: str
+    google: bool
+    https: bool
+    last_checked: Optional[datetime]
+
+
+class ProxyTableParser(HTMLParser):
+    """
+    Streams through an HTML document and collects the cells of its first table into columnar lists.
+
+    Once the first table is closed, further input is ignored; feed the document in chunks and stop when `done` is set
+    to avoid tokenising the rest of the page.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.headers: List[str] = []
+        self.columns: List[List[str]] = []
+        self._in_table = False
+        self._done = False
+        self._row: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._done:
+            return
+        if tag == 'table':
+            self._in_table = True
+        elif not self._in_table:
+            return
+        elif tag == 'tr':
+            self._row = []
+        elif tag in ('td', 'th') and self._row is not None:
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if not self._in_table or self._done:
+            return
+        if tag in ('td', 'th') and self._cell is not None:
+            self._row.append("".join(self._cell))
+            self._cell = None
+        elif tag == 'tr' and self._row is not None:
+            self._add_row(self._row)
+            self._row = None
+        elif tag == 'table':
+            self._done = True
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _add_row(self, row: List[str]) -> None:
+        if not self.headers:
+            self.headers = [cell.upper().replace(" ", "_") for cell in row]
+            self.columns = [[] for _ in self.headers]
+            return
+        if len(row) != len(self.headers):
+            return
+        for column, cell in zip(self.columns, row):
+            column.append(cell)
+
+    @property
+    def done(self) -> bool:
+        """
+        Returns whether the first table has been closed.
+        """
+        return self._done
+
+    def feed(self, data: str) -> None:
+        if not self._done:
+            super().feed(data)
+
+
+def parse_proxy_columns(html: str) -> Dict[str, List[str]]:
+    """
+    Parses the first table of an HTML document into columns of raw cell text.
+
+    The document is fed in chunks of FEED_CHUNK_SIZE characters, stopping at the chunk in which the table closes.
+
+    Args:
+        html (str): The HTML document.
+
+    Returns:
+        Dict[str, List[str]]: Cell values keyed by upper-cased, underscore-separated header.
+    """
+    parser = ProxyTableParser()
+    for start in range(0, len(html), FEED_CHUNK_SIZE):
+        parser.feed(html[start:start + FEED_CHUNK_SIZE])
+        if parser.done:
+            break
+    return dict(zip(parser.headers, parser.columns))
+
+
+def parse_last_checked(value: str, now: datetime) -> Optional[datetime]:
+    """
+    Converts a relative age such as "1 hour 5 mins ago" into an absolute timestamp.
+
+    Args:
+        value (str): The relative age.
+        now (datetime): The reference time the age is relative to.
+
+    Returns:
+        Optional[datetime]: The timestamp, or None if the value could not be parsed.
+    """
+    matches = _AGE_PATTERN.findall(value)
+    if not matches:
+        return None
+    return now - timedelta(**{_AGE_UNITS[unit.lower()]: int(amount) for amount, unit in matches})
+
+
+def is_yes(value: str) -> bool:
+    """
+    Returns whether a table cell reads "yes".
+    """
+    return value.strip().lower() == 'yes'
+
+
+def parse_proxy_records(html: str, now: Optional[datetime] = None) -> List[ProxyRecord]:
+    """
+    Parses the proxy table into typed records without going through pandas.
+
+    Rows whose port is missing or not a number are skipped, matching the rows that have no PORT in the DataFrame path.
+
+    Args:
+        html (str): The HTML document.
+        now (datetime, optional): Reference time for the LAST_CHECKED column. Defaults to datetime.now().
+
+    Returns:
+        List[ProxyRecord]: One record per table row with a valid port.
+    """
+    now = now or datetime.now()
+    columns = parse_proxy_columns(html)
+    n_rows = len(next(iter(columns.values()), []))
+    empty = [""] * n_rows
+
+    return [
+        ProxyRecord(
+            ip_address=ip_address,
+            port=int(port),
+            code=code,
+            country=country,
+            anonymity=anonymity,
+            google=is_yes(google),
+            https=is_yes(https),
+            last_checked=parse_last_checked(last_checked, now),
+        )
+        for ip_address, port, code, country, anonymity, google, https, last_checked in zip(
+            columns.get('IP_ADDRESS', empty),
+            columns.get('PORT', empty),
+            columns.get('CODE', empty),
+            columns.get('COUNTRY', empty),
+            columns.get('ANONYMITY', empty),
+            columns.get('GOOGLE', empty),
+            columns.get('HTTPS', empty),
+            columns.get('LAST_CHECKED', empty),
+        )
+        if port.strip().isdecimal()
+    ]
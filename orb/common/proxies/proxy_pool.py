@@ -0,0 +1,242 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+from orb.common.proxies.health import ProxyHealthRegistry
+from orb.common.proxies.test_proxies import rank_proxies
+
+log = logging.getLogger(__name__)
+
+
+class ProxyPool:
+    """
+    A process-wide, TTL-cached pool of proxy addresses.
+
+    The pool fetches the proxy list once through the supplied fetcher, keeps it in memory (and optionally on disk)
+    and hands out proxies without touching the network. Once the cached list is older than the TTL a single
+    background refresh is started while the stale list keeps being served.
+
+    With `validate`, every refresh checks the fetched proxies concurrently and caches only the working ones, so liveness
+    is never tested when a proxy is handed out. Proxies are picked weighted by their health record, so fast and reliable
+    proxies are preferred and proxies with an open circuit breaker are skipped. Callers report outcomes through
+    `record_success` and `record_failure`.
+    """
+
+    def __init__(
+        self,
+        fetcher: Callable[[], Sequence[str]],
+        ttl: float = 600,
+        cache_path: Optional[str] = None,
+        health: Optional[ProxyHealthRegistry] = None,
+        validate: bool = False,
+    ) -> None:
+        """
+        Initialise the ProxyPool.
+
+        Args:
+            fetcher (Callable[[], Sequence[str]]): Callable returning a list of "ip:port" proxy addresses.
+            ttl (float, optional): Seconds before the cached list is considered stale. Defaults to 600.
+            cache_path (str, optional): JSON file used to persist the list between processes. Defaults to None.
+            health (ProxyHealthRegistry, optional): Health records used for weighted selection. Defaults to a new
+                registry.
+            validate (bool, optional): Whether refreshes keep only the proxies that pass a live check. Defaults to
+                False.
+        """
+        self.fetcher = fetcher
+        self.ttl = ttl
+        self.cache_path = cache_path
+        self.health = health or ProxyHealthRegistry()
+        self.validate = validate
+
+        self._addresses: tuple = ()
+        self._fetched_at: float = 0.0
+        self._lock = threading.Lock()
+        self._fill_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        if self.cache_path:
+            self._load_from_disk()
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    @property
+    def addresses(self) -> List[str]:
+        """
+        Returns the currently cached proxy addresses.
+
+        Returns:
+            List[str]: The cached "ip:port" addresses.
+        """
+        return list(self._addresses)
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        Whether the cached list is empty or older than the TTL.
+
+        Returns:
+            bool: True if the pool should be refreshed.
+        """
+        return not self._addresses or (time.time() - self._fetched_at) > self.ttl
+
+    def refresh(self) -> None:
+        """
+        Fetches a fresh proxy list synchronously and replaces the cached one, keeping only working proxies if the pool
+        validates.
+
+        Raises:
+            RuntimeError: If the fetcher returns no proxies and nothing is cached.
+        """
+        addresses = tuple(self.fetcher())
+        if self.validate and addresses:
+            addresses = tuple(self._check(addresses))
+        if not addresses:
+            if not self._addresses:
+                raise RuntimeError("Proxy fetcher returned no working proxies.")
+            log.warning("Proxy fetcher returned no working proxies, keeping the cached list.")
+            return
+
+        self.set_addresses(addresses)
+        log.debug(f"Proxy pool refreshed with {len(addresses)} proxies.")
+
+    def warm(self, max_workers: int = 64, timeout: float = 5, deadline: Optional[float] = 30) -> None:
+        """
+        Fetches the proxy list, validates every proxy concurrently and caches only the working ones, fastest first.
+
+        Args:
+            max_workers (int, optional): Maximum number of proxies checked at once. Defaults to 64.
+            timeout (float, optional): Per-proxy deadline in seconds. Defaults to 5.
+            deadline (float, optional): Overall validation deadline in seconds. Defaults to 30.
+
+        Raises:
+            RuntimeError: If no working proxy is found.
+        """
+        addresses = self._check(self.fetcher(), max_workers=max_workers, timeout=timeout, deadline=deadline)
+        if not addresses:
+            raise RuntimeError("Failed to find a working proxy.")
+        self.set_addresses(addresses)
+
+    def _check(
+        self,
+        addresses: Sequence[str],
+        max_workers: int = 64,
+        timeout: float = 5,
+        deadline: Optional[float] = 30,
+    ) -> List[str]:
+        checks = rank_proxies(addresses, max_workers=max_workers, timeout=timeout, deadline=deadline)
+        for check in checks:
+            self.health.record_success(check.address, check.latency)
+        return [check.address for check in checks]
+
+    def set_addresses(self, addresses: Sequence[str]) -> None:
+        """
+        Replaces the cached proxy list and persists it if a cache path is configured.
+
+        Args:
+            addresses (Sequence[str]): The "ip:port" addresses to cache.
+        """
+        with self._lock:
+            self._addresses = tuple(addresses)
+            self._fetched_at = time.time()
+        if self.cache_path:
+            self._save_to_disk()
+
+    def refresh_in_background(self) -> None:
+        """
+        Starts a background refresh unless one is already running.
+        """
+        with self._lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(target=self._background_refresh, daemon=True)
+            self._refresh_thread.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            log.error(f"Background proxy refresh failed: {e}")
+
+    def record_success(self, address: str, latency: float) -> None:
+        """
+        Records a successful request through a pooled proxy.
+
+        Args:
+            address (str): The proxy address.
+            latency (float): The request latency in seconds.
+        """
+        self.health.record_success(address, latency)
+
+    def record_failure(self, address: str) -> None:
+        """
+        Records a failed request through a pooled proxy.
+
+        Args:
+            address (str): The proxy address.
+        """
+        self.health.record_failure(address)
+
+    def get_address(self) -> str:
+        """
+        Returns a cached proxy address, picked at random weighted by health.
+
+        Only the very first call (with an empty cache) blocks on the network, and concurrent first callers share its
+        fetch; afterwards stale lists are refreshed in the background.
+
+        Returns:
+            str: A proxy address in the form "ip:port".
+        """
+        if not self._addresses:
+            self.fill()
+        elif self.is_stale:
+            self.refresh_in_background()
+        return self.health.choose(self._addresses)
+
+    def fill(self) -> None:
+        """
+        Fetches the proxy list synchronously if nothing is cached yet, sharing one fetch between concurrent callers.
+
+        Raises:
+            RuntimeError: If the fetcher returns no proxies.
+        """
+        with self._fill_lock:
+            if not self._addresses:
+                self.refresh()
+
+    def get_proxy(self) -> Dict[str, str]:
+        """
+        Returns a cached proxy as a requests-style proxy dictionary.
+
+        Returns:
+            Dict[str, str]: The dictionary containing HTTP and HTTPS proxy values.
+        """
+        address = self.get_address()
+        return {
+            "http": address,
+            "https": address,
+        }
+
+    def _load_from_disk(self) -> None:
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, 'r') as file:
+                cached = json.load(file)
+            self._addresses = tuple(cached['proxies'])
+            self._fetched_at = float(cached['fetched_at'])
+            log.debug(f"Loaded {len(self._addresses)} proxies from {self.cache_path}.")
+        except (OSError, ValueError, KeyError) as e:
+            log.warning(f"Ignoring unreadable proxy cache {self.cache_path}: {e}")
+
+    def _save_to_disk(self) -> None:
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            with open(tmp_path, 'w') as file:
+                json.dump({"fetched_at": self._fetched_at, "proxies": list(self._addresses)}, file)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            log.warning(f"Failed to write proxy cache {self.cache_path}: {e}")
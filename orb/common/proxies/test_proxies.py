@@ -1,10 +1,24 @@
 import logging
-from typing import Dict
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
 
 import requests
 
 log = logging.getLogger(__name__)
 
+TEST_URL = 'http://www.example.com'
+
+
+class ProxyCheck(NamedTuple):
+    """
+    The outcome of validating a single proxy address.
+    """
+    address: str
+    working: bool
+    latency: Optional[float]
+
 
 def test_proxy(proxies: Dict[str, str]) -> bool:
     """
@@ -17,7 +31,7 @@ def test_proxy(proxies: Dict[str, str]) -> bool:
         bool: True if the proxy is working, False otherwise.
     """
     try:
-        url = 'http://www.example.com'
+        url = TEST_URL
         response = requests.get(url, proxies=proxies, timeout=5)
         if response.status_code == 200:
             log.info(f"{proxies['https']} Proxy is working!")
@@ -28,3 +42,89 @@ def test_proxy(proxies: Dict[str, str]) -> bool:
     except requests.exceptions.RequestException:
         log.error("Unable to connect to the proxy.")
         return False
+
+
+def check_proxy(address: str, url: str = TEST_URL, timeout: float = 5) -> ProxyCheck:
+    """
+    Check a single "ip:port" proxy address and measure its round trip latency.
+
+    Args:
+        address (str): The proxy address to check.
+        url (str, optional): The URL requested through the proxy. Defaults to TEST_URL.
+        timeout (float, optional): Per-proxy deadline in seconds. Defaults to 5.
+
+    Returns:
+        ProxyCheck: The check result, with latency set only for working proxies.
+    """
+    proxies = {"http": address, "https": address}
+    start = time.perf_counter()
+    try:
+        response = requests.get(url, proxies=proxies, timeout=timeout)
+    except requests.exceptions.RequestException:
+        return ProxyCheck(address=address, working=False, latency=None)
+
+    if response.status_code != 200:
+        return ProxyCheck(address=address, working=False, latency=None)
+    return ProxyCheck(address=address, working=True, latency=time.perf_counter() - start)
+
+
+def iter_proxy_checks(
+    addresses: Iterable[str],
+    max_workers: int = 32,
+    timeout: float = 5,
+    deadline: Optional[float] = 30,
+    url: str = TEST_URL,
+) -> Iterator[ProxyCheck]:
+    """
+    Check many proxy addresses concurrently, yielding each result as soon as it finishes.
+
+    Args:
+        addresses (Iterable[str]): The "ip:port" proxy addresses to check.
+        max_workers (int, optional): Maximum number of proxies checked at once. Defaults to 32.
+        timeout (float, optional): Per-proxy deadline in seconds. Defaults to 5.
+        deadline (float, optional): Overall deadline in seconds, after which unfinished checks are abandoned.
+            Defaults to 30. None waits for every check.
+        url (str, optional): The URL requested through each proxy. Defaults to TEST_URL.
+
+    Yields:
+        ProxyCheck: The result of each finished check, in completion order.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="proxy-check")
+    futures = [executor.submit(check_proxy, address, url, timeout) for address in addresses]
+    try:
+        for future in as_completed(futures, timeout=deadline):
+            yield future.result()
+    except FutureTimeoutError:
+        unfinished = sum(not future.done() for future in futures)
+        log.warning(f"Proxy validation deadline of {deadline}s reached, abandoning {unfinished} checks.")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def rank_proxies(
+    addresses: Iterable[str],
+    max_workers: int = 32,
+    timeout: float = 5,
+    deadline: Optional[float] = 30,
+    url: str = TEST_URL,
+) -> List[ProxyCheck]:
+    """
+    Check many proxy addresses concurrently and return the working ones, fastest first.
+
+    Args:
+        addresses (Iterable[str]): The "ip:port" proxy addresses to check.
+        max_workers (int, optional): Maximum number of proxies checked at once. Defaults to 32.
+        timeout (float, optional): Per-proxy deadline in seconds. Defaults to 5.
+        deadline (float, optional): Overall deadline in seconds. Defaults to 30.
+        url (str, optional): The URL requested through each proxy. Defaults to TEST_URL.
+
+    Returns:
+        List[ProxyCheck]: The working proxies sorted by ascending latency.
+    """
+    working = [
+        check for check in iter_proxy_checks(
+            addresses, max_workers=max_workers, timeout=timeout, deadline=deadline, url=url
+        ) if check.working
+    ]
+    log.info(f"{len(working)} working proxies found.")
+    return sorted(working, key=lambda check: check.latency)
@@ -0,0 +1,138 @@
+import random
+import threading
+from collections import Counter
+from typing import Optional, Sequence
+
+from fake_useragent import UserAgent
+
+# Approximate global browser market share, used to weight user agent sampling
+BROWSER_MARKET_SHARE = {
+    "chrome": 0.65,
+    "safari": 0.18,
+    "edge": 0.05,
+    "firefox": 0.03,
+}
+OTHER_MARKET_SHARE = 0.01
+
+
+class UserAgentCorpus:
+    """
+    A compact, immutable corpus of user agent strings with O(1) sampling.
+
+    Weighted sampling uses a precomputed lookup table of TABLE_SIZE slots, in which each user agent fills a number of
+    slots proportional to its weight, rounded and never fewer than one, so both uniform and weighted draws are a single
+    random index.
+    """
+
+    TABLE_SIZE = 4096
+
+    def __init__(
+        self,
+        user_agents: Sequence[str],
+        browsers: Optional[Sequence[str]] = None,
+        platforms: Optional[Sequence[str]] = None,
+        weights: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        Initialise the UserAgentCorpus.
+
+        Args:
+            user_agents (Sequence[str]): The user agent strings.
+            browsers (Sequence[str], optional): Browser family of each user agent, e.g. "chrome".
+            platforms (Sequence[str], optional): Platform of each user agent: "pc", "mobile" or "tablet".
+            weights (Sequence[float], optional): Relative sampling weight of each user agent. Defaults to uniform.
+
+        Raises:
+            ValueError: If the corpus is empty.
+        """
+        if not user_agents:
+            raise ValueError("User agent corpus cannot be empty.")
+
+        self.user_agents = tuple(user_agents)
+        self.browsers = tuple(browsers) if browsers else ("",) * len(self.user_agents)
+        self.platforms = tuple(platforms) if platforms else ("",) * len(self.user_agents)
+        self._weighted_table = self._build_weighted_table(weights or [1.0] * len(self.user_agents))
+
+    def __len__(self) -> int:
+        return len(self.user_agents)
+
+    def _build_weighted_table(self, weights: Sequence[float]) -> tuple:
+        total = sum(weights)
+        slots = [max(1, round(self.TABLE_SIZE * weight / total)) for weight in weights]
+        return tuple(index for index, count in enumerate(slots) for _ in range(count))
+
+    @classmethod
+    def from_fake_useragent(cls) -> 'UserAgentCorpus':
+        """
+        Builds the corpus from the dataset bundled with fake_useragent, loading it exactly once.
+
+        Each user agent is weighted by the market share of its browser family divided by the number of user agents in
+        that family, times the user agent's own usage percent from the dataset (100 when missing).
+
+        Returns:
+            UserAgentCorpus: The corpus.
+        """
+        data = [
+            row for row in UserAgent().data_browsers
+            if isinstance(row, dict) and row.get("useragent")
+        ]
+        browsers = [str(row.get("browser", "")).lower() for row in data]
+        family_sizes = Counter(browsers)
+        weights = [
+            BROWSER_MARKET_SHARE.get(browser, OTHER_MARKET_SHARE) / family_sizes[browser]
+            * float(row.get("percent", 100.0))
+            for browser, row in zip(browsers, data)
+        ]
+        return cls(
+            user_agents=[row["useragent"] for row in data],
+            browsers=browsers,
+            platforms=[row.get("type", "") for row in data],
+            weights=weights,
+        )
+
+    def random_index(self, weighted: bool = False) -> int:
+        """
+        Returns the index of a random user agent.
+
+        Args:
+            weighted (bool, optional): Whether to weight the draw by browser market share. Defaults to False.
+
+        Returns:
+            int: The index into `user_agents`.
+        """
+        if weighted:
+            return self._weighted_table[int(random.random() * len(self._weighted_table))]
+        return int(random.random() * len(self.user_agents))
+
+    @property
+    def random(self) -> str:
+        """
+        Returns a uniformly random user agent, mirroring fake_useragent.UserAgent.random.
+        """
+        return self.user_agents[self.random_index()]
+
+    @property
+    def weighted_random(self) -> str:
+        """
+        Returns a random user agent weighted by browser market share.
+        """
+        return self.user_agents[self.random_index(weighted=True)]
+
+
+_corpus: Optional[UserAgentCorpus] = None
+_corpus_lock = threading.Lock()
+
+
+def get_user_agent_corpus() -> UserAgentCorpus:
+    """
+    Returns the process-wide user agent corpus, loading the fake_useragent dataset on first use.
+
+    Returns:
+        UserAgentCorpus: The shared corpus.
+    """
+    global _corpus
+    if _corpus is None:
+        with _corpus_lock:
+            if _corpus is None:
+                _corpus = UserAgentCorpus.from_fake_useragent()
+    return _corpus
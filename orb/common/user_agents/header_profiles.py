@@ -0,0 +1,313 @@
+import importlib.util
+import random
+import re
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from orb.common.user_agents.corpus import (UserAgentCorpus,
+                                           get_user_agent_corpus)
+
+ACCEPT_LANGUAGES = [
+    "en-US,en;q=0.9",
+    "en-GB,en;q=0.9",
+    "fr-FR,fr;q=0.9,en;q=0.8",
+    "es-ES,es;q=0.9,en;q=0.8",
+]
+
+REFERER_URLS = [
+    "https://www.google.com/",
+    "https://www.bing.com/",
+    "https://duckduckgo.com/",
+    "https://en.wikipedia.org/",
+    "https://www.reddit.com/",
+]
+
+ACCEPT_BY_ENGINE = {
+    "chromium": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,"
+        "application/signed-exchange;v=b3;q=0.7"
+    ),
+    "firefox": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
+    "webkit": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+# Only advertise brotli when a decoder is installed, otherwise br bodies come back undecodable
+ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    else "gzip, deflate"
+)
+
+_CHROME_VERSION = re.compile(r"Chrome/(\d+)((?:\.\d+)*)")
+_EDGE_VERSION = re.compile(r"Edg/(\d+)((?:\.\d+)*)")
+_PLATFORM_VERSIONS = {
+    "Windows": re.compile(r"Windows NT ([\d.]+)"),
+    "macOS": re.compile(r"Mac OS X ([\d_.]+)"),
+    "Android": re.compile(r"Android ([\d.]+)"),
+    "iOS": re.compile(r"OS ([\d_]+) like Mac OS X"),
+}
+_ANDROID_MODEL = re.compile(r"Android [\d.]+; ([^;)]+)\)")
+
+
+class HeaderProfile(NamedTuple):
+    """
+    An internally consistent set of request headers for one user agent and language.
+    """
+    index: int
+    user_agent: str
+    headers: Dict[str, str]
+    engine: str = "chromium"
+
+
+def detect_platform(user_agent: str) -> str:
+    """
+    Returns the client hint platform name for a user agent.
+
+    Args:
+        user_agent (str): The user agent string.
+
+    Returns:
+        str: One of "Windows", "macOS", "Android", "iOS", "Linux" or "Unknown".
+    """
+    if "iPhone" in user_agent or "iPad" in user_agent:
+        return "iOS"
+    if "Android" in user_agent:
+        return "Android"
+    if "Windows" in user_agent:
+        return "Windows"
+    if "Macintosh" in user_agent:
+        return "macOS"
+    if "Linux" in user_agent:
+        return "Linux"
+    return "Unknown"
+
+
+def detect_engine(user_agent: str, platform: str) -> str:
+    """
+    Returns the rendering engine family that decides which Accept and client hint headers a browser sends.
+
+    Every browser on iOS is WebKit, whatever its brand.
+
+    Args:
+        user_agent (str): The user agent string.
+        platform (str): The platform returned by detect_platform.
+
+    Returns:
+        str: One of "chromium", "firefox" or "webkit".
+    """
+    if platform == "iOS":
+        return "webkit"
+    if "Firefox/" in user_agent:
+        return "firefox"
+    if "Chrome/" in user_agent:
+        return "chromium"
+    return "webkit"
+
+
+def chromium_brands(user_agent: str) -> List[Tuple[str, str]]:
+    """
+    Returns the client hint brands and full versions a Chromium-based browser with the given user agent reports.
+
+    Args:
+        user_agent (str): A Chromium-based user agent string.
+
+    Returns:
+        List[Tuple[str, str]]: (brand, full version) pairs, in the order Chrome sends them.
+    """
+    chrome_version = _CHROME_VERSION.search(user_agent)
+    edge_version = _EDGE_VERSION.search(user_agent)
+    version = "".join(chrome_version.groups()) if chrome_version else "121.0.0.0"
+    brands = [("Chromium", version), ("Not(A:Brand", "24.0.0.0")]
+    if edge_version:
+        brands.append(("Microsoft Edge", "".join(edge_version.groups())))
+    else:
+        brands.append(("Google Chrome", version))
+    return brands
+
+
+def user_agent_metadata(user_agent: str) -> Dict[str, Any]:
+    """
+    Builds the CDP UserAgentMetadata matching a Chromium-based user agent, so the client hints Chrome sends agree with
+    an overridden User-Agent header.
+
+    Args:
+        user_agent (str): A Chromium-based user agent string.
+
+    Returns:
+        Dict[str, Any]: The metadata for Network.setUserAgentOverride.
+    """
+    platform = detect_platform(user_agent)
+    platform_version = _PLATFORM_VERSIONS.get(platform)
+    platform_match = platform_version.search(user_agent) if platform_version else None
+    model = _ANDROID_MODEL.search(user_agent) if platform == "Android" else None
+    brands = chromium_brands(user_agent)
+    return {
+        "brands": [{"brand": brand, "version": version.split(".")[0]} for brand, version in brands],
+        "fullVersionList": [{"brand": brand, "version": version} for brand, version in brands],
+        "fullVersion": brands[0][1],
+        "platform": platform,
+        "platformVersion": platform_match.group(1).replace("_", ".") if platform_match else "",
+        "architecture": "arm" if platform in ("Android", "iOS") else "x86",
+        "model": model.group(1).strip() if model else "",
+        "mobile": platform in ("Android", "iOS") or "Mobile" in user_agent,
+    }
+
+
+def build_headers(user_agent: str, accept_language: str) -> Dict[str, str]:
+    """
+    Builds the static headers a real browser with the given user agent would send on a top-level navigation.
+
+    Chromium client hints (sec-ch-ua*) are only added for Chromium-based user agents, with brands and version taken from
+    the user agent itself.
+
+    Args:
+        user_agent (str): The user agent string.
+        accept_language (str): The Accept-Language value.
+
+    Returns:
+        Dict[str, str]: The headers.
+    """
+    platform = detect_platform(user_agent)
+    engine = detect_engine(user_agent, platform)
+    mobile = platform in ("Android", "iOS") or "Mobile" in user_agent
+
+    headers = {
+        "User-Agent": user_agent,
+        "Accept": ACCEPT_BY_ENGINE[engine],
+        "Accept-Language": accept_language,
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Upgrade-Insecure-Requests": "1",
+    }
+
+    if engine == "chromium":
+        brands = ", ".join(f'"{brand}";v="{version.split(".")[0]}"' for brand, version in chromium_brands(user_agent))
+        headers.update({
+            "sec-ch-ua": brands,
+            "sec-ch-ua-mobile": "?1" if mobile else "?0",
+            "sec-ch-ua-platform": f'"{platform}"',
+        })
+
+    headers.update({
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+    })
+    return headers
+
+
+class HeaderProfileFactory:
+    """
+    Precomputes a table of coherent header profiles, one per (user agent, Accept-Language) pair, and serves them by
+    index.
+
+    Per request only the Referer (with the matching Sec-Fetch-Site) and Cache-Control are jittered, so generating
+    headers costs one dict copy and a few random draws.
+    """
+
+    def __init__(
+        self,
+        corpus: Optional[UserAgentCorpus] = None,
+        accept_languages: Sequence[str] = ACCEPT_LANGUAGES,
+        referer_urls: Sequence[str] = REFERER_URLS,
+        weighted: bool = False,
+    ) -> None:
+        """
+        Initialise the HeaderProfileFactory and build the profile table.
+
+        Args:
+            corpus (UserAgentCorpus, optional): The user agents to build profiles for. Defaults to the shared corpus.
+            accept_languages (Sequence[str], optional): The Accept-Language values to combine with each user agent.
+            referer_urls (Sequence[str], optional): The referers used for jitter.
+            weighted (bool, optional): Whether to draw user agents by browser market share. Defaults to False.
+        """
+        self.corpus = corpus if corpus is not None else get_user_agent_corpus()
+        self.accept_languages = tuple(accept_languages)
+        self.referer_urls = tuple(referer_urls)
+        self.weighted = weighted
+
+        self.profiles = tuple(
+            HeaderProfile(
+                index=ua_index * len(self.accept_languages) + language_index,
+                user_agent=user_agent,
+                headers=build_headers(user_agent, accept_language),
+                engine=detect_engine(user_agent, detect_platform(user_agent)),
+            )
+            for ua_index, user_agent in enumerate(self.corpus.user_agents)
+            for language_index, accept_language in enumerate(self.accept_languages)
+        )
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def random_profile(self, weighted: Optional[bool] = None, engine: Optional[str] = None) -> HeaderProfile:
+        """
+        Returns a random profile from the table.
+
+        Args:
+            weighted (bool, optional): Whether to draw the user agent by browser market share.
+                Defaults to the factory setting.
+            engine (str, optional): Only draw profiles of this engine, e.g. "chromium". Defaults to any engine.
+
+        Returns:
+            HeaderProfile: The profile.
+
+        Raises:
+            ValueError: If no profile has the requested engine.
+        """
+        weighted = self.weighted if weighted is None else weighted
+        language_index = int(random.random() * len(self.accept_languages))
+        if engine is None:
+            ua_index = self.corpus.random_index(weighted=weighted)
+            return self.profiles[ua_index * len(self.accept_languages) + language_index]
+
+        # Rejection sampling keeps the market share weighting; fall back to a uniform pick for rare engines
+        for _ in range(32):
+            profile = self.profiles[self.corpus.random_index(weighted=weighted) * len(self.accept_languages)
+                                    + language_index]
+            if profile.engine == engine:
+                return profile
+        matching = [profile for profile in self.profiles if profile.engine == engine]
+        if not matching:
+            raise ValueError(f"No {engine} user agents in the corpus.")
+        return random.choice(matching)
+
+    def headers(self, index: Optional[int] = None) -> Dict[str, str]:
+        """
+        Returns a fresh, jittered copy of a profile's headers.
+
+        Args:
+            index (int, optional): The profile index. Defaults to a random profile.
+
+        Returns:
+            Dict[str, str]: The request headers.
+        """
+        profile = self.profiles[index] if index is not None else self.random_profile()
+        headers = dict(profile.headers)
+
+        jitter = random.random()
+        if jitter < 0.6:
+            headers["Referer"] = self.referer_urls[int(jitter / 0.6 * len(self.referer_urls))]
+            headers["Sec-Fetch-Site"] = "cross-site"
+        if jitter > 0.7:
+            headers["Cache-Control"] = "max-age=0"
+        return headers
+
+
+_factory: Optional[HeaderProfileFactory] = None
+_factory_lock = threading.Lock()
+
+
+def get_header_profile_factory() -> HeaderProfileFactory:
+    """
+    Returns the process-wide HeaderProfileFactory, building the profile table on first use.
+
+    Returns:
+        HeaderProfileFactory: The shared factory.
+    """
+    global _factory
+    if _factory is None:
+        with _factory_lock:
+            if _factory is None:
+                _factory = HeaderProfileFactory()
+    return _factory
@@ -1,7 +1,17 @@
 import random
 from typing import Dict
 
-from fake_useragent import UserAgent
+from orb.common.user_agents.corpus import (BROWSER_MARKET_SHARE,
+                                           UserAgentCorpus,
+                                           get_user_agent_corpus)
+from orb.common.user_agents.header_profiles import get_header_profile_factory
+
+__all__ = [
+    "BROWSER_MARKET_SHARE",
+    "GetUserAgent",
+    "UserAgentCorpus",
+    "get_user_agent_corpus",
+]
 
 
 class GetUserAgent:
@@ -9,31 +19,22 @@ class GetUserAgent:
     A class for retrieving random User-Agent headers for web scraping.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, weighted: bool = False) -> None:
         """
         Initializes the GetUserAgent object.
-        Sets up the UserAgent instance.
+        Uses the shared user agent corpus and header profile table rather than rebuilding them per instance.
+
+        Args:
+            weighted (bool, optional): Whether to weight user agents by browser market share. Defaults to False.
         """
-        self.user_agent = UserAgent()
-        self.accept_languages = ["en-US", "en-GB", "fr-FR", "es-ES"]
-        self.referer_urls = [
-            "https://www.google.com",
-            "https://www.bing.com",
-            "https://search.yahoo.com",
-            "https://en.wikipedia.org",
-            "https://www.reddit.com",
-            "https://twitter.com",
-            "https://www.facebook.com",
-            "https://www.youtube.com",
-            "https://www.amazon.com",
-            "https://www.cnn.com",
-            "https://www.bbc.com",
-            "https://www.reuters.com",
-        ]
+        self.user_agent = get_user_agent_corpus()
+        self.header_profiles = get_header_profile_factory()
+        self.weighted = weighted
+        self.referer_urls = self.header_profiles.referer_urls
 
     def get_random_referer(self) -> str:
         """
-        Returns a random referer URL.
+        Returns a random referer URL from the ones the header profiles jitter with.
 
         Returns:
             str: A randomly chosen referer URL.
@@ -41,22 +42,12 @@ class GetUserAgent:
         return random.choice(self.referer_urls)
 
     @property
-    def headers_dict(self) -> Dict[str, "UserAgent"]:
+    def headers_dict(self) -> Dict[str, str]:
         """
-        Returns a dictionary containing the User-Agent header.
+        Returns a dictionary of request headers drawn from a random, internally consistent header profile.
 
         Returns:
-            dict: A dictionary with the 'User-Agent' key, random user agent, and a randomly chosen referer URL.
+            dict: A dictionary with the 'User-Agent' key, a random user agent and headers that match it.
         """
-        return {
-            "User-Agent": self.user_agent.random,
-            "Accept-Language": random.choice(self.accept_languages),
-            "Referer": self.get_random_referer(),
-            "Cache-Control": "max-age=0" if random.random() < 0.5 else "no-cache",
-            "Upgrade-Insecure-Requests": "1" if random.random() < 0.5 else "0",
-            "DNT": "1" if random.random() < 0.3 else "0",
-            "X-Forwarded-For": ".".join(str(random.randint(0, 255)) for _ in range(4)),
-            "X-Requested-With": "XMLHttpRequest" if random.random() < 0.5 else "",
-            "X-Frame-Options": "DENY" if random.random() < 0.5 else "SAMEORIGIN",
-            "Connection": "keep-alive" if random.random() < 0.8 else "close",
-        }
+        profile = self.header_profiles.random_profile(weighted=self.weighted)
+        return self.header_profiles.headers(index=profile.index)
@@ -1,5 +1,13 @@
 from .pia import PiaVpn
+from .rotator import FakeRotator, IpRotator, NoOpRotator, PiaRotator, ProxyPoolRotator
+from .scheduler import RegionScheduler
 
 __all__ = [
-    PiaVpn,
+    "FakeRotator",
+    "IpRotator",
+    "NoOpRotator",
+    "PiaRotator",
+    "PiaVpn",
+    "ProxyPoolRotator",
+    "RegionScheduler",
 ]
@@ -1,11 +1,14 @@
+import asyncio
 import logging
-import random
 import subprocess
+import threading
 import time
 from sys import platform
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-from orb.utils.decorators import retry_on_failure, timeout
+from orb.common.vpn.scheduler import RegionScheduler
+from orb.utils.decorators import (TimeoutError, remaining, retry_on_failure,
+                                  timeout)
 
 log = logging.getLogger(__name__)
 
@@ -18,19 +21,114 @@ class VPNConnectionError(Exception):
         super().__init__(message)
 
 
+# Transient failures worth retrying; bad input such as an unknown region (ValueError) is raised straight away.
+# A timed-out connect or disconnect is not retried, as its abandoned thread may still be driving piactl
+RETRYABLE_ERRORS = (VPNConnectionError,)
+# Waiting only polls the connection state, so a timed-out wait can safely be retried
+WAIT_RETRYABLE_ERRORS = (VPNConnectionError, TimeoutError)
+
+# Seconds between `piactl get connectionstate` calls when not in monitor mode
+POLL_INTERVAL = 1
+
+
+class TtlCache:
+    """
+    A small thread-safe cache of values that expire after a per-key time to live.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl: float, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value for a key, computing and caching it if missing or expired.
+
+        Args:
+            key (str): The cache key.
+            ttl (float): Seconds the computed value stays valid.
+            compute (Callable[[], Any]): Produces the value on a miss.
+
+        Returns:
+            Any: The cached or computed value.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        value = compute()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+        return value
+
+    def invalidate(self, *keys: str) -> None:
+        """
+        Drops cached values.
+
+        Args:
+            *keys (str): The keys to drop. Defaults to every key.
+        """
+        with self._lock:
+            if not keys:
+                self._entries.clear()
+            for key in keys:
+                self._entries.pop(key, None)
+
+
 class PiaVpn:
     """
     A class for interacting with Private Internet Access (PIA) VPN.
     Assumes the PIA executable is installed on the user's system and the user has valid credentials and is logged in.
+
+    In monitor mode one long-lived `piactl monitor connectionstate` process streams state changes, so status checks
+    need no subprocess and waiters are woken as soon as the state changes instead of polling every second.
+
+    The region list, current region and IP addresses are cached for a few seconds (the region list for an hour) and
+    dropped whenever the connection changes through connect, disconnect, set_region or a monitored state change.
     """
 
-    def __init__(self, executable_path: Optional[str] = None) -> None:
+    REGIONS_TTL = 3600
+    REGION_TTL = 30
+    IP_TTL = 30
+
+    # Cached values that depend on the current connection
+    CONNECTION_KEYS = ("region", "vpnip", "pubip")
+
+    def __init__(
+        self,
+        executable_path: Optional[str] = None,
+        monitor: bool = False,
+        scheduler: Optional[RegionScheduler] = None,
+    ) -> None:
         """
         Initialize the PiaVpn class.
 
         Sets the default piapath based on the operating system.
+
+        Args:
+            executable_path (str, optional): Path to the piactl executable. Defaults to the platform's install path.
+            monitor (bool, optional): Whether to start monitor mode straight away. Defaults to False.
+            scheduler (RegionScheduler, optional): Picks regions for rotation and decides when to rotate.
+                Defaults to a RegionScheduler without proactive rotation.
         """
         self.__init_executable_path(executable_path=executable_path)
+        self.scheduler = scheduler or RegionScheduler()
+
+        self._state: Optional[str] = None
+        self._state_condition = threading.Condition()
+        self._async_waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._monitor_process: Optional[subprocess.Popen] = None
+        self._monitor_thread: Optional[threading.Thread] = None
+        self.cache = TtlCache()
+
+        if monitor:
+            self.start_monitor()
+
+    def __enter__(self) -> 'PiaVpn':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop_monitor()
 
     def __init_executable_path(self, executable_path: str):
         if executable_path:
@@ -43,6 +141,176 @@ class PiaVpn:
             log.error("Unsupported operating system. PIA executable path not set.")
             raise VPNConnectionError("Unsupported operating system for PIA VPN.")
 
+    def _piactl(self, *args: str) -> str:
+        """
+        Runs a piactl command and returns its output.
+
+        The command is given the time left before the active deadline, so it is killed rather than left running when
+        an enclosing `timeout` gives up on it.
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails.
+            TimeoutError: If the deadline passes before the command finishes.
+        """
+        left = remaining()
+        try:
+            return subprocess.check_output(
+                [self.piapath, *args], text=True, timeout=None if left is None else max(left, 0)
+            ).strip()
+        except subprocess.TimeoutExpired as e:
+            raise TimeoutError(f"piactl {' '.join(args)} did not finish before the deadline.") from e
+
+    @property
+    def monitoring(self) -> bool:
+        """
+        Whether monitor mode is running and has reported a state.
+
+        Returns:
+            bool: True if connection states are streamed from the monitor process.
+        """
+        return self._monitor_process is not None and self._state is not None
+
+    def start_monitor(self) -> 'PiaVpn':
+        """
+        Starts monitor mode, waiting briefly for the monitor to report the current state.
+
+        Returns:
+            PiaVpn: The PiaVpn instance for method chaining.
+
+        Raises:
+            VPNConnectionError: If the monitor process cannot be started.
+        """
+        if self._monitor_process is not None:
+            return self
+        try:
+            process = subprocess.Popen(
+                [self.piapath, "monitor", "connectionstate"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as e:
+            log.error(f"Failed to start VPN monitor: {e}")
+            raise VPNConnectionError("Failed to start VPN monitor.") from e
+
+        self._monitor_process = process
+        self._monitor_thread = threading.Thread(target=self._read_monitor, args=(process,), daemon=True)
+        self._monitor_thread.start()
+        with self._state_condition:
+            self._state_condition.wait_for(lambda: self._state is not None or self._monitor_process is None, 5)
+        return self
+
+    def stop_monitor(self) -> None:
+        """
+        Stops monitor mode; status checks fall back to polling piactl.
+        """
+        process = self._monitor_process
+        if process is None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        if self._monitor_thread:
+            self._monitor_thread.join(timeout=5)
+
+    def _read_monitor(self, process: subprocess.Popen) -> None:
+        for line in process.stdout:
+            state = line.strip()
+            if state:
+                self._set_state(state)
+        log.debug("VPN monitor stopped.")
+        with self._state_condition:
+            if self._monitor_process is process:
+                self._monitor_process = None
+                self._state = None
+            self._state_condition.notify_all()
+        self._notify_async_waiters()
+
+    def _set_state(self, state: str) -> None:
+        with self._state_condition:
+            if state != self._state:
+                log.debug(f"VPN connection state changed to {state}.")
+                self.cache.invalidate(*self.CONNECTION_KEYS)
+            self._state = state
+            self._state_condition.notify_all()
+        self._notify_async_waiters()
+
+    def _notify_async_waiters(self) -> None:
+        for loop, event in list(self._async_waiters):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(event.set)
+
+    def wait_for_state(self, state: str = "Connected", timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the VPN reaches a connection state.
+
+        In monitor mode the caller is woken as soon as the state changes; otherwise piactl is polled.
+
+        Args:
+            state (str, optional): The state to wait for. Defaults to "Connected".
+            timeout (float, optional): Seconds to wait. Defaults to waiting forever.
+
+        Returns:
+            bool: True if the state was reached, False on timeout.
+        """
+        deadline_at = None if timeout is None else time.monotonic() + timeout
+
+        def left() -> Optional[float]:
+            return None if deadline_at is None else deadline_at - time.monotonic()
+
+        with self._state_condition:
+            while self.monitoring:
+                if self._state == state:
+                    return True
+                if left() is not None and left() <= 0:
+                    return False
+                self._state_condition.wait(left())
+
+        while self.vpn_status() != state:
+            if left() is not None and left() <= 0:
+                return False
+            time.sleep(POLL_INTERVAL if left() is None else max(min(POLL_INTERVAL, left()), 0))
+        return True
+
+    async def async_wait_for_state(self, state: str = "Connected", timeout: Optional[float] = None) -> bool:
+        """
+        Waits on the running event loop until the VPN reaches a connection state.
+
+        Args:
+            state (str, optional): The state to wait for. Defaults to "Connected".
+            timeout (float, optional): Seconds to wait. Defaults to waiting forever.
+
+        Returns:
+            bool: True if the state was reached, False on timeout.
+        """
+        if not self.monitoring:
+            return await asyncio.to_thread(self.wait_for_state, state, timeout)
+
+        event = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), event)
+        self._async_waiters.add(waiter)
+        deadline_at = None if timeout is None else time.monotonic() + timeout
+        try:
+            while self.monitoring and self._state != state:
+                event.clear()
+                left = None if deadline_at is None else deadline_at - time.monotonic()
+                if left is not None and left <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(event.wait(), left)
+                except asyncio.TimeoutError:
+                    return False
+        finally:
+            self._async_waiters.discard(waiter)
+
+        if self._state == state:
+            return True
+        left = None if deadline_at is None else max(deadline_at - time.monotonic(), 0)
+        return await asyncio.to_thread(self.wait_for_state, state, left)
+
     @property
     def get_current_region(self) -> str:
         """
@@ -59,9 +327,7 @@ class PiaVpn:
                 log.debug("VPN is not connected. Connecting to random region")
                 self.connect()
                 self._wait_for_connect()
-            command = [self.piapath, "get", "region"]
-            output = subprocess.check_output(command, text=True).strip()
-            return output
+            return self.cache.get("region", self.REGION_TTL, lambda: self._piactl("get", "region"))
         except subprocess.CalledProcessError as e:
             log.error(f"Failed to get current VPN region: {e}")
             raise VPNConnectionError("Failed to get current VPN region.") from e
@@ -75,9 +341,8 @@ class PiaVpn:
             List[str]: A list of available regions.
         """
         try:
-            command = [self.piapath, "get", "regions"]
-            output = subprocess.check_output(command, text=True).strip()
-            return output.splitlines()
+            regions = self.cache.get("regions", self.REGIONS_TTL, lambda: self._piactl("get", "regions").splitlines())
+            return list(regions)
         except subprocess.CalledProcessError as e:
             log.error(f"Failed to get available VPN regions: {e}")
             raise VPNConnectionError("Failed to get available VPN regions.") from e
@@ -107,13 +372,15 @@ class PiaVpn:
                     raise ValueError("Server region provided does not exist.")
                 server = region
             else:
-                server = random.choice(available_regions)
+                server = self.scheduler.choose(available_regions, current=self.get_current_region)
 
             log.info(f"Setting VPN to {server} server.")
-            command = [self.piapath, "set", "region", server]
-            subprocess.check_output(command, text=True).strip()
+            start = time.monotonic()
+            self._piactl("set", "region", server)
+            self.cache.invalidate(*self.CONNECTION_KEYS)
 
             self._wait_for_connect()
+            self.scheduler.record_connect(server, time.monotonic() - start)
             log.info(f"VPN region successfully set to {server}.")
 
         except subprocess.CalledProcessError as e:
@@ -135,9 +402,12 @@ class PiaVpn:
         Raises:
             VPNConnectionError: If the VPN command fails.
         """
+        if self.monitoring:
+            output = self._state
+            return output == "Connected" if as_bool else output
+
         try:
-            command = [self.piapath, "get", "connectionstate"]
-            output = subprocess.check_output(command, text=True).strip()
+            output = self._piactl("get", "connectionstate")
 
             if as_bool:
                 return output == "Connected"
@@ -158,9 +428,7 @@ class PiaVpn:
             VPNConnectionError: If the VPN command fails.
         """
         try:
-            command = [self.piapath, "get", "vpnip"]
-            output = subprocess.check_output(command, text=True).strip()
-            return output
+            return self.cache.get("vpnip", self.IP_TTL, lambda: self._piactl("get", "vpnip"))
         except subprocess.CalledProcessError as e:
             log.error(f"Failed to get VPN IP address: {e}")
             raise VPNConnectionError("Failed to get VPN IP address.") from e
@@ -177,34 +445,35 @@ class PiaVpn:
             VPNConnectionError: If the VPN command fails.
         """
         try:
-            command = [self.piapath, "get", "pubip"]
-            output = subprocess.check_output(command, text=True).strip()
-            return output
+            return self.cache.get("pubip", self.IP_TTL, lambda: self._piactl("get", "pubip"))
         except subprocess.CalledProcessError as e:
             log.error(f"Failed to get public IP address: {e}")
             raise VPNConnectionError("Failed to get public IP address.") from e
 
-    @retry_on_failure(max_retries=1)
+    @retry_on_failure(max_retries=1, retry_on=WAIT_RETRYABLE_ERRORS)
     @timeout(seconds=10)
     def _wait_for_connect(self) -> None:
         """
         Helper function that waits until the VPN status is 'Connected'.
 
+        Waiting stops as soon as the enclosing timeout's deadline passes, so an abandoned wait does not keep polling.
+
         Raises:
-            VPNConnectionError: If connection times out or fails.
+            VPNConnectionError: If connection fails.
+            TimeoutError: If the deadline passes first.
         """
         try:
-            status = self.vpn_status(as_bool=True)
-            while not status:
-                time.sleep(1)
-                status = self.vpn_status(as_bool=True)
+            if not self.wait_for_state("Connected", timeout=remaining()):
+                raise TimeoutError("Timed out waiting for the VPN to connect.")
+            # Values read while connecting, such as an "Unknown" VPN IP, are stale now
+            self.cache.invalidate(*self.CONNECTION_KEYS)
         except VPNConnectionError as e:
             log.error(f"Failed to connect to VPN: {e}")
             raise
 
     def rotate_vpn(self):
         """
-        Rotate the VPN to a random region.
+        Rotate the VPN to a region picked by the region scheduler.
         """
         try:
             current_region = self.get_current_region
@@ -220,7 +489,30 @@ class PiaVpn:
             log.error(f"Failed to rotate VPN: {e}")
             raise
 
-    @retry_on_failure(max_retries=2)
+    def record_request(self, bytes_transferred: Optional[int] = None, seconds: Optional[float] = None) -> None:
+        """
+        Records a request made through the VPN, feeding the scheduler's throughput and proactive rotation counters.
+
+        Args:
+            bytes_transferred (int, optional): The bytes received.
+            seconds (float, optional): The time the transfer took.
+        """
+        self.scheduler.record_request(bytes_transferred=bytes_transferred, seconds=seconds)
+
+    def maybe_rotate(self) -> bool:
+        """
+        Rotates the VPN if the scheduler's request or time allowance for the current region is used up. Call it
+        between tasks so rotation never interrupts one.
+
+        Returns:
+            bool: True if the VPN was rotated.
+        """
+        if not self.scheduler.should_rotate():
+            return False
+        self.rotate_vpn()
+        return True
+
+    @retry_on_failure(max_retries=2, retry_on=RETRYABLE_ERRORS)
     @timeout(seconds=10)
     def connect(self):
         """
@@ -234,8 +526,8 @@ class PiaVpn:
                 log.info(f"VPN server is already connected to {self.get_current_region} region")
                 return
 
-            command = [self.piapath, "connect"]
-            subprocess.check_output(command, text=True).strip()
+            self._piactl("connect")
+            self.cache.invalidate(*self.CONNECTION_KEYS)
 
             self._wait_for_connect()
 
@@ -244,7 +536,7 @@ class PiaVpn:
             log.error(f"Failed to connect to VPN: {e}")
             raise VPNConnectionError("Failed to connect to VPN.") from e
 
-    @retry_on_failure(max_retries=2)
+    @retry_on_failure(max_retries=2, retry_on=RETRYABLE_ERRORS)
     @timeout(seconds=10)
     def disconnect(self):
         """
@@ -254,8 +546,8 @@ class PiaVpn:
             VPNConnectionError: If the VPN command fails.
         """
         try:
-            command = [self.piapath, "disconnect"]
-            subprocess.check_output(command, text=True).strip()
+            self._piactl("disconnect")
+            self.cache.invalidate(*self.CONNECTION_KEYS)
             log.info("VPN has been disconnected.")
         except subprocess.CalledProcessError as e:
             log.error(f"Failed to disconnect from VPN: {e}")
@@ -0,0 +1,272 @@
+"""
+This script defines the pluggable IP rotation backends used by OrbDriver.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence
+
+from orb.common.proxies.forward_proxy import ForwardProxy
+from orb.common.proxies.proxy_pool import ProxyPool
+from orb.common.vpn.pia import PiaVpn
+
+log = logging.getLogger(__name__)
+
+
+class IpRotator(ABC):
+    """
+    Base class for anything that can change the exit IP address.
+
+    Units of work run inside `work()`. A rotation closes the gate to new work, waits for in-flight work to drain,
+    performs the switch and reopens the gate, so work only pauses around the switch itself. `rotate_async` does this
+    on a background thread and returns straight away.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialise the IpRotator.
+        """
+        self.rotations = 0
+        self._gate = threading.Condition()
+        self._in_flight = 0
+        self._switching = False
+        self._pending: Optional[Future] = None
+
+    @abstractmethod
+    def switch(self) -> None:
+        """
+        Changes the exit IP address, blocking until the new one is usable.
+        """
+
+    def should_rotate(self) -> bool:
+        """
+        Whether the backend wants a proactive rotation.
+
+        Returns:
+            bool: True if a rotation is due. Defaults to False.
+        """
+        return False
+
+    @property
+    def rotating(self) -> bool:
+        """
+        Whether a rotation is draining work or switching.
+
+        Returns:
+            bool: True while new work is held back.
+        """
+        return self._switching
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Returns the number of units of work currently running.
+
+        Returns:
+            int: The in-flight count.
+        """
+        return self._in_flight
+
+    @contextmanager
+    def work(self, timeout: Optional[float] = None) -> Iterator[None]:
+        """
+        Context manager wrapping one unit of work, such as a page load, so rotations never interrupt it.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a rotation in progress. Defaults to waiting forever.
+
+        Raises:
+            TimeoutError: If a rotation is still in progress after the timeout.
+        """
+        with self._gate:
+            if not self._gate.wait_for(lambda: not self._switching, timeout):
+                raise TimeoutError("Timed out waiting for an IP rotation to finish.")
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._gate:
+                self._in_flight -= 1
+                self._gate.notify_all()
+
+    def rotate(self, drain_timeout: Optional[float] = None) -> None:
+        """
+        Rotates the IP address: holds back new work, waits for in-flight work to finish, then switches.
+
+        Args:
+            drain_timeout (float, optional): Seconds to wait for in-flight work before switching anyway.
+                Defaults to waiting forever.
+        """
+        with self._gate:
+            self._gate.wait_for(lambda: not self._switching)
+            self._switching = True
+            if not self._gate.wait_for(lambda: self._in_flight == 0, drain_timeout):
+                log.warning(f"Rotating with {self._in_flight} units of work still in flight.")
+        try:
+            start = time.monotonic()
+            self.switch()
+            self.rotations += 1
+            log.info(f"{type(self).__name__} switched IP in {time.monotonic() - start:.2f}s.")
+        finally:
+            with self._gate:
+                self._switching = False
+                self._gate.notify_all()
+
+    def rotate_async(self, drain_timeout: Optional[float] = None) -> Future:
+        """
+        Starts a rotation on a background thread. A request made while one is pending joins it.
+
+        Args:
+            drain_timeout (float, optional): Seconds to wait for in-flight work before switching anyway.
+                Defaults to waiting forever.
+
+        Returns:
+            Future: Resolves once the switch is done, raising its error if it failed.
+        """
+        with self._gate:
+            if self._pending is not None and not self._pending.done():
+                return self._pending
+            future: Future = Future()
+            self._pending = future
+
+        def run() -> None:
+            try:
+                self.rotate(drain_timeout=drain_timeout)
+                future.set_result(None)
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"{type(self).__name__}-rotate", daemon=True).start()
+        return future
+
+    async def arotate(self, drain_timeout: Optional[float] = None) -> None:
+        """
+        Awaits a rotation from asyncio code without blocking the event loop.
+
+        Args:
+            drain_timeout (float, optional): Seconds to wait for in-flight work before switching anyway.
+                Defaults to waiting forever.
+        """
+        await asyncio.wrap_future(self.rotate_async(drain_timeout=drain_timeout))
+
+    def record_request(self, bytes_transferred: Optional[int] = None, seconds: Optional[float] = None) -> None:
+        """
+        Records a request completed through the current IP, then starts a rotation in the background if the backend
+        now wants one. Call it after leaving `work()`, never inside it.
+
+        Args:
+            bytes_transferred (int, optional): The bytes received.
+            seconds (float, optional): The time the request took.
+        """
+        self.maybe_rotate()
+
+    def maybe_rotate(self) -> Optional[Future]:
+        """
+        Starts an asynchronous rotation if the backend wants one.
+
+        Returns:
+            Optional[Future]: The rotation future, or None if no rotation is due.
+        """
+        return self.rotate_async() if self.should_rotate() else None
+
+
+class PiaRotator(IpRotator):
+    """
+    Rotates the IP address by switching the PIA VPN region.
+    """
+
+    def __init__(self, pia: Optional[PiaVpn] = None) -> None:
+        """
+        Initialise the PiaRotator.
+
+        Args:
+            pia (PiaVpn, optional): The VPN to control. Defaults to a new PiaVpn.
+        """
+        super().__init__()
+        self.pia = pia or PiaVpn()
+
+    def switch(self) -> None:
+        if self.pia.vpn_status(as_bool=True):
+            self.pia.rotate_vpn()
+        else:
+            self.pia.connect()
+
+    def should_rotate(self) -> bool:
+        return self.pia.scheduler.should_rotate()
+
+    def record_request(self, bytes_transferred: Optional[int] = None, seconds: Optional[float] = None) -> None:
+        # Feeds the region scheduler's request allowance and throughput stats before checking for a rotation
+        self.pia.record_request(bytes_transferred=bytes_transferred, seconds=seconds)
+        super().record_request(bytes_transferred=bytes_transferred, seconds=seconds)
+
+
+class ProxyPoolRotator(IpRotator):
+    """
+    Rotates the IP address by moving a local ForwardProxy onto a new upstream proxy.
+    """
+
+    def __init__(self, forward_proxy: ForwardProxy, pool: Optional[ProxyPool] = None) -> None:
+        """
+        Initialise the ProxyPoolRotator.
+
+        Args:
+            forward_proxy (ForwardProxy): The forward proxy clients are pointed at.
+            pool (ProxyPool, optional): Where new upstreams come from when the forward proxy has no pool of its own.
+        """
+        super().__init__()
+        self.forward_proxy = forward_proxy
+        self.pool = pool
+
+    def switch(self) -> None:
+        if self.forward_proxy.pool is not None and self.forward_proxy.upstream is None:
+            self.forward_proxy.rotate()
+        elif self.pool is not None:
+            self.forward_proxy.set_upstream(self.pool.get_address())
+        else:
+            raise RuntimeError("ProxyPoolRotator needs a pool, on the forward proxy or its own.")
+
+
+class NoOpRotator(IpRotator):
+    """
+    An IpRotator that never changes the IP address.
+    """
+
+    def switch(self) -> None:
+        log.debug("No IP rotation backend configured, keeping the current IP.")
+
+
+class FakeRotator(IpRotator):
+    """
+    An offline IpRotator for tests: cycles through fake IP addresses, taking `switch_seconds` per switch.
+    """
+
+    def __init__(self, ips: Sequence[str] = ("192.0.2.1", "192.0.2.2", "192.0.2.3"), switch_seconds: float = 0) -> None:
+        """
+        Initialise the FakeRotator.
+
+        Args:
+            ips (Sequence[str], optional): The addresses to cycle through. Defaults to three documentation addresses.
+            switch_seconds (float, optional): How long each switch blocks. Defaults to 0.
+        """
+        super().__init__()
+        self.ips = list(ips)
+        self.switch_seconds = switch_seconds
+        self.history: List[str] = [self.ips[0]]
+        self.due = False
+
+    @property
+    def current_ip(self) -> str:
+        return self.history[-1]
+
+    def switch(self) -> None:
+        time.sleep(self.switch_seconds)
+        self.history.append(self.ips[len(self.history) % len(self.ips)])
+        self.due = False
+
+    def should_rotate(self) -> bool:
+        return self.due
@@ -0,0 +1,207 @@
+"""
+This script picks VPN regions for rotation from their measured connect time and throughput.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence
+
+log = logging.getLogger(__name__)
+
+
+class RegionStats:
+    """
+    Exponentially weighted connect time and throughput of one VPN region.
+    """
+
+    def __init__(self, alpha: float = 0.3) -> None:
+        """
+        Initialise the RegionStats.
+
+        Args:
+            alpha (float, optional): Weight of the newest sample in the moving averages. Defaults to 0.3.
+        """
+        self.alpha = alpha
+        self.connect_time: Optional[float] = None
+        self.throughput: Optional[float] = None
+        self.uses = 0
+        self.last_used: Optional[float] = None
+
+    def _ewma(self, current: Optional[float], sample: float) -> float:
+        return sample if current is None else self.alpha * sample + (1 - self.alpha) * current
+
+    def record_connect(self, seconds: float) -> None:
+        self.connect_time = self._ewma(self.connect_time, seconds)
+
+    def record_throughput(self, bytes_per_second: float) -> None:
+        self.throughput = self._ewma(self.throughput, bytes_per_second)
+
+
+class RegionScheduler:
+    """
+    Chooses the next VPN region, preferring fast regions while spreading load across them.
+
+    The current region and the `recent` regions used before it are never picked again while alternatives exist, nor
+    is any region used within the last `cooldown` seconds. The remaining regions are drawn at random weighted by the
+    inverse of their connect time and by their relative throughput; regions without measurements get the average
+    weight so they are still explored.
+
+    It also decides when to rotate proactively, after `rotate_after_requests` requests or `rotate_after_seconds`
+    seconds on one region, so callers can rotate between tasks rather than after being blocked.
+    """
+
+    def __init__(
+        self,
+        recent: int = 3,
+        cooldown: float = 600,
+        rotate_after_requests: Optional[int] = None,
+        rotate_after_seconds: Optional[float] = None,
+        alpha: float = 0.3,
+    ) -> None:
+        """
+        Initialise the RegionScheduler.
+
+        Args:
+            recent (int, optional): Number of previously used regions to avoid. Defaults to 3.
+            cooldown (float, optional): Seconds a used region is avoided for. Defaults to 600.
+            rotate_after_requests (int, optional): Requests on one region before rotating. Defaults to None, never.
+            rotate_after_seconds (float, optional): Seconds on one region before rotating. Defaults to None, never.
+            alpha (float, optional): Weight of the newest sample in the moving averages. Defaults to 0.3.
+        """
+        self.recent = recent
+        self.cooldown = cooldown
+        self.rotate_after_requests = rotate_after_requests
+        self.rotate_after_seconds = rotate_after_seconds
+        self.alpha = alpha
+
+        self.current: Optional[str] = None
+        self.requests = 0
+        self._stats: Dict[str, RegionStats] = {}
+        self._history: Deque[str] = deque(maxlen=max(recent, 1))
+        self._since = time.monotonic()
+        self._lock = threading.Lock()
+
+    def stats(self, region: str) -> RegionStats:
+        """
+        Returns the statistics of a region, creating them if needed.
+
+        Args:
+            region (str): The region name.
+
+        Returns:
+            RegionStats: The region's statistics.
+        """
+        with self._lock:
+            return self._stats.setdefault(region, RegionStats(alpha=self.alpha))
+
+    def record_connect(self, region: str, seconds: float) -> None:
+        """
+        Records how long switching to a region took and makes it the current region.
+
+        Args:
+            region (str): The region connected to.
+            seconds (float): Seconds from the switch command until connected.
+        """
+        stats = self.stats(region)
+        with self._lock:
+            stats.record_connect(seconds)
+            stats.uses += 1
+            stats.last_used = time.monotonic()
+            if self.current and self.current != region:
+                self._history.append(self.current)
+            self.current = region
+            self.requests = 0
+            self._since = time.monotonic()
+
+    def record_request(self, bytes_transferred: Optional[int] = None, seconds: Optional[float] = None) -> None:
+        """
+        Records a request made through the current region, with its throughput if known.
+
+        Args:
+            bytes_transferred (int, optional): The bytes received.
+            seconds (float, optional): The time the transfer took.
+        """
+        with self._lock:
+            self.requests += 1
+            current = self.current
+        if current and bytes_transferred is not None and seconds:
+            stats = self.stats(current)
+            with self._lock:
+                stats.record_throughput(bytes_transferred / seconds)
+
+    def should_rotate(self) -> bool:
+        """
+        Whether the current region has served its request or time allowance.
+
+        Returns:
+            bool: True if a proactive rotation is due.
+        """
+        if self.rotate_after_requests is not None and self.requests >= self.rotate_after_requests:
+            return True
+        return self.rotate_after_seconds is not None and time.monotonic() - self._since >= self.rotate_after_seconds
+
+    def weight(self, region: str, default_connect_time: float, default_throughput: float) -> float:
+        """
+        Returns the selection weight of a region.
+
+        Args:
+            region (str): The region name.
+            default_connect_time (float): Connect time assumed for unmeasured regions.
+            default_throughput (float): Throughput assumed for unmeasured regions.
+
+        Returns:
+            float: The weight; higher is picked more often.
+        """
+        stats = self._stats.get(region)
+        connect_time = stats.connect_time if stats and stats.connect_time is not None else default_connect_time
+        throughput = stats.throughput if stats and stats.throughput is not None else default_throughput
+        return (throughput / default_throughput) / max(connect_time, 0.1)
+
+    def choose(self, regions: Sequence[str], current: Optional[str] = None) -> str:
+        """
+        Picks the next region to rotate to.
+
+        Args:
+            regions (Sequence[str]): The available regions.
+            current (str, optional): The region currently connected to. Defaults to the last recorded one.
+
+        Returns:
+            str: The chosen region.
+
+        Raises:
+            ValueError: If no regions are given.
+        """
+        if not regions:
+            raise ValueError("No regions to choose from.")
+        current = current or self.current
+        now = time.monotonic()
+
+        with self._lock:
+            recent = set(list(self._history)[-self.recent:]) if self.recent else set()
+            cooling = {
+                region for region, stats in self._stats.items()
+                if stats.last_used is not None and now - stats.last_used < self.cooldown
+            }
+            candidates = [region for region in regions if region != current and region not in recent | cooling]
+            if not candidates:
+                # Everything was used lately: fall back to the least recently used regions other than the current one
+                others = [region for region in regions if region != current] or list(regions)
+                oldest = min(self._last_used(region) for region in others)
+                candidates = [region for region in others if self._last_used(region) == oldest]
+
+            connect_times = [s.connect_time for s in self._stats.values() if s.connect_time is not None]
+            throughputs = [s.throughput for s in self._stats.values() if s.throughput is not None]
+            default_connect_time = sum(connect_times) / len(connect_times) if connect_times else 1.0
+            default_throughput = sum(throughputs) / len(throughputs) if throughputs else 1.0
+            weights = [self.weight(region, default_connect_time, default_throughput) for region in candidates]
+
+        chosen = random.choices(candidates, weights=weights)[0]
+        log.debug(f"Region scheduler chose {chosen} from {len(candidates)} candidates.")
+        return chosen
+
+    def _last_used(self, region: str) -> float:
+        stats = self._stats.get(region)
+        return stats.last_used if stats and stats.last_used is not None else float("-inf")
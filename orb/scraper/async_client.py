@@ -0,0 +1,250 @@
+"""
+This script provides an asyncio counterpart to spoof_request for fanning out many requests from one process.
+
+Requires the optional aiohttp dependency: `poetry install --extras async`.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import (AsyncIterator, Dict, Iterable, NamedTuple, Optional,
+                    Tuple, Union)
+from urllib.parse import urlsplit
+
+from orb.common.proxies.get_proxies import GetProxies
+from orb.common.user_agents.user_agents import GetUserAgent
+from orb.scraper.utils import PROXY_FAILURE_STATUS_CODES
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+log = logging.getLogger(__name__)
+
+
+class AsyncSpoofResponse(NamedTuple):
+    """
+    A fully read response returned by the async client.
+    """
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    elapsed: float
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+
+class AsyncSpoofClient:
+    """
+    An aiohttp-based client that sends spoofed requests with bounded global and per-host concurrency.
+
+    Proxies and user agents are picked exactly as in spoof_request, and proxy outcomes update the shared proxy pool's
+    health records. Use it as an async context manager so the underlying connection pool is closed.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 100,
+        per_host: int = 10,
+        timeout: float = 10,
+        use_proxies: bool = True,
+        use_user_agent: bool = True,
+    ) -> None:
+        """
+        Initialise the AsyncSpoofClient.
+
+        Args:
+            concurrency (int, optional): Maximum requests in flight overall. Defaults to 100.
+            per_host (int, optional): Maximum requests in flight per host. Defaults to 10.
+            timeout (float, optional): Total timeout per request in seconds. Defaults to 10.
+            use_proxies (bool, optional): Whether to use proxies. Defaults to True.
+            use_user_agent (bool, optional): Whether to use a random user agent. Defaults to True.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncSpoofClient requires aiohttp: install orb with the 'async' extra.")
+
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.use_proxies = use_proxies
+        self.use_user_agent = use_user_agent
+
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._global_limit = asyncio.Semaphore(concurrency)
+        # Per-host semaphores exist only while their host has requests waiting or in flight
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._host_users: Counter = Counter()
+
+    async def __aenter__(self) -> 'AsyncSpoofClient':
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the underlying aiohttp session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @asynccontextmanager
+    async def _host_slot(self, host: str) -> AsyncIterator[None]:
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        self._host_users[host] += 1
+        try:
+            async with self._host_limits[host]:
+                yield
+        finally:
+            self._host_users[host] -= 1
+            if not self._host_users[host]:
+                del self._host_users[host]
+                del self._host_limits[host]
+
+    async def get(self, url: str) -> AsyncSpoofResponse:
+        """
+        Sends a spoofed GET request, waiting for a free per-host and global slot first.
+
+        Args:
+            url (str): The URL to send the request to.
+
+        Returns:
+            AsyncSpoofResponse: The fully read response.
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncSpoofClient must be used as an async context manager.")
+
+        headers = GetUserAgent().headers_dict if self.use_user_agent else None
+        pool = GetProxies.proxy_pool() if self.use_proxies else None
+        if pool and not len(pool):
+            # Only the very first fetch blocks, so keep it off the event loop
+            await asyncio.to_thread(pool.fill)
+        address = pool.get_address() if pool else None
+
+        async with self._host_slot(urlsplit(url).netloc), self._global_limit:
+            start = time.perf_counter()
+            try:
+                async with self._session.get(
+                    url,
+                    headers=headers,
+                    proxy=f"http://{address}" if address else None,
+                ) as response:
+                    content = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if pool:
+                    pool.record_failure(address)
+                raise
+            elapsed = time.perf_counter() - start
+
+        if pool:
+            if response.status in PROXY_FAILURE_STATUS_CODES:
+                pool.record_failure(address)
+            else:
+                pool.record_success(address, elapsed)
+
+        return AsyncSpoofResponse(
+            url=url,
+            status_code=response.status,
+            headers=dict(response.headers),
+            content=content,
+            elapsed=elapsed,
+        )
+
+
+async def aspoof_request(
+    url: str,
+    use_proxies: bool = True,
+    use_user_agent: bool = True,
+    client: Optional[AsyncSpoofClient] = None,
+) -> AsyncSpoofResponse:
+    """
+    Send an async request to a URL with a spoofed user agent and optional proxies.
+
+    Args:
+        url (str): The URL to send the request to.
+        use_proxies (bool, optional): Whether to use proxies. Defaults to True.
+        use_user_agent (bool, optional): Whether to use a random user agent. Defaults to True.
+        client (AsyncSpoofClient, optional): An open client to reuse. Defaults to a one-off client.
+
+    Returns:
+        AsyncSpoofResponse: The fully read response.
+    """
+    if client is not None:
+        return await client.get(url)
+    async with AsyncSpoofClient(use_proxies=use_proxies, use_user_agent=use_user_agent) as one_off:
+        return await one_off.get(url)
+
+
+async def gather_urls(
+    urls: Iterable[str],
+    concurrency: int = 100,
+    per_host: int = 10,
+    timeout: float = 10,
+    use_proxies: bool = True,
+    use_user_agent: bool = True,
+) -> AsyncIterator[Tuple[str, Union[AsyncSpoofResponse, Exception]]]:
+    """
+    Fetch many URLs concurrently, yielding each result as soon as it finishes.
+
+    At most `concurrency` requests are scheduled at once, so very long URL iterables are consumed lazily.
+
+    Args:
+        urls (Iterable[str]): The URLs to fetch.
+        concurrency (int, optional): Maximum requests in flight overall. Defaults to 100.
+        per_host (int, optional): Maximum requests in flight per host. Defaults to 10.
+        timeout (float, optional): Total timeout per request in seconds. Defaults to 10.
+        use_proxies (bool, optional): Whether to use proxies. Defaults to True.
+        use_user_agent (bool, optional): Whether to use a random user agent. Defaults to True.
+
+    Yields:
+        Tuple[str, Union[AsyncSpoofResponse, Exception]]: The URL and either its response or the raised exception.
+    """
+    url_iterator = iter(urls)
+    async with AsyncSpoofClient(
+        concurrency=concurrency,
+        per_host=per_host,
+        timeout=timeout,
+        use_proxies=use_proxies,
+        use_user_agent=use_user_agent,
+    ) as client:
+        in_flight: Dict[asyncio.Task, str] = {}
+
+        def schedule_next() -> None:
+            url = next(url_iterator, None)
+            if url is not None:
+                in_flight[asyncio.ensure_future(client.get(url))] = url
+
+        for _ in range(concurrency):
+            schedule_next()
+
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    url = in_flight.pop(task)
+                    schedule_next()
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        log.debug(f"Request to {url} failed: {e}")
+                        result = e
+                    yield url, result
+        finally:
+            for task in in_flight:
+                task.cancel()
@@ -0,0 +1,182 @@
+"""
+This script provides a connection-pooled session layer for spoofed requests.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+log = logging.getLogger(__name__)
+
+SessionKey = Optional[str]
+
+
+class SpoofSession:
+    """
+    A pool of keep-alive requests.Session objects keyed by proxy.
+
+    Requests through the same proxy reuse one Session, and therefore its TCP/TLS connections, instead of paying a fresh
+    handshake per URL; headers are sent per request, so any user agent can share it. Cookies are kept per Session too,
+    so they are shared by every request through a proxy; use separate SpoofSessions for isolated identities. The least
+    recently used Session is closed once `max_sessions` is exceeded.
+    """
+
+    RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+    def __init__(
+        self,
+        max_sessions: int = 32,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        retries: int = 2,
+        backoff_factor: float = 0.3,
+        timeout: Optional[float] = 10,
+    ) -> None:
+        """
+        Initialise the SpoofSession.
+
+        Args:
+            max_sessions (int, optional): Maximum number of pooled Sessions, that is proxies. Defaults to 32.
+            pool_connections (int, optional): Number of hosts whose connections each Session keeps. Defaults to 10.
+            pool_maxsize (int, optional): Maximum keep-alive connections per host within a Session. Defaults to 10.
+            retries (int, optional): Retries for connection errors and 5xx responses. Defaults to 2.
+            backoff_factor (float, optional): Exponential backoff factor between retries. Defaults to 0.3.
+            timeout (float, optional): Default request timeout in seconds. Defaults to 10.
+        """
+        self.max_sessions = max_sessions
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+
+        self._sessions: "OrderedDict[SessionKey, requests.Session]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __enter__(self) -> 'SpoofSession':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def session_key(proxies: Optional[Dict[str, str]] = None) -> SessionKey:
+        """
+        Returns the pool key for a proxy.
+
+        Args:
+            proxies (Dict[str, str], optional): The requests-style proxy dictionary.
+
+        Returns:
+            SessionKey: The proxy, or None without one.
+        """
+        return proxies.get('https') or proxies.get('http') if proxies else None
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def session_for(self, proxies: Optional[Dict[str, str]] = None) -> requests.Session:
+        """
+        Returns the pooled Session for a proxy, creating it if needed.
+
+        Args:
+            proxies (Dict[str, str], optional): The requests-style proxy dictionary.
+
+        Returns:
+            requests.Session: The pooled Session.
+        """
+        key = self.session_key(proxies=proxies)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                return session
+
+            session = self._build_session()
+            if proxies:
+                session.proxies.update(proxies)
+            self._sessions[key] = session
+
+            if len(self._sessions) > self.max_sessions:
+                _, evicted = self._sessions.popitem(last=False)
+                evicted.close()
+            return session
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Sends a GET request with the given headers through the pooled Session for the proxy.
+
+        Args:
+            url (str): The URL to send the request to.
+            headers (Dict[str, str], optional): The request headers.
+            proxies (Dict[str, str], optional): The requests-style proxy dictionary.
+            timeout (float, optional): Request timeout in seconds. Defaults to the pool timeout.
+            **kwargs: Further arguments passed to requests.Session.get.
+
+        Returns:
+            requests.Response: The response object of the request.
+        """
+        session = self.session_for(proxies=proxies)
+        return session.get(
+            url,
+            headers=headers,
+            proxies=proxies,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs,
+        )
+
+    def close(self) -> None:
+        """
+        Closes every pooled Session and its connections.
+        """
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_default_session: Optional[SpoofSession] = None
+_default_session_lock = threading.Lock()
+
+
+def get_spoof_session() -> SpoofSession:
+    """
+    Returns the process-wide SpoofSession used by spoof_request, creating it on first use.
+
+    Returns:
+        SpoofSession: The shared SpoofSession.
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = SpoofSession()
+        return _default_session
@@ -3,42 +3,102 @@ This script provides several methods for spoofing requests.
 """
 
 import logging
+import time
+from typing import Dict, Optional
 
 import requests
 
 from orb.common.proxies.get_proxies import GetProxies
 from orb.common.user_agents.user_agents import GetUserAgent
+from orb.common.vpn.rotator import IpRotator
+from orb.scraper.session import SpoofSession, get_spoof_session
 
 log = logging.getLogger(__name__)
 
+# Status codes that indicate the proxy itself is blocked or broken
+PROXY_FAILURE_STATUS_CODES = {403, 407, 429, 502, 503, 504}
+
 
 def spoof_request(
     url: str,
     use_proxies: bool = True,
-    use_user_agent: bool = True
+    use_user_agent: bool = True,
+    session: Optional[SpoofSession] = None,
+    timeout: Optional[float] = None,
+    forward_proxy: Optional[str] = None,
+    ip_rotator: Optional[IpRotator] = None,
 ) -> requests.Response:
     """
     Send a request to a URL with a spoofed user agent and optional proxies.
 
+    When proxies are used, the outcome of the request updates the health record of the chosen proxy.
+
     Args:
         url (str): The URL to send the request to.
         use_proxies (bool, optional): Whether to use proxies. Defaults to True.
         use_user_agent (bool, optional): Whether to use a random user agent. Defaults to True.
+        session (SpoofSession, optional): The connection pool to send the request through.
+            Defaults to the process-wide pool.
+        timeout (float, optional): Request timeout in seconds. Defaults to the session timeout.
+        forward_proxy (str, optional): The "host:port" address of a local ForwardProxy to send the request through.
+            The forward proxy then picks the upstream and tracks its health. Defaults to None.
+        ip_rotator (IpRotator, optional): The rotator of the IP the request goes out on, e.g. an OrbDriver's when
+            the PIA VPN carries all traffic. The request then waits out rotations, holds the next one back while in
+            flight and is recorded with the rotator. Defaults to None.
 
     Returns:
         requests.Response: The response object of the request.
     """
 
     headers = None
-    proxies = None
+    if session is None:
+        session = get_spoof_session()
 
     # Get a random user agent
     if use_user_agent:
         headers = GetUserAgent().headers_dict
 
-    # Get a random proxy
-    if use_proxies:
-        proxies = GetProxies().proxy_dict
-        log.info(f"Using proxy with HTTPS: {proxies['HTTPS']}")
+    if ip_rotator is None:
+        return _send(session, url, headers, use_proxies, forward_proxy, timeout)
+
+    with ip_rotator.work():
+        start = time.perf_counter()
+        response = _send(session, url, headers, use_proxies, forward_proxy, timeout)
+        seconds = time.perf_counter() - start
+    ip_rotator.record_request(bytes_transferred=len(response.content), seconds=seconds)
+    return response
+
+
+def _send(
+    session: SpoofSession,
+    url: str,
+    headers: Optional[Dict[str, str]],
+    use_proxies: bool,
+    forward_proxy: Optional[str],
+    timeout: Optional[float],
+) -> requests.Response:
+    # Get a health-weighted proxy from the cached pool
+    if not use_proxies:
+        return session.get(url, headers=headers, timeout=timeout)
+
+    if forward_proxy:
+        proxies = {"http": f"http://{forward_proxy}", "https": f"http://{forward_proxy}"}
+        return session.get(url, headers=headers, proxies=proxies, timeout=timeout)
+
+    pool = GetProxies.proxy_pool()
+    proxies = pool.get_proxy()
+    address = proxies['https']
+    log.info(f"Using proxy with HTTPS: {address}")
+
+    start = time.perf_counter()
+    try:
+        response = session.get(url, headers=headers, proxies=proxies, timeout=timeout)
+    except requests.exceptions.RequestException:
+        pool.record_failure(address)
+        raise
 
-    return requests.get(url, headers=headers, proxies=proxies)
+    if response.status_code in PROXY_FAILURE_STATUS_CODES:
+        pool.record_failure(address)
+    else:
+        pool.record_success(address, time.perf_counter() - start)
+    return response
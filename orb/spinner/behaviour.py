@@ -0,0 +1,332 @@
+"""
+This script provides asyncio versions of the human behaviour helpers, so one event loop can pace many browsers.
+
+Human-like delays are awaited with `asyncio.sleep` rather than blocking a thread, and WebDriver calls run on a thread
+pool, so a thread is only held for the duration of an actual command.
+"""
+
+import asyncio
+import functools
+import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Tuple, Union
+
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from orb.spinner.core.driver import OrbDriver
+from orb.spinner.trajectory import (PointerPlan, click_geometry, click_point,
+                                    viewport_size)
+from orb.spinner.utils import (BOUNDARY_KEYS, Keystroke, focus_element,
+                               keystroke_plan)
+
+log = logging.getLogger(__name__)
+
+# Keys that end a burst of typing sent as one actions payload; the pause after them is awaited on the event loop
+WORD_BOUNDARIES = set(BOUNDARY_KEYS) | {Keys.ENTER}
+
+
+class DelayBudget:
+    """
+    The total human-like delay a session may spend, in seconds.
+
+    By default the budget only keeps count: every delay is granted in full and `exhausted` tells the caller when to
+    wrap the session up. With `clamp`, delays are instead cut to what is left, so a session never idles for longer
+    than its budget; actions then still run once the budget is spent, but without pauses, which no human does.
+    """
+
+    def __init__(self, total: Optional[float] = None, clamp: bool = False) -> None:
+        """
+        Initialise the DelayBudget.
+
+        Args:
+            total (float, optional): Seconds of delay allowed. Defaults to None, no limit.
+            clamp (bool, optional): Whether to cut delays to the remaining budget. Defaults to False.
+        """
+        self.total = total
+        self.clamp = clamp
+        self.spent = 0.0
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """
+        Returns the seconds of delay left.
+
+        Returns:
+            Optional[float]: The remaining delay, or None without a limit.
+        """
+        return None if self.total is None else max(self.total - self.spent, 0.0)
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        Returns whether the budget has been spent.
+
+        Returns:
+            bool: True once the delays taken reach the total.
+        """
+        return self.remaining == 0.0
+
+    def take(self, seconds: float) -> float:
+        """
+        Spends `seconds` of the budget, or with `clamp` only up to what is left.
+
+        Args:
+            seconds (float): The delay wanted.
+
+        Returns:
+            float: The delay granted.
+        """
+        granted = max(seconds, 0.0)
+        if self.clamp and self.remaining is not None:
+            granted = min(granted, self.remaining)
+        self.spent += granted
+        return granted
+
+
+class BehaviourSession:
+    """
+    Human-like behaviour for one browser, as coroutines.
+
+    Each primitive mirrors its counterpart in orb.spinner.utils. Pauses are awaited on the event loop and only the
+    WebDriver commands themselves occupy a worker thread, so many sessions can be interleaved on one loop. Commands
+    within a session run one at a time, in order.
+    """
+
+    def __init__(
+        self,
+        driver: Union[OrbDriver, WebDriver],
+        budget: Optional[DelayBudget] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> None:
+        """
+        Initialise the BehaviourSession.
+
+        Args:
+            driver (Union[OrbDriver, WebDriver]): The browser to drive; an OrbDriver must have been launched.
+            budget (DelayBudget, optional): The session's delay budget. Defaults to an unlimited one.
+            executor (ThreadPoolExecutor, optional): Where WebDriver commands run. Defaults to asyncio.to_thread.
+        """
+        self.driver = driver.driver if isinstance(driver, OrbDriver) else driver
+        self.budget = budget or DelayBudget()
+        self.executor = executor
+        self._lock = asyncio.Lock()
+
+    async def call(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Runs a blocking WebDriver call on a worker thread.
+
+        Args:
+            function (Callable[..., Any]): The call to run.
+            *args: Its positional arguments.
+            **kwargs: Its keyword arguments.
+
+        Returns:
+            Any: The call's return value.
+        """
+        async with self._lock:
+            if self.executor is None:
+                return await asyncio.to_thread(function, *args, **kwargs)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(function, *args, **kwargs))
+
+    async def sleep(self, seconds: float) -> float:
+        """
+        Waits for a human-like delay, within the session's budget, without blocking the event loop.
+
+        Args:
+            seconds (float): The delay wanted.
+
+        Returns:
+            float: The delay actually waited.
+        """
+        granted = self.budget.take(seconds)
+        if granted:
+            await asyncio.sleep(granted)
+        return granted
+
+    async def scroll(self, scroll_range: Tuple[float, float] = (0, 100), steps: Optional[int] = None) -> int:
+        """
+        Scrolls to a random position within the given range, in a few steps with pauses between them.
+
+        Args:
+            scroll_range (Tuple[float, float], optional): The range of scrolling in percentage (from top to bottom).
+                Defaults to (0, 100).
+            steps (int, optional): The number of scroll steps. Defaults to a random 3 to 6.
+
+        Returns:
+            int: The final scroll position.
+        """
+        page_height, current = await self.call(
+            self.driver.execute_script, "return [document.body.scrollHeight, window.scrollY];"
+        )
+        target = random.randint(int(page_height * scroll_range[0] / 100), int(page_height * scroll_range[1] / 100))
+        steps = steps or random.randint(3, 6)
+        for step in range(1, steps + 1):
+            position = int(current + (target - current) * step / steps)
+            await self.call(self.driver.execute_script, f"window.scrollTo(0, {position});")
+            if step < steps:
+                await self.sleep(random.uniform(0.1, 0.5))
+        return target
+
+    async def change_viewport_size(self, width: Optional[int] = None, height: Optional[int] = None) -> None:
+        """
+        Changes the browser window size.
+
+        Args:
+            width (int, optional): The desired width. Defaults to a random value between 1600 and 1700.
+            height (int, optional): The desired height. Defaults to a random value between 800 and 900.
+        """
+        width = width or random.randint(1600, 1700)
+        height = height or random.randint(800, 900)
+        await self.call(self.driver.set_window_size, width=width, height=height)
+        log.info(f"Driver window size reset to (h{height}, w{width})")
+
+    async def click(self, element: WebElement, random_clicking: bool = True, num_movements: Optional[int] = None):
+        """
+        Clicks an element like human_clicking: optional wandering, then a curved path to the element and a click.
+
+        Each movement is sent as its own actions payload and the pauses between them are awaited on the event loop.
+
+        Args:
+            element (WebElement): The element to click.
+            random_clicking (bool, optional): If True, wander before clicking. Defaults to True.
+            num_movements (int, optional): The number of random movements. Defaults to 1-3 when random_clicking is
+                set.
+
+        Raises:
+            ElementClickInterceptedException: If another element covers every sampled click point.
+        """
+        geometry = await self.call(click_geometry, self.driver, element)
+        point = click_point(geometry)
+        viewport = (geometry["viewportWidth"], geometry["viewportHeight"])
+
+        await self.sleep(random.random())
+        if random_clicking:
+            for _ in range(random.randint(1, 3) if num_movements is None else num_movements):
+                plan = PointerPlan(self.driver, viewport)
+                plan.wander(1, pause=False)
+                await self.call(plan.perform)
+                await self.sleep(random.uniform(0.05, 0.4))
+
+        plan = PointerPlan(self.driver, viewport)
+        plan.move_to(point, target_width=min(geometry["width"], geometry["height"]))
+        await self.call(plan.perform)
+        await self.sleep(random.uniform(0.05, 0.3))
+
+        plan = PointerPlan(self.driver, viewport)
+        plan.click()
+        await self.call(plan.perform)
+
+    async def random_mouse_movements(self, num_movements: int = 5) -> None:
+        """
+        Moves the mouse randomly within the viewport, pausing between movements.
+
+        Args:
+            num_movements (int, optional): The number of movements. Defaults to 5.
+        """
+        viewport = await self.call(viewport_size, self.driver)
+        for _ in range(num_movements):
+            plan = PointerPlan(self.driver, viewport)
+            plan.wander(1, pause=False)
+            await self.call(plan.perform)
+            await self.sleep(random.uniform(0.5, 1.5))
+
+    async def type(
+        self,
+        element: WebElement,
+        text: str,
+        delay: Optional[Union[float, int]] = None,
+        send_keys: bool = False,
+    ) -> None:
+        """
+        Types into an element like slow_type, with the same lognormal keystroke timing.
+
+        Each word, with its key holds and the gaps between its keys, is one actions payload; only the longer gaps
+        after word and sentence boundaries are awaited on the event loop.
+
+        Args:
+            element (WebElement): The element to type into. It is focused first, like slow_type, without a click.
+            text (str): The text to be typed.
+            delay (Union[float, int], optional): The median delay between keystrokes. Defaults to a random value
+                between 0.1 and 0.5 seconds, drawn per call.
+            send_keys (bool, optional): Whether to send an "Enter" key press after typing. Defaults to False.
+        """
+        await self.call(focus_element, element)
+        for burst in self._bursts(keystroke_plan(text, delay=delay, send_keys=send_keys)):
+            actions = ActionChains(self.driver)
+            for index, keystroke in enumerate(burst):
+                actions.key_down(keystroke.key).pause(self.budget.take(keystroke.hold)).key_up(keystroke.key)
+                if index < len(burst) - 1:
+                    actions.pause(self.budget.take(keystroke.gap))
+            await self.call(actions.perform)
+            await self.sleep(burst[-1].gap)
+
+    @staticmethod
+    def _bursts(plan: List[Keystroke]) -> List[List[Keystroke]]:
+        bursts: List[List[Keystroke]] = [[]]
+        for keystroke in plan:
+            bursts[-1].append(keystroke)
+            if keystroke.key in WORD_BOUNDARIES:
+                bursts.append([])
+        return [burst for burst in bursts if burst]
+
+
+class BehaviourScheduler:
+    """
+    Runs behaviour sessions for many browsers on one event loop, sharing a pool of threads for WebDriver commands.
+
+    Threads are only held while a command runs, so `max_workers` bounds concurrent commands, not browsers.
+    """
+
+    def __init__(self, max_workers: int = 32, budget: Optional[float] = None, clamp: bool = False) -> None:
+        """
+        Initialise the BehaviourScheduler.
+
+        Args:
+            max_workers (int, optional): Threads for WebDriver commands. Defaults to 32.
+            budget (float, optional): The delay budget of each new session in seconds. Defaults to None, no limit.
+            clamp (bool, optional): Whether sessions cut delays to their remaining budget, see DelayBudget.
+                Defaults to False.
+        """
+        self.budget = budget
+        self.clamp = clamp
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="orb-behaviour")
+
+    def session(self, driver: Union[OrbDriver, WebDriver], budget: Optional[float] = None) -> BehaviourSession:
+        """
+        Creates a session for a browser.
+
+        Args:
+            driver (Union[OrbDriver, WebDriver]): The browser to drive.
+            budget (float, optional): The session's delay budget in seconds. Defaults to the scheduler's.
+
+        Returns:
+            BehaviourSession: The session.
+        """
+        total = self.budget if budget is None else budget
+        return BehaviourSession(driver, budget=DelayBudget(total, clamp=self.clamp), executor=self.executor)
+
+    async def run(self, jobs: Iterable[Awaitable[Any]]) -> List[Any]:
+        """
+        Runs jobs, typically one coroutine per session, concurrently on the current loop.
+
+        Args:
+            jobs (Iterable[Awaitable[Any]]): The jobs.
+
+        Returns:
+            List[Any]: Each job's result, or the exception it raised, in order.
+        """
+        return await asyncio.gather(*jobs, return_exceptions=True)
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self) -> "BehaviourScheduler":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,17 +1,37 @@
 import logging
-from typing import Dict, Optional
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, Set, Union
+from urllib.parse import urlsplit
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
 # from orb.common.design.welcome_page import build_welcome_page
+from orb.common.proxies.forward_proxy import ForwardProxy
+from orb.common.user_agents.header_profiles import (detect_platform,
+                                                    get_header_profile_factory,
+                                                    user_agent_metadata)
 from orb.common.vpn import PiaVpn
-from orb.utils import GetUserAgent
+from orb.common.vpn.rotator import IpRotator, NoOpRotator, PiaRotator
+from orb.spinner.core.driver_cache import resolve_chromedriver_path
+from orb.spinner.core.profile import DriverProfile
+from orb.spinner.snapshot import SNAPSHOT_SCRIPT, PageSnapshot
+from orb.utils import GetProxies, GetUserAgent
 
 log = logging.getLogger(__name__)
 
+# navigator.platform values reported for each client hint platform
+NAVIGATOR_PLATFORMS = {
+    "Windows": "Win32",
+    "macOS": "MacIntel",
+    "Linux": "Linux x86_64",
+    "Android": "Linux armv8l",
+    "iOS": "iPhone",
+}
+
 
 class OrbDriver:
     """
@@ -19,12 +39,35 @@ class OrbDriver:
     HTTPS/SSL proxy, and custom user-agent.
     """
 
-    def __init__(self, webdriver_path: Optional[str] = None, use_pia: Optional[bool] = True) -> None:
+    def __init__(
+        self,
+        webdriver_path: Optional[str] = None,
+        use_pia: Optional[bool] = True,
+        offline: Optional[bool] = False,
+        profile: Optional[DriverProfile] = None,
+        forward_proxy: Optional[Union[ForwardProxy, str]] = None,
+        ip_rotator: Optional[IpRotator] = None,
+    ) -> None:
         """
         Initialise OrbDriver with default options.
+
+        Args:
+            webdriver_path (str, optional): Path to the chromedriver binary. Defaults to the cached resolution.
+            use_pia (bool, optional): Whether to control PIA VPN. Defaults to True.
+            offline (bool, optional): Whether to only use a previously cached chromedriver, never resolving it over
+                the network. Defaults to False.
+            profile (DriverProfile, optional): How Chrome is launched. Defaults to DriverProfile().
+            forward_proxy (Union[ForwardProxy, str], optional): A running local forward proxy Chrome is pointed at,
+                allowing the upstream proxy to be rotated without relaunching. Either an in-process ForwardProxy or
+                the "host:port" address of one running as a separate process. Defaults to None.
+            ip_rotator (IpRotator, optional): How change_ip_address changes the exit IP. Defaults to rotating the PIA
+                VPN region when use_pia is set, otherwise a no-op.
         """
         self.driver = None
         self.webdriver_path = webdriver_path
+        self.offline = offline
+        self.profile = profile or DriverProfile()
+        self.forward_proxy = forward_proxy
         self.webdriver_options = Options()
 
         # Placeholder for PiaVpn instance
@@ -33,46 +76,188 @@ class OrbDriver:
         else:
             self.pia = None
 
+        if ip_rotator is None:
+            ip_rotator = PiaRotator(self.pia) if self.pia else NoOpRotator()
+        self.ip_rotator = ip_rotator
+
     def _webdriver_init__(self) -> None:
         """
         Initialise WebDriver installation and options.
         """
-        # Download latest webdriver
+        # Resolve the webdriver from the on-disk cache, downloading it only when needed
         if not self.webdriver_path:
-            self.webdriver_path = ChromeDriverManager().install()
+            self.webdriver_path = resolve_chromedriver_path(offline=self.offline)
         self.webdriver_service = Service(executable_path=self.webdriver_path)
 
-        # Common options for WebDriver
-        self.webdriver_options.add_argument("--disable-javascript")
-        self.webdriver_options.add_argument('--no-sandbox')
-        self.webdriver_options.add_argument('--disable-dev-shm-usage')
-        self.webdriver_options.add_argument('--blink-settings=imagesEnabled=false')
-        self.webdriver_options.add_argument('--disable-extensions')
-        self.webdriver_options.add_argument('--disable-blink-features=AutomationControlled')
-        self.webdriver_options.add_argument('--disable-gpu')
-        self.webdriver_options.add_argument('--window-size=1920x1080')
-        self.webdriver_options.add_argument('--log-level=3')
-        self.webdriver_options.add_argument('--disable-web-security')
-        self.webdriver_options.add_argument(f"user-agent={self.set_user_agent()}")
+        # Fresh, deduplicated options per launch so relaunches never accumulate arguments
+        self.webdriver_options = self.profile.build_options(
+            user_agent=self.set_user_agent(),
+            proxy=self.forward_proxy.address if isinstance(self.forward_proxy, ForwardProxy) else self.forward_proxy,
+        )
         self.capabilities = webdriver.DesiredCapabilities.CHROME
 
-    def change_ip_address(self) -> None:
+    def change_ip_address(self, wait: bool = True) -> Optional[Future]:
+        """
+        Change IP address using the configured IP rotator, PIA VPN by default.
+
+        The rotation holds back new work wrapped in `work()` and lets in-flight work drain before switching. Do not
+        call it with `wait` from inside such work, which would wait on itself.
+
+        Args:
+            wait (bool, optional): Whether to block until the switch is done. Defaults to True.
+
+        Returns:
+            Optional[Future]: Without `wait`, a future resolving once the switch is done.
         """
-        Change IP address using PIA VPN.
+        if wait:
+            self.ip_rotator.rotate()
+            return None
+        return self.ip_rotator.rotate_async()
+
+    @contextmanager
+    def work(self, timeout: Optional[float] = None) -> Iterator[None]:
         """
-        if self.pia.vpn_status() != 'Connected':
-            self.pia.connect()
-        else:
-            self.pia.set_region(region='random')
+        Context manager wrapping one unit of work on the driver, such as loading and extracting a page.
+
+        It waits out an IP rotation in progress and keeps the next one from starting until the work is done. On
+        success the work is recorded as a request with the IP rotator, which may then start a proactive rotation, e.g.
+        once the PIA region's request allowance is used up. `get_webdriver` and CrawlOrchestrator tasks already run
+        inside it; wrap any other page loads the same way.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a rotation in progress. Defaults to waiting forever.
+
+        Raises:
+            TimeoutError: If a rotation is still in progress after the timeout.
+        """
+        with self.ip_rotator.work(timeout=timeout):
+            start = time.monotonic()
+            yield
+            seconds = time.monotonic() - start
+        self.ip_rotator.record_request(seconds=seconds)
+
+    @staticmethod
+    def visited_origins(driver: webdriver.Chrome) -> Set[str]:
+        """
+        Returns the origins of every page in the current tab's navigation history.
+
+        Args:
+            driver (webdriver.Chrome): The WebDriver instance.
+
+        Returns:
+            Set[str]: The http and https origins, e.g. "https://example.com".
+        """
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        origins = set()
+        for entry in history.get("entries", []):
+            url = urlsplit(entry.get("url", ""))
+            if url.scheme in ("http", "https") and url.netloc:
+                origins.add(f"{url.scheme}://{url.netloc}")
+        return origins
+
+    @staticmethod
+    def clear_browsing_data(driver: webdriver.Chrome, origins: Optional[Iterable[str]] = None) -> None:
+        """
+        Clear cookies, cache and site storage on a running Chrome driver.
+
+        Cookies and cache are cleared browser-wide, but CDP clears storage one origin at a time, so only the given
+        origins have theirs cleared.
+
+        Args:
+            driver (webdriver.Chrome): The WebDriver instance.
+            origins (Iterable[str], optional): The origins whose storage is cleared. Defaults to the origins in the
+                current tab's navigation history.
+        """
+        for origin in (OrbDriver.visited_origins(driver) if origins is None else origins):
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+
+    def rotate_identity(self, rotate_proxy: Optional[bool] = None, upstream: Optional[str] = None) -> str:
+        """
+        Give the running browser a new identity without relaunching Chrome.
+
+        The user agent, its matching client hints, Accept-Language and navigator.platform are overridden through CDP
+        in every open tab, cookies and storage are cleared and, when an in-process forward proxy is configured, its
+        upstream proxy is swapped. Only Chromium user agents are used, since the browser is Chrome and would otherwise
+        contradict a Firefox or Safari user agent through its client hints and JavaScript APIs. Tabs opened later keep
+        Chrome's own user agent.
+
+        Args:
+            rotate_proxy (bool, optional): Whether to swap the upstream proxy. Defaults to True when an in-process
+                forward proxy is configured.
+            upstream (str, optional): The upstream proxy as "host:port". Defaults to a new pick from the forward
+                proxy's pool, or from the shared proxy pool if it has none.
+
+        Returns:
+            str: The new user agent.
+
+        Raises:
+            RuntimeError: If no driver is running, or a proxy rotation is requested without a forward proxy.
+        """
+        if not self.driver:
+            raise RuntimeError("No running WebDriver to rotate.")
+        if rotate_proxy is None:
+            rotate_proxy = isinstance(self.forward_proxy, ForwardProxy)
+        if rotate_proxy and not isinstance(self.forward_proxy, ForwardProxy):
+            raise RuntimeError("Rotating the proxy in place requires OrbDriver to use an in-process ForwardProxy.")
+
+        headers = get_header_profile_factory().random_profile(engine="chromium").headers
+        user_agent = headers["User-Agent"]
+        override = {
+            "userAgent": user_agent,
+            "acceptLanguage": headers["Accept-Language"].split(",")[0],
+            "platform": NAVIGATOR_PLATFORMS.get(detect_platform(user_agent), ""),
+            "userAgentMetadata": user_agent_metadata(user_agent),
+        }
+
+        # CDP overrides are per target, so apply it to each tab and come back to the current one
+        current = self.driver.current_window_handle
+        origins = set()
+        for handle in self.driver.window_handles:
+            if handle != current:
+                self.driver.switch_to.window(handle)
+            self.driver.execute_cdp_cmd("Network.setUserAgentOverride", override)
+            origins.update(self.visited_origins(self.driver))
+        if self.driver.current_window_handle != current:
+            self.driver.switch_to.window(current)
+        self.clear_browsing_data(self.driver, origins)
+
+        if rotate_proxy:
+            if upstream is None and self.forward_proxy.pool is not None:
+                self.forward_proxy.rotate()
+            else:
+                self.forward_proxy.set_upstream(upstream or GetProxies.proxy_pool().get_address())
+
+        log.info(f"Rotated WebDriver identity to user-agent: {user_agent}")
+        return user_agent
 
     def set_headless(self) -> 'OrbDriver':
         """
         Enable headless mode for the WebDriver.
 
+        The driver switches to a headless copy of its profile, so a profile shared with other drivers is not changed.
+
         Returns:
             OrbDriver: The OrbDriver instance for method chaining.
         """
-        self.webdriver_options.add_argument("--headless")
+        self.profile = self.profile.replace(headless=True)
+        return self
+
+    def set_profile(self, profile: DriverProfile) -> 'OrbDriver':
+        """
+        Switch the driver profile. Resource blocking applies to the running browser immediately; launch arguments
+        apply from the next launch.
+
+        Args:
+            profile (DriverProfile): The profile to switch to.
+
+        Returns:
+            OrbDriver: The OrbDriver instance for method chaining.
+        """
+        self.profile = profile
+        if self.driver:
+            self.profile.apply(self.driver)
         return self
 
     def set_user_agent(self) -> Dict[str, str]:
@@ -97,9 +282,11 @@ class OrbDriver:
 
         self.driver = webdriver.Chrome(
             service=self.webdriver_service, options=self.webdriver_options)
+        self.profile.apply(self.driver)
 
         if url:
-            self.driver.get(url=url)
+            with self.work():
+                self.driver.get(url=url)
             return self.driver
 
         # # Builds a landing page for the driver to start at
@@ -132,6 +319,26 @@ class OrbDriver:
 
         return self.driver
 
+    def snapshot(self, parser: Optional[str] = None, prefetch: bool = True) -> PageSnapshot:
+        """
+        Captures the current page's serialized DOM and URL in one round trip, for parsing off the browser.
+
+        Extraction then runs against the snapshot instead of live WebElements, so the driver is free to load the next
+        page while a worker thread parses.
+
+        Args:
+            parser (str, optional): The BeautifulSoup parser to use, see PageSnapshot. Defaults to lxml if installed.
+            prefetch (bool, optional): Whether to start parsing on the parse pool straight away. Defaults to True.
+
+        Returns:
+            PageSnapshot: The captured page.
+        """
+        html, url = self.driver.execute_script(SNAPSHOT_SCRIPT)
+        snapshot = PageSnapshot(html=html, url=url, parser=parser)
+        if prefetch:
+            snapshot.prefetch()
+        return snapshot
+
     def set_driver(self, driver: webdriver.Chrome) -> None:
         """
         Set the WebDriver instance. Useful for testing.
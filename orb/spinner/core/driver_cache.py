@@ -0,0 +1,113 @@
+"""
+This script caches the resolved chromedriver binary path on disk, keyed by the installed Chrome version.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+log = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "orb", "chromedriver.json")
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+# Paths already resolved by this process, keyed by cache file
+_resolved_paths: Dict[str, str] = {}
+_resolve_lock = threading.Lock()
+
+
+class ChromeDriverResolutionError(Exception):
+    """
+    Custom exception for when no usable chromedriver binary can be resolved.
+    """
+    def __init__(self, message: str):
+        super().__init__(message)
+
+
+def get_chrome_version() -> Optional[str]:
+    """
+    Get the version of the locally installed Google Chrome, without touching the network.
+
+    Returns:
+        Optional[str]: The Chrome version, or None if it cannot be detected.
+    """
+    return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+
+
+def _load_entries(cache_path: str) -> Dict[str, Dict]:
+    try:
+        with open(cache_path, 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_entries(cache_path: str, entries: Dict[str, Dict]) -> None:
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w') as file:
+            json.dump(entries, file)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log.warning(f"Failed to write chromedriver cache {cache_path}: {e}")
+
+
+def resolve_chromedriver_path(
+    cache_path: str = DEFAULT_CACHE_PATH,
+    ttl: float = DEFAULT_TTL,
+    offline: bool = False,
+) -> str:
+    """
+    Resolve the chromedriver binary path, calling ChromeDriverManager only when the cache cannot answer.
+
+    Once a path has been resolved in this process, later calls only stat the binary. In offline mode neither the Chrome
+    version nor the network is consulted: the most recently cached binary is used regardless of age.
+
+    Args:
+        cache_path (str, optional): JSON file holding resolved paths keyed by Chrome version.
+            Defaults to ~/.cache/orb/chromedriver.json.
+        ttl (float, optional): Seconds before a cached path is re-resolved. Defaults to one week.
+        offline (bool, optional): Whether to never resolve over the network. Defaults to False.
+
+    Returns:
+        str: The chromedriver binary path.
+
+    Raises:
+        ChromeDriverResolutionError: If offline and no cached binary exists.
+    """
+    with _resolve_lock:
+        path = _resolved_paths.get(cache_path)
+        if path and os.path.exists(path):
+            return path
+
+        entries = _load_entries(cache_path)
+
+        if offline:
+            cached = sorted(entries.values(), key=lambda entry: entry.get("resolved_at", 0), reverse=True)
+            for entry in cached:
+                if os.path.exists(entry.get("path", "")):
+                    _resolved_paths[cache_path] = entry["path"]
+                    return entry["path"]
+            raise ChromeDriverResolutionError(
+                f"No cached chromedriver found in {cache_path}; run once online to populate it."
+            )
+
+        version = get_chrome_version() or "unknown"
+        entry = entries.get(version)
+        if entry and time.time() - entry.get("resolved_at", 0) < ttl and os.path.exists(entry.get("path", "")):
+            _resolved_paths[cache_path] = entry["path"]
+            return entry["path"]
+
+        log.info(f"Resolving chromedriver for Chrome {version}.")
+        path = ChromeDriverManager().install()
+        entries[version] = {"path": path, "resolved_at": time.time()}
+        _save_entries(cache_path, entries)
+        _resolved_paths[cache_path] = path
+        return path
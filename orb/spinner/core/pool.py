@@ -0,0 +1,282 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
+
+import psutil
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from orb.spinner.core.driver import OrbDriver
+
+log = logging.getLogger(__name__)
+
+
+class PooledDriver:
+    """
+    A launched OrbDriver together with its lease bookkeeping.
+    """
+
+    def __init__(self, orb_driver: OrbDriver, driver: webdriver.Chrome) -> None:
+        self.orb_driver = orb_driver
+        self.driver = driver
+        self.uses = 0
+        # Resident memory of the freshly launched browser, which later measurements are compared against
+        self.baseline_memory: Optional[float] = None
+
+
+class OrbDriverPool:
+    """
+    Keeps a number of pre-launched Chrome drivers warm and leases them out, so tasks skip Chrome's cold start.
+
+    Between leases a driver is reset (cookies, storage, extra tabs) instead of relaunched. A driver is recycled, that
+    is quit and replaced with a fresh one, after `max_uses` leases, once the resident memory of its Chrome processes at
+    the end of a lease has grown by more than `max_memory_growth_mb` since launch, or if it fails to reset.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        driver_factory: Optional[Callable[[], OrbDriver]] = None,
+        max_uses: int = 50,
+        max_memory_growth_mb: Optional[float] = 200,
+        warm: bool = True,
+    ) -> None:
+        """
+        Initialise the OrbDriverPool.
+
+        Args:
+            size (int, optional): Number of drivers kept in the pool. Defaults to 2.
+            driver_factory (Callable[[], OrbDriver], optional): Builds a configured, unlaunched OrbDriver.
+                Defaults to a headless OrbDriver without PIA.
+            max_uses (int, optional): Leases after which a driver is recycled. Defaults to 50.
+            max_memory_growth_mb (float, optional): Growth of the browser's resident memory in MB after which a
+                driver is recycled. Defaults to 200. None disables the check.
+            warm (bool, optional): Whether to launch every driver up front, in parallel. Defaults to True.
+        """
+        self.size = size
+        self.driver_factory = driver_factory or (lambda: OrbDriver(use_pia=False).set_headless())
+        self.max_uses = max_uses
+        self.max_memory_growth_mb = max_memory_growth_mb
+
+        self._idle: "deque[PooledDriver]" = deque()
+        self._all: List[PooledDriver] = []
+        self._launching = 0
+        self._lock = threading.Lock()
+        # Notified whenever a driver becomes idle, a slot frees up or the pool closes
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+
+        if warm:
+            with ThreadPoolExecutor(max_workers=size) as executor:
+                for pooled in executor.map(lambda _: self._launch(), range(size)):
+                    self._put_idle(pooled)
+
+    def __enter__(self) -> 'OrbDriverPool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def browser_memory(driver: webdriver.Chrome) -> Optional[float]:
+        """
+        Returns the resident memory in MB of every Chrome process (browser, renderers, GPU and utility processes)
+        started by the driver's chromedriver service.
+
+        Args:
+            driver (webdriver.Chrome): The WebDriver instance.
+
+        Returns:
+            Optional[float]: The resident memory in MB, or None if the processes cannot be inspected, for example
+                for a remote driver.
+        """
+        try:
+            processes = psutil.Process(driver.service.process.pid).children(recursive=True)
+        except (AttributeError, TypeError, psutil.Error):
+            # No local chromedriver process to inspect, e.g. a remote driver
+            return None
+
+        rss = 0
+        for process in processes:
+            try:
+                rss += process.memory_info().rss
+            except psutil.Error:
+                # Renderers come and go as tabs navigate
+                continue
+        return rss / (1024 * 1024)
+
+    def _launch(self) -> PooledDriver:
+        orb_driver = self.driver_factory()
+        pooled = PooledDriver(orb_driver=orb_driver, driver=orb_driver.get_webdriver())
+        if self.max_memory_growth_mb is not None:
+            pooled.baseline_memory = self.browser_memory(pooled.driver)
+        with self._lock:
+            self._all.append(pooled)
+        return pooled
+
+    def _reserve_slot(self) -> bool:
+        # Callers hold the lock
+        if len(self._all) + self._launching >= self.size:
+            return False
+        self._launching += 1
+        return True
+
+    def _release_slot(self) -> None:
+        with self._available:
+            self._launching -= 1
+            # Wake a waiter to launch into the slot if this launch failed
+            self._available.notify()
+
+    def _put_idle(self, pooled: PooledDriver) -> None:
+        with self._available:
+            self._idle.append(pooled)
+            self._available.notify()
+
+    def _discard(self, pooled: PooledDriver) -> None:
+        with self._available:
+            if pooled in self._all:
+                self._all.remove(pooled)
+            self._available.notify()
+        try:
+            pooled.driver.quit()
+        except WebDriverException as e:
+            log.debug(f"Error quitting pooled driver: {e}")
+
+    def _memory_grown(self, pooled: PooledDriver) -> bool:
+        if self.max_memory_growth_mb is None:
+            return False
+        memory = self.browser_memory(pooled.driver)
+        if memory is None:
+            return False
+        if pooled.baseline_memory is None:
+            pooled.baseline_memory = memory
+            return False
+        return memory - pooled.baseline_memory > self.max_memory_growth_mb
+
+    def reset(self, driver: webdriver.Chrome) -> None:
+        """
+        Clears cookies, cache and the storage of every origin visited in any tab, and closes extra tabs so the driver
+        can be leased again.
+
+        Args:
+            driver (webdriver.Chrome): The WebDriver instance.
+
+        Raises:
+            WebDriverException: If the browser cannot be reset, including when every window was closed.
+        """
+        handles = driver.window_handles
+        if not handles:
+            raise WebDriverException("No windows left to reset.")
+
+        origins = set()
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            origins.update(OrbDriver.visited_origins(driver))
+            if handle != handles[0]:
+                driver.close()
+
+        OrbDriver.clear_browsing_data(driver, origins)
+        driver.get("about:blank")
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Takes an idle driver from the pool, launching one if the pool is not yet full.
+
+        While the pool is full, waits for a driver to be released or for a slot to free up, for example after a
+        replacement failed to launch, and launches into a freed slot itself.
+
+        Args:
+            timeout (float, optional): Seconds to wait for an idle driver. Defaults to waiting forever.
+
+        Returns:
+            PooledDriver: The leased driver. Hand it back with `release`.
+
+        Raises:
+            RuntimeError: If the pool is closed, including while waiting.
+            queue.Empty: If no driver became idle within the timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("OrbDriverPool is closed.")
+                if self._idle:
+                    return self._idle.popleft()
+                if self._reserve_slot():
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise queue.Empty
+                self._available.wait(remaining)
+
+        try:
+            return self._launch()
+        finally:
+            self._release_slot()
+
+    def release(self, pooled: PooledDriver) -> None:
+        """
+        Returns a leased driver to the pool, resetting or recycling it.
+
+        Never raises: if the replacement for a recycled driver fails to launch, the freed slot wakes a waiting
+        `acquire`, which launches another.
+
+        Args:
+            pooled (PooledDriver): The driver returned by `acquire`.
+        """
+        pooled.uses += 1
+        # Measured before the reset, while the browser still holds what the lease left behind
+        if not self._closed and pooled.uses < self.max_uses and not self._memory_grown(pooled):
+            try:
+                self.reset(pooled.driver)
+                self._put_idle(pooled)
+                return
+            except WebDriverException as e:
+                log.warning(f"Failed to reset pooled driver, recycling it: {e}")
+
+        log.debug(f"Recycling pooled driver after {pooled.uses} uses.")
+        self._discard(pooled)
+        with self._available:
+            # A waiting `acquire` may already have taken the freed slot
+            reserved = not self._closed and self._reserve_slot()
+        if reserved:
+            try:
+                self._put_idle(self._launch())
+            except Exception as e:
+                log.warning(f"Failed to launch a replacement pooled driver: {e}")
+            finally:
+                self._release_slot()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[webdriver.Chrome]:
+        """
+        Context manager that leases a warm driver and returns it to the pool afterwards.
+
+        Args:
+            timeout (float, optional): Seconds to wait for an idle driver. Defaults to waiting forever.
+
+        Yields:
+            webdriver.Chrome: The leased WebDriver instance.
+        """
+        pooled = self.acquire(timeout=timeout)
+        try:
+            yield pooled.driver
+        finally:
+            self.release(pooled)
+
+    def close(self) -> None:
+        """
+        Quits every driver in the pool and wakes any `acquire` still waiting, which then raises RuntimeError.
+        """
+        with self._available:
+            self._closed = True
+            self._idle.clear()
+            pooled_drivers = list(self._all)
+            self._available.notify_all()
+        for pooled in pooled_drivers:
+            self._discard(pooled)
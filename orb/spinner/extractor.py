@@ -0,0 +1,232 @@
+"""
+This script resolves many named locators in a single browser round trip.
+"""
+
+import logging
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+
+log = logging.getLogger(__name__)
+
+# Extra seconds the driver's script timeout allows beyond a wait, so the page-side timer always fires first
+SCRIPT_TIMEOUT_MARGIN = 5
+
+# Resolves every field against the live DOM; defines `resolve(fields)` for the extract and wait scripts, and
+# `exists(field)`, a cheap presence check that reads no text, for the wait script's mutation callback
+_RESOLVE_JS = """
+function find(by, value) {
+    switch (by) {
+        case "id": {
+            const element = document.getElementById(value);
+            return element ? [element] : [];
+        }
+        case "xpath": {
+            const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < result.snapshotLength; i++) nodes.push(result.snapshotItem(i));
+            return nodes;
+        }
+        case "link text":
+            return Array.from(document.links).filter(a => a.innerText.trim() === value);
+        case "partial link text":
+            return Array.from(document.links).filter(a => a.innerText.includes(value));
+        case "name":
+            return Array.from(document.getElementsByName(value));
+        case "tag name":
+            return Array.from(document.getElementsByTagName(value));
+        case "class name":
+            return Array.from(document.getElementsByClassName(value));
+        default:
+            return Array.from(document.querySelectorAll(value));
+    }
+}
+function exists(field) {
+    switch (field.by) {
+        case "xpath":
+            return document.evaluate(
+                field.value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue !== null;
+        case "id":
+            return document.getElementById(field.value) !== null;
+        case "css selector":
+            return document.querySelector(field.value) !== null;
+        default:
+            return find(field.by, field.value).length > 0;
+    }
+}
+function describe(node, attributes) {
+    const values = {};
+    // XPath can match attribute and text nodes, e.g. //a/@href or //h1/text(); those only have a value
+    const element = node.nodeType === Node.ELEMENT_NODE;
+    for (const name of attributes) values[name] = element ? node.getAttribute(name) : null;
+    const text = !element ? node.nodeValue : node.innerText !== undefined ? node.innerText : node.textContent;
+    return {text: (text || "").trim(), attributes: values};
+}
+function resolve(fields) {
+    const results = {};
+    for (const [name, field] of Object.entries(fields)) {
+        const elements = find(field.by, field.value);
+        if (field.many) {
+            results[name] = elements.map(element => describe(element, field.attributes));
+        } else {
+            results[name] = elements.length ? describe(elements[0], field.attributes) : null;
+        }
+    }
+    return results;
+}
+"""
+
+EXTRACT_SCRIPT = _RESOLVE_JS + "return resolve(arguments[0]);"
+
+# Waits until the required fields exist, re-checking only their presence on DOM mutations instead of polling, then
+# resolves every field once
+WAIT_SCRIPT = _RESOLVE_JS + """
+const [fields, required, timeoutMs, done] = arguments;
+const allPresent = () => required.every(name => exists(fields[name]));
+const finish = () => {
+    const results = resolve(fields);
+    const missing = required.filter(name => {
+        const value = results[name];
+        return value === null || (Array.isArray(value) && value.length === 0);
+    });
+    done({results: results, missing: missing});
+};
+if (allPresent()) {
+    finish();
+} else {
+    let finished = false;
+    const stop = () => {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        finish();
+    };
+    const observer = new MutationObserver(() => {
+        if (allPresent()) stop();
+    });
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    const timer = setTimeout(stop, timeoutMs);
+}
+"""
+
+Locator = Tuple[str, str]
+
+
+class Field(NamedTuple):
+    """
+    A named value to extract: where to find it, which attributes to read and whether to collect every match.
+    """
+    locator: Locator
+    attributes: Sequence[str] = ()
+    many: bool = False
+
+
+class Element(NamedTuple):
+    """
+    The extracted text and attributes of one element.
+
+    XPath matches that are attribute or text nodes, e.g. `//a/@href`, give the node's value as `text` and None for
+    every attribute.
+    """
+    text: str
+    attributes: Dict[str, Optional[str]]
+
+
+Result = Union[Optional[Element], List[Element]]
+
+
+class PageExtractor:
+    """
+    Extracts many named fields from the current page in one `execute_script` call, instead of one round trip per
+    element and per `.text` or `.get_attribute`.
+
+    Fields are given as locator tuples, e.g. `(By.CSS_SELECTOR, "h1")`, or as `Field`s to also read attributes or to
+    collect every match. `wait` blocks until the fields appear, using a MutationObserver in the page so it resolves as
+    soon as the DOM changes rather than polling.
+    """
+
+    _STRATEGIES = {By.ID, By.XPATH, By.LINK_TEXT, By.PARTIAL_LINK_TEXT, By.NAME, By.TAG_NAME, By.CLASS_NAME,
+                   By.CSS_SELECTOR}
+
+    def __init__(self, driver: WebDriver, fields: Mapping[str, Union[Locator, Field]]) -> None:
+        """
+        Initialise the PageExtractor.
+
+        Args:
+            driver (WebDriver): The WebDriver instance.
+            fields (Mapping[str, Union[Tuple[By, str], Field]]): The fields to extract, by name.
+
+        Raises:
+            ValueError: If a locator uses an unknown strategy.
+        """
+        self.driver = driver
+        self.fields = {name: field if isinstance(field, Field) else Field(locator=tuple(field))
+                       for name, field in fields.items()}
+        for name, field in self.fields.items():
+            if field.locator[0] not in self._STRATEGIES:
+                raise ValueError(f"Unknown locator strategy {field.locator[0]!r} for field {name!r}.")
+        self._payload = {
+            name: {"by": field.locator[0], "value": field.locator[1], "attributes": list(field.attributes),
+                   "many": field.many}
+            for name, field in self.fields.items()
+        }
+
+    def _parse(self, raw: Dict[str, Any]) -> Dict[str, Result]:
+        results = {}
+        for name, field in self.fields.items():
+            value = raw.get(name)
+            if field.many:
+                results[name] = [Element(**item) for item in value or []]
+            else:
+                results[name] = Element(**value) if value else None
+        return results
+
+    def extract(self) -> Dict[str, Result]:
+        """
+        Extracts every field from the current page in one round trip.
+
+        Returns:
+            Dict[str, Union[Optional[Element], List[Element]]]: Per field, the first match or None, or for `many`
+                fields every match.
+        """
+        return self._parse(self.driver.execute_script(EXTRACT_SCRIPT, self._payload))
+
+    def wait(self, timeout: float = 30, required: Optional[Sequence[str]] = None) -> Dict[str, Result]:
+        """
+        Waits until the required fields are on the page, then extracts every field.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait. Defaults to 30.
+            required (Sequence[str], optional): The fields that must be present. Defaults to all of them.
+
+        Returns:
+            Dict[str, Union[Optional[Element], List[Element]]]: The extracted fields, as for `extract`.
+
+        Raises:
+            ValueError: If a required field is not one of the extractor's fields.
+            TimeoutException: If a required field is still missing after the timeout.
+        """
+        required = list(self.fields) if required is None else list(required)
+        unknown = set(required) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Unknown required fields: {sorted(unknown)}.")
+
+        # The driver aborts async scripts after its script timeout, so make sure ours fires first, then put the
+        # caller's timeout back
+        previous = self.driver.timeouts.script
+        raised = previous is not None and previous < timeout + SCRIPT_TIMEOUT_MARGIN
+        if raised:
+            self.driver.set_script_timeout(timeout + SCRIPT_TIMEOUT_MARGIN)
+        try:
+            outcome = self.driver.execute_async_script(WAIT_SCRIPT, self._payload, required, int(timeout * 1000))
+        finally:
+            if raised:
+                self.driver.set_script_timeout(previous)
+        if outcome["missing"]:
+            log.warning(f"Fields still missing after {timeout}s: {outcome['missing']}")
+            raise TimeoutException(f"Fields not found within {timeout}s: {', '.join(outcome['missing'])}")
+        return self._parse(outcome["results"])
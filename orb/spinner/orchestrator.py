@@ -0,0 +1,312 @@
+"""
+This script runs a crawl across a pool of worker processes, each owning its own warm OrbDriver pool.
+"""
+
+import logging
+import multiprocessing
+import os
+import pickle
+import signal
+import threading
+import time
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from selenium import webdriver
+
+from orb.spinner.core.driver import OrbDriver
+from orb.spinner.core.pool import OrbDriverPool
+
+log = logging.getLogger(__name__)
+
+Handler = Callable[[webdriver.Chrome, Any], Any]
+
+
+class TaskResult(NamedTuple):
+    """
+    The outcome of one task, streamed back to the parent process.
+    """
+    task_id: int
+    task: Any
+    result: Any
+    error: Optional[str]
+    worker: int
+    attempts: int
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _worker_main(
+    worker_id: int,
+    handler: Handler,
+    driver_factory: Optional[Callable[[], OrbDriver]],
+    concurrency: int,
+    task_queue: multiprocessing.Queue,
+    results: Connection,
+) -> None:
+    """
+    Entry point of a worker process: runs `concurrency` threads, each leasing a driver from a process-local pool.
+    """
+    # Lead a new process group, so the parent can kill this worker together with its chromedriver and Chrome children
+    if hasattr(os, "setsid"):
+        os.setsid()
+    pool = OrbDriverPool(size=concurrency, driver_factory=driver_factory, warm=True)
+    send_lock = threading.Lock()
+
+    def run() -> None:
+        while True:
+            item = task_queue.get()
+            if item is None:
+                return
+            task_id, task = item
+            try:
+                pooled = pool.acquire()
+                try:
+                    # Each task is one unit of work, so IP rotations drain around it and count it as a request
+                    with pooled.orb_driver.work():
+                        # Pickle here so an unpicklable result is reported instead of breaking the pipe
+                        payload, error = pickle.dumps(handler(pooled.driver, task)), None
+                finally:
+                    pool.release(pooled)
+            except Exception as e:
+                payload, error = None, f"{type(e).__name__}: {e}"
+            with send_lock:
+                results.send((task_id, payload, error))
+
+    threads = [threading.Thread(target=run, name=f"orb-worker-{worker_id}-{i}") for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    pool.close()
+    results.close()
+
+
+class _Worker:
+    """
+    Parent-side handle of a worker process, its private task queue and result pipe, and the tasks assigned to it.
+    """
+
+    def __init__(
+        self,
+        worker_id: int,
+        process: multiprocessing.Process,
+        task_queue: multiprocessing.Queue,
+        results: Connection,
+    ) -> None:
+        self.worker_id = worker_id
+        self.process = process
+        self.task_queue = task_queue
+        self.results = results
+        # Set once the result pipe is closed or unreadable, i.e. the worker died
+        self.broken = False
+        # task_id -> time the task was assigned
+        self.outstanding: Dict[int, float] = {}
+
+    def kill(self) -> None:
+        """
+        Kills the worker's whole process group, including the browsers it launched.
+        """
+        if hasattr(os, "killpg") and self.process.pid is not None:
+            try:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                # The worker had not yet started its own group, or the group is already gone
+                pass
+        self.process.kill()
+
+
+class CrawlOrchestrator:
+    """
+    Runs tasks across a pool of processes, each owning `concurrency` warm Chrome drivers.
+
+    The parent hands a task to a worker only when that worker has a free driver, so tasks are pulled lazily from the
+    input and results are streamed back as they finish. A worker process that crashes, or holds a task for longer
+    than `task_timeout`, is killed along with its browsers and replaced. Its unfinished tasks are retried on another
+    worker up to `max_attempts` times; after a timeout only the tasks that overran are charged an attempt. Exceptions
+    raised by the handler are reported in the result rather than retried.
+
+    Each worker has its own task queue and result pipe, so killing one never corrupts another's channel.
+
+    The handler and driver factory are sent to the workers, so they must be picklable, e.g. module-level functions.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        processes: Optional[int] = None,
+        concurrency: int = 1,
+        driver_factory: Optional[Callable[[], OrbDriver]] = None,
+        max_attempts: int = 2,
+        task_timeout: Optional[float] = None,
+        start_method: str = "spawn",
+        poll_interval: float = 0.5,
+    ) -> None:
+        """
+        Initialise the CrawlOrchestrator.
+
+        Args:
+            handler (Callable[[webdriver.Chrome, Any], Any]): Called in a worker with a leased driver and a task; its
+                return value is sent back to the parent.
+            processes (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            concurrency (int, optional): Drivers, and threads driving them, per worker process. Defaults to 1.
+            driver_factory (Callable[[], OrbDriver], optional): Builds a configured, unlaunched OrbDriver in the
+                worker. Defaults to a headless OrbDriver without PIA.
+            max_attempts (int, optional): Times a task is tried before a worker crash is reported as its result.
+                Defaults to 2.
+            task_timeout (float, optional): Seconds after which a worker holding a task is killed and replaced.
+                Defaults to None, no limit.
+            start_method (str, optional): The multiprocessing start method. Defaults to "spawn", which is safe with
+                threads running in the parent.
+            poll_interval (float, optional): Seconds between checks for crashed or stuck workers. Defaults to 0.5.
+        """
+        self.handler = handler
+        self.processes = processes or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.driver_factory = driver_factory
+        self.max_attempts = max_attempts
+        self.task_timeout = task_timeout
+        self.poll_interval = poll_interval
+        self._context = multiprocessing.get_context(start_method)
+
+    def _start_worker(self, worker_id: int) -> _Worker:
+        task_queue = self._context.Queue()
+        reader, writer = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_id, self.handler, self.driver_factory, self.concurrency, task_queue, writer),
+            name=f"orb-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        # Only the worker holds the write end now, so its death shows up as EOF on the read end
+        writer.close()
+        return _Worker(worker_id=worker_id, process=process, task_queue=task_queue, results=reader)
+
+    @staticmethod
+    def _stop_worker(worker: _Worker, timeout: float = 10) -> None:
+        if worker.process.is_alive():
+            worker.process.join(timeout)
+        if worker.process.is_alive():
+            worker.kill()
+            worker.process.join(timeout)
+        worker.task_queue.close()
+        worker.task_queue.cancel_join_thread()
+        worker.results.close()
+
+    @staticmethod
+    def _collect(worker: _Worker, pending: Dict[int, Tuple[Any, int]]) -> Iterator[TaskResult]:
+        """
+        Yields the results waiting on a worker's pipe, marking the worker broken once the pipe is closed.
+
+        A result that cannot be unpickled in the parent is reported as that task's error.
+        """
+        messages: List[Tuple[int, Optional[bytes], Optional[str]]] = []
+        try:
+            while not worker.broken and worker.results.poll():
+                messages.append(worker.results.recv())
+        except (EOFError, OSError, pickle.UnpicklingError):
+            worker.broken = True
+        for task_id, payload, error in messages:
+            if worker.outstanding.pop(task_id, None) is not None:
+                task, attempts = pending.pop(task_id)
+                result = None
+                if payload is not None:
+                    try:
+                        result = pickle.loads(payload)
+                    except Exception as e:
+                        error = f"Failed to unpickle result: {type(e).__name__}: {e}"
+                yield TaskResult(task_id, task, result, error, worker.worker_id, attempts)
+
+    def run(self, tasks: Iterable[Any]) -> Iterator[TaskResult]:
+        """
+        Runs the tasks across the worker processes and yields their results in completion order.
+
+        Closing the returned generator early shuts the workers down.
+
+        Args:
+            tasks (Iterable[Any]): The tasks, e.g. URLs. Consumed lazily, so it may be a large or endless iterator.
+
+        Yields:
+            TaskResult: The result of each task.
+        """
+        tasks = iter(tasks)
+        workers = [self._start_worker(worker_id) for worker_id in range(self.processes)]
+        next_worker_id = self.processes
+
+        # task_id -> (task, attempts); tasks are only held here while assigned or waiting to be retried
+        pending: Dict[int, Tuple[Any, int]] = {}
+        retries: Deque[int] = deque()
+        next_task_id = 0
+        exhausted = False
+
+        try:
+            while True:
+                # Hand out work only to free driver slots, so the input is never read ahead of the workers
+                for worker in workers:
+                    while len(worker.outstanding) < self.concurrency:
+                        if retries:
+                            task_id = retries.popleft()
+                        elif not exhausted:
+                            try:
+                                task = next(tasks)
+                            except StopIteration:
+                                exhausted = True
+                                break
+                            task_id = next_task_id
+                            next_task_id += 1
+                            pending[task_id] = (task, 0)
+                        else:
+                            break
+                        task, attempts = pending[task_id]
+                        pending[task_id] = (task, attempts + 1)
+                        worker.outstanding[task_id] = time.monotonic()
+                        worker.task_queue.put((task_id, task))
+
+                if not pending:
+                    return
+
+                ready = wait([worker.results for worker in workers if not worker.broken], timeout=self.poll_interval)
+                for worker in workers:
+                    if worker.results in ready:
+                        yield from self._collect(worker, pending)
+
+                for index, worker in enumerate(workers):
+                    now = time.monotonic()
+                    overran = {
+                        task_id for task_id, assigned in worker.outstanding.items()
+                        if self.task_timeout is not None and now - assigned > self.task_timeout
+                    }
+                    if worker.process.is_alive() and not worker.broken and not overran:
+                        continue
+
+                    reason = "timed out" if overran else f"exited with code {worker.process.exitcode}"
+                    log.warning(f"Worker {worker.worker_id} {reason}, restarting it.")
+                    worker.kill()
+                    # Results sent before the worker died are still valid
+                    yield from self._collect(worker, pending)
+                    self._stop_worker(worker)
+
+                    for task_id in worker.outstanding:
+                        task, attempts = pending[task_id]
+                        if overran and task_id not in overran:
+                            # A healthy task lost to a sibling's timeout does not use up an attempt
+                            pending[task_id] = (task, attempts - 1)
+                            retries.append(task_id)
+                        elif attempts < self.max_attempts:
+                            retries.append(task_id)
+                        else:
+                            del pending[task_id]
+                            yield TaskResult(task_id, task, None, f"Worker {reason}.", worker.worker_id, attempts)
+
+                    workers[index] = self._start_worker(next_worker_id)
+                    next_worker_id += 1
+        finally:
+            for worker in workers:
+                for _ in range(self.concurrency):
+                    worker.task_queue.put(None)
+            for worker in workers:
+                self._stop_worker(worker)
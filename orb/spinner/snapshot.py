@@ -0,0 +1,110 @@
+"""
+This script captures the page once and parses it off the browser, on a worker thread pool.
+
+The document is always a BeautifulSoup document. It is built with lxml when the optional `fast` extra is installed
+(`poetry install --extras fast`), which is several times faster, and with Python's built-in parser otherwise.
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml
+except ImportError:
+    lxml = None
+
+log = logging.getLogger(__name__)
+
+# Serialises the DOM and reads the URL in the same round trip, so both describe the same page
+SNAPSHOT_SCRIPT = "return [document.documentElement.outerHTML, window.location.href];"
+
+T = TypeVar("T")
+
+_parse_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="orb-parse")
+
+
+def default_parser() -> str:
+    """
+    Returns the fastest BeautifulSoup parser installed.
+
+    Returns:
+        str: "lxml" if lxml is installed, else "html.parser".
+    """
+    return "lxml" if lxml is not None else "html.parser"
+
+
+class PageSnapshot:
+    """
+    The serialized DOM and URL of a page at one moment, parsed lazily off the browser.
+
+    Once taken, the snapshot no longer needs the browser, so the driver can load the next page while `extract` runs
+    on the parse pool. The document is parsed at most once, by whichever caller needs it first.
+    """
+
+    def __init__(self, html: str, url: str, parser: Optional[str] = None) -> None:
+        """
+        Initialise the PageSnapshot.
+
+        Args:
+            html (str): The serialized DOM.
+            url (str): The page's URL when it was serialized.
+            parser (str, optional): The BeautifulSoup parser name, e.g. "lxml" or "html.parser". The document is a
+                BeautifulSoup document either way. Defaults to lxml if installed.
+
+        Raises:
+            ValueError: If lxml is requested but not installed.
+        """
+        self.html = html
+        self.url = url
+        self.parser = parser or default_parser()
+        if self.parser == "lxml" and lxml is None:
+            raise ValueError("The lxml parser needs the optional 'fast' extra: poetry install --extras fast")
+        self.taken_at = time.time()
+        self._document: Optional[BeautifulSoup] = None
+        self._lock = threading.Lock()
+
+    def _parse(self) -> BeautifulSoup:
+        with self._lock:
+            if self._document is None:
+                start = time.perf_counter()
+                self._document = BeautifulSoup(self.html, self.parser)
+                log.debug(f"Parsed {len(self.html)} characters of {self.url} in {time.perf_counter() - start:.3f}s.")
+            return self._document
+
+    @property
+    def document(self) -> BeautifulSoup:
+        """
+        The parsed document, parsing it now if no worker has yet.
+
+        Returns:
+            BeautifulSoup: The parsed document.
+        """
+        return self._parse()
+
+    def prefetch(self) -> Future:
+        """
+        Starts parsing on the parse pool.
+
+        Returns:
+            Future: Resolves to the parsed document.
+        """
+        return _parse_executor.submit(self._parse)
+
+    def extract(self, extractor: Callable[[BeautifulSoup], T]) -> "Future[T]":
+        """
+        Runs an extraction function on the parsed document on the parse pool.
+
+        Args:
+            extractor (Callable[[BeautifulSoup], T]): Called with the parsed document; its return value resolves the
+                future.
+
+        Returns:
+            Future[T]: Resolves to the extractor's result, or raises its error.
+        """
+        return _parse_executor.submit(lambda: extractor(self._parse()))
@@ -0,0 +1,339 @@
+"""
+This script generates human-like mouse trajectories and sends them to the browser as one batched actions payload.
+"""
+
+import functools
+import logging
+import math
+import random
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from selenium.common.exceptions import ElementClickInterceptedException
+from selenium.webdriver.common.actions.action_builder import ActionBuilder
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+log = logging.getLogger(__name__)
+
+# Number of cached path shapes; a trajectory reuses one, stretched and rotated onto its start and end points
+TEMPLATE_VARIANTS = 32
+# Fewest and most points on a default path, one per ~20 px in between
+MIN_PATH_STEPS = 8
+MAX_PATH_STEPS = 40
+# Candidate click points hit-tested in the page per click
+CLICK_CANDIDATES = 5
+# Lateral spread of the Bezier control points, as a fraction of the distance travelled
+CURVATURE = 0.25
+# Standard deviation in pixels of the hand tremor added to each point
+TREMOR = 0.6
+# Fitts's law constants in seconds for the time to reach a target
+FITTS_A = 0.1
+FITTS_B = 0.15
+
+# Returns the element's viewport rectangle and the viewport size, scrolling the element into view first if needed,
+# and the first candidate point (given as fractions of the rectangle) where the element itself would get the click
+CLICK_GEOMETRY_SCRIPT = """
+const [element, candidates] = arguments;
+let rect = element.getBoundingClientRect();
+if (rect.bottom < 0 || rect.top > window.innerHeight || rect.right < 0 || rect.left > window.innerWidth) {
+    element.scrollIntoView({block: "center", inline: "center"});
+    rect = element.getBoundingClientRect();
+}
+const root = element.getRootNode().elementFromPoint ? element.getRootNode() : document;
+let point = null;
+let blocker = null;
+for (const [fx, fy] of candidates) {
+    const x = Math.min(Math.max(rect.left + rect.width * fx, 0), window.innerWidth - 1);
+    const y = Math.min(Math.max(rect.top + rect.height * fy, 0), window.innerHeight - 1);
+    const hit = root.elementFromPoint(x, y);
+    if (hit && (hit === element || element.contains(hit))) {
+        point = [x, y];
+        break;
+    }
+    if (hit && blocker === null) {
+        blocker = hit.tagName.toLowerCase() + (hit.id ? "#" + hit.id : "");
+    }
+}
+return {
+    x: rect.left, y: rect.top, width: rect.width, height: rect.height,
+    viewportWidth: window.innerWidth, viewportHeight: window.innerHeight,
+    point: point, blocker: blocker
+};
+"""
+
+# Last pointer position sent to each driver, so the next trajectory starts where the previous one ended
+_pointer_positions: "weakref.WeakKeyDictionary[WebDriver, Tuple[int, int]]" = weakref.WeakKeyDictionary()
+
+
+def minimum_jerk(steps: int) -> np.ndarray:
+    """
+    Returns the progress along a path at evenly spaced times for a minimum-jerk movement, which accelerates and
+    decelerates smoothly like a human hand.
+
+    Args:
+        steps (int): The number of samples.
+
+    Returns:
+        np.ndarray: Progress values from 0 to 1.
+    """
+    t = np.linspace(0.0, 1.0, steps)
+    return 10 * t ** 3 - 15 * t ** 4 + 6 * t ** 5
+
+
+# Sized for every variant at every default step count, so default paths never evict each other
+@functools.lru_cache(maxsize=TEMPLATE_VARIANTS * (MAX_PATH_STEPS - MIN_PATH_STEPS + 1))
+def path_template(variant: int, steps: int) -> np.ndarray:
+    """
+    Returns a cached, normalised path from (0, 0) to (1, 0): a cubic Bezier curve sampled with minimum-jerk timing.
+
+    Args:
+        variant (int): Selects the curve shape, from 0 to TEMPLATE_VARIANTS - 1.
+        steps (int): The number of points on the path.
+
+    Returns:
+        np.ndarray: A read-only array of shape (steps, 2).
+    """
+    rng = np.random.default_rng(variant)
+    control = np.array([
+        [0.0, 0.0],
+        [rng.uniform(0.2, 0.45), rng.normal(0, CURVATURE)],
+        [rng.uniform(0.55, 0.8), rng.normal(0, CURVATURE)],
+        [1.0, 0.0],
+    ])
+    s = minimum_jerk(steps)[:, None]
+    path = (
+        (1 - s) ** 3 * control[0]
+        + 3 * (1 - s) ** 2 * s * control[1]
+        + 3 * (1 - s) * s ** 2 * control[2]
+        + s ** 3 * control[3]
+    )
+    path.setflags(write=False)
+    return path
+
+
+def build_path(
+    start: Tuple[float, float],
+    end: Tuple[float, float],
+    viewport: Tuple[int, int],
+    steps: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Builds a curved, human-like path between two viewport points, kept inside the viewport.
+
+    Args:
+        start (Tuple[float, float]): The starting point.
+        end (Tuple[float, float]): The end point.
+        viewport (Tuple[int, int]): The viewport width and height.
+        steps (int, optional): The number of points. Defaults to one per ~20 px, between MIN_PATH_STEPS and
+            MAX_PATH_STEPS.
+
+    Returns:
+        np.ndarray: Integer points of shape (steps, 2), ending exactly at `end`.
+    """
+    start_point = np.asarray(start, dtype=float)
+    end_point = np.asarray(end, dtype=float)
+    delta = end_point - start_point
+    distance = float(np.hypot(*delta))
+    if steps is None:
+        steps = int(min(max(distance / 20, MIN_PATH_STEPS), MAX_PATH_STEPS))
+
+    template = path_template(random.randrange(TEMPLATE_VARIANTS), steps)
+    if random.random() < 0.5:
+        template = template * np.array([1.0, -1.0])
+
+    # Scale and rotate the unit template onto the start -> end segment
+    angle = math.atan2(delta[1], delta[0])
+    rotation = np.array([[math.cos(angle), -math.sin(angle)], [math.sin(angle), math.cos(angle)]])
+    path = start_point + (template * distance) @ rotation.T
+    path[1:-1] += np.random.normal(0, TREMOR, size=(steps - 2, 2)) if steps > 2 else 0
+    path[-1] = end_point
+
+    upper = np.array([viewport[0] - 1, viewport[1] - 1])
+    return np.clip(np.rint(path), 0, upper).astype(int)
+
+
+def movement_time(distance: float, target_width: float = 20) -> float:
+    """
+    Returns a human movement time for a distance and target size, following Fitts's law with some noise.
+
+    Args:
+        distance (float): The distance in pixels.
+        target_width (float, optional): The target's size in pixels. Defaults to 20.
+
+    Returns:
+        float: The movement time in seconds.
+    """
+    return (FITTS_A + FITTS_B * math.log2(1 + distance / max(target_width, 1))) * random.uniform(0.85, 1.2)
+
+
+class PointerPlan:
+    """
+    Accumulates pointer moves, pauses, clicks and key taps into one W3C actions payload, sent with a single
+    `perform()`.
+
+    The key device is padded with pauses so both devices stay on the same ticks.
+    """
+
+    def __init__(self, driver: WebDriver, viewport: Tuple[int, int], start: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Initialise the PointerPlan.
+
+        Args:
+            driver (WebDriver): The WebDriver instance.
+            viewport (Tuple[int, int]): The viewport width and height.
+            start (Tuple[int, int], optional): The pointer position. Defaults to the last position sent to the driver,
+                or a random point in the viewport.
+        """
+        self.driver = driver
+        self.viewport = viewport
+        self.builder = ActionBuilder(driver)
+        self.position = start or _pointer_positions.get(driver) or (
+            random.randrange(viewport[0]), random.randrange(viewport[1])
+        )
+        self.position = tuple(int(min(max(v, 0), limit - 1)) for v, limit in zip(self.position, viewport))
+
+    def _pointer_tick(self) -> None:
+        self.builder.key_action.pause(0)
+
+    def move_to(self, point: Tuple[float, float], duration: Optional[float] = None, target_width: float = 20) -> None:
+        """
+        Moves the pointer along a human-like path to a viewport point.
+
+        Args:
+            point (Tuple[float, float]): The destination.
+            duration (float, optional): Seconds for the whole movement. Defaults to Fitts's law.
+            target_width (float, optional): The target's size in pixels, for Fitts's law. Defaults to 20.
+        """
+        path = build_path(self.position, point, self.viewport)
+        if duration is None:
+            duration = movement_time(float(np.hypot(*(np.asarray(point) - self.position))), target_width)
+        step_ms = max(int(duration * 1000 / len(path)), 1)
+        for x, y in path:
+            self.builder.pointer_action.source.create_pointer_move(duration=step_ms, x=int(x), y=int(y),
+                                                                   origin="viewport")
+            self._pointer_tick()
+        self.position = (int(path[-1][0]), int(path[-1][1]))
+
+    def wander(self, count: int, radius: float = 150, pause: bool = True) -> None:
+        """
+        Moves the pointer through random nearby points inside the viewport, pausing briefly at each.
+
+        Args:
+            count (int): The number of points to visit.
+            radius (float, optional): The maximum distance of each point from the previous one. Defaults to 150.
+            pause (bool, optional): Whether to pause at each point. Defaults to True.
+        """
+        for _ in range(count):
+            x = self.position[0] + random.uniform(-radius, radius)
+            y = self.position[1] + random.uniform(-radius, radius)
+            self.move_to((min(max(x, 0), self.viewport[0] - 1), min(max(y, 0), self.viewport[1] - 1)))
+            if pause:
+                self.pause(random.uniform(0.05, 0.4))
+
+    def pause(self, seconds: float) -> None:
+        """
+        Holds the pointer still.
+
+        Args:
+            seconds (float): The pause length.
+        """
+        self.builder.pointer_action.pause(seconds)
+        self._pointer_tick()
+
+    def click(self, hold: Optional[float] = None) -> None:
+        """
+        Presses and releases the left button at the current position.
+
+        Args:
+            hold (float, optional): Seconds the button is held. Defaults to a human 50-150 ms.
+        """
+        self.builder.pointer_action.pointer_down()
+        self._pointer_tick()
+        self.pause(random.uniform(0.05, 0.15) if hold is None else hold)
+        self.builder.pointer_action.pointer_up()
+        self._pointer_tick()
+
+    def key_tap(self, key: str) -> None:
+        """
+        Presses and releases a key while the pointer is still.
+
+        Args:
+            key (str): The key to tap.
+        """
+        for action in (self.builder.key_action.key_down, self.builder.key_action.key_up):
+            action(key)
+            self.builder.pointer_action.pause(0)
+
+    def perform(self) -> None:
+        """
+        Sends the whole plan to the browser in one round trip.
+        """
+        self.builder.perform()
+        _pointer_positions[self.driver] = self.position
+
+
+def viewport_size(driver: WebDriver) -> Tuple[int, int]:
+    """
+    Returns the viewport's width and height in CSS pixels.
+
+    Args:
+        driver (WebDriver): The WebDriver instance.
+
+    Returns:
+        Tuple[int, int]: The viewport width and height.
+    """
+    width, height = driver.execute_script("return [window.innerWidth, window.innerHeight];")
+    return int(width), int(height)
+
+
+def click_fraction() -> Tuple[float, float]:
+    """
+    Picks a human-like click position within an element, as fractions of its width and height: near its centre,
+    rarely at its edges.
+
+    Returns:
+        Tuple[float, float]: The horizontal and vertical fractions, between 0.1 and 0.9.
+    """
+    return min(max(random.gauss(0.5, 0.15), 0.1), 0.9), min(max(random.gauss(0.5, 0.15), 0.1), 0.9)
+
+
+def click_geometry(driver: WebDriver, element: WebElement, candidates: int = CLICK_CANDIDATES) -> Dict[str, Any]:
+    """
+    Returns an element's viewport rectangle and the viewport size in one round trip, scrolling it into view if needed.
+
+    Human-like click points are hit-tested with `elementFromPoint` in the same round trip, and the first one that
+    would reach the element rather than an overlay is returned; the exact centre is tried last.
+
+    Args:
+        driver (WebDriver): The WebDriver instance.
+        element (WebElement): The element.
+        candidates (int, optional): The number of random points to try. Defaults to CLICK_CANDIDATES.
+
+    Returns:
+        Dict[str, Any]: The keys x, y, width, height, viewportWidth and viewportHeight, point, the clickable point or
+            None, and blocker, a description of the element covering a missed point or None.
+    """
+    fractions = [click_fraction() for _ in range(candidates)] + [(0.5, 0.5)]
+    return driver.execute_script(CLICK_GEOMETRY_SCRIPT, element, fractions)
+
+
+def click_point(geometry: Dict[str, Any]) -> Tuple[int, int]:
+    """
+    Returns the hit-tested click point from click_geometry.
+
+    Args:
+        geometry (Dict[str, Any]): The geometry returned by click_geometry.
+
+    Returns:
+        Tuple[int, int]: The viewport point.
+
+    Raises:
+        ElementClickInterceptedException: If another element covers every candidate point.
+    """
+    if geometry.get("point") is None:
+        blocker = geometry.get("blocker") or "another element"
+        raise ElementClickInterceptedException(f"Element click intercepted: {blocker} covers every sampled point.")
+    x, y = geometry["point"]
+    return int(x), int(y)
@@ -3,12 +3,12 @@ This script provides several methods for simulating human behavior in browser au
 """
 
 import logging
+import math
 import random
-import time
-from typing import Optional, Tuple, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple, Union
 
-from selenium.common.exceptions import (MoveTargetOutOfBoundsException,
-                                        StaleElementReferenceException,
+from selenium.common.exceptions import (StaleElementReferenceException,
                                         TimeoutException)
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
@@ -18,8 +18,53 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import WebDriverWait
 
+from orb.spinner.trajectory import (PointerPlan, click_geometry, click_point,
+                                    viewport_size)
+
 log = logging.getLogger(__name__)
 
+# Lognormal keystroke timing: medians in seconds and log-space spread
+KEY_HOLD_MEDIAN = 0.08
+KEY_HOLD_SIGMA = 0.25
+KEY_GAP_SIGMA = 0.35
+# Gaps after word and sentence boundaries, the keys below, are stretched by this factor
+BOUNDARY_KEYS = " .,;:!?\n"
+BOUNDARY_GAP_FACTOR = 2.0
+# Longest stretch of typing sent as one actions payload, well inside the WebDriver client's 120 s command timeout
+ACTIONS_CHUNK_SECONDS = 30
+
+# Focuses an element the way typing into it with send_keys does, without a click, and puts the caret at the end
+FOCUS_SCRIPT = """
+const element = arguments[0];
+element.focus();
+if (element.isContentEditable) {
+    const range = document.createRange();
+    range.selectNodeContents(element);
+    range.collapse(false);
+    const selection = window.getSelection();
+    selection.removeAllRanges();
+    selection.addRange(range);
+} else if (typeof element.value === "string") {
+    try {
+        element.setSelectionRange(element.value.length, element.value.length);
+    } catch (e) {
+        // Inputs such as type="email" or "number" have no selection to move
+    }
+}
+"""
+
+# Runs action payloads for callers that do not wait for the browser to finish
+_action_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="orb-actions")
+
+
+class Keystroke(NamedTuple):
+    """
+    One key press in a typing plan: the key, how long it is held and the pause before the next key, in seconds.
+    """
+    key: str
+    hold: float
+    gap: float
+
 
 def get_user_agent(driver: WebDriver) -> str:
     """
@@ -34,61 +79,165 @@ def get_user_agent(driver: WebDriver) -> str:
     return driver.execute_script('return window.navigator.userAgent')
 
 
+def keystroke_plan(text: str, delay: Optional[float] = None, send_keys: bool = False) -> List[Keystroke]:
+    """
+    Plan human-like timings for typing a text.
+
+    Hold times and gaps between keys are drawn from lognormal distributions, as measured for human typists, with
+    longer gaps after spaces and punctuation.
+
+    Args:
+        text (str): The text to be typed.
+        delay (float, optional): The median gap between keys. Defaults to a value drawn per call between 0.1 and
+            0.5 seconds.
+        send_keys (bool, optional): Whether to finish with an "Enter" key press. Defaults to False.
+
+    Returns:
+        List[Keystroke]: The keystrokes in order.
+    """
+    if delay is None:
+        delay = random.uniform(0.1, 0.5)
+    gap_mu = math.log(max(delay, 1e-3))
+    hold_mu = math.log(KEY_HOLD_MEDIAN)
+
+    keys = list(text) + ([Keys.ENTER] if send_keys else [])
+    plan = []
+    for key in keys:
+        gap = random.lognormvariate(gap_mu, KEY_GAP_SIGMA)
+        if key in BOUNDARY_KEYS:
+            gap *= BOUNDARY_GAP_FACTOR
+        plan.append(Keystroke(key=key, hold=random.lognormvariate(hold_mu, KEY_HOLD_SIGMA), gap=gap))
+    return plan
+
+
+def focus_element(element: WebElement) -> None:
+    """
+    Focus an element and put the caret at the end of its value, as send_keys does, without clicking it.
+
+    Args:
+        element (WebElement): The element to focus.
+    """
+    element.parent.execute_script(FOCUS_SCRIPT, element)
+
+
+def keystroke_chunks(plan: List[Keystroke], max_seconds: float = ACTIONS_CHUNK_SECONDS) -> List[List[Keystroke]]:
+    """
+    Split a typing plan into consecutive runs that each take at most `max_seconds` to type.
+
+    Args:
+        plan (List[Keystroke]): The keystrokes in order.
+        max_seconds (float, optional): The longest run in seconds. Defaults to ACTIONS_CHUNK_SECONDS.
+
+    Returns:
+        List[List[Keystroke]]: The runs in order. A single keystroke longer than `max_seconds` is a run of its own.
+    """
+    chunks: List[List[Keystroke]] = []
+    chunk: List[Keystroke] = []
+    seconds = 0.0
+    for keystroke in plan:
+        duration = keystroke.hold + keystroke.gap
+        if chunk and seconds + duration > max_seconds:
+            chunks.append(chunk)
+            chunk, seconds = [], 0.0
+        chunk.append(keystroke)
+        seconds += duration
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
 def slow_type(
     element: WebElement,
     text: str,
-    delay: Union[float, int] = random.uniform(0.1, 0.5),
-    send_keys: bool = False
-):
+    delay: Optional[Union[float, int]] = None,
+    send_keys: bool = False,
+    wait: bool = True,
+) -> Optional[Future]:
     """
-    Simulate human-like typing by sending text to an element character by character with a delay.
+    Simulate human-like typing into an element with per-key randomised timing.
+
+    The keystroke sequence, including its pauses, is compiled into W3C Actions payloads executed by the browser, one
+    round trip per ACTIONS_CHUNK_SECONDS of typing so long texts stay within the command timeout.
 
     Args:
-        element (WebElement): The target element to type into.
+        element (WebElement): The target element to type into. It is focused first, with the caret at the end of
+            its value, without clicking it.
         text (str): The text to be typed.
-        delay (Union[float, int], optional): The delay between each character typing. Defaults to a random value
-            between 0.1 and 0.5 seconds.
+        delay (Union[float, int], optional): The median delay between keystrokes. Defaults to a random value between
+            0.1 and 0.5 seconds, drawn per call.
         send_keys (bool, optional): Whether to send an "Enter" key press after typing. Defaults to False.
+        wait (bool, optional): Whether to block until the browser has finished typing. If False, the payload runs on
+            a background thread; send no other commands to the driver until the returned future is done.
+            Defaults to True.
+
+    Returns:
+        Optional[Future]: Without `wait`, a future resolving once typing is done.
     """
-    for character in text:
-        element.send_keys(character)
-        time.sleep(delay)
+    focus_element(element)
+    payloads = []
+    for chunk in keystroke_chunks(keystroke_plan(text, delay=delay, send_keys=send_keys)):
+        actions = ActionChains(element.parent)
+        for keystroke in chunk:
+            actions.key_down(keystroke.key)
+            actions.pause(keystroke.hold)
+            actions.key_up(keystroke.key)
+            actions.pause(keystroke.gap)
+        payloads.append(actions)
+
+    def perform() -> None:
+        for actions in payloads:
+            actions.perform()
 
-    if send_keys:
-        element.send_keys(Keys.ENTER)
+    if wait:
+        perform()
+        return None
+    return _action_executor.submit(perform)
 
 
 def human_clicking(
     driver: WebDriver,
     target_element: WebElement,
-    random_clicking: bool = True
+    random_clicking: bool = True,
+    num_movements: Optional[int] = None,
 ):
     """
     Imitate human behavior when clicking in browser automation.
 
+    The pointer wanders, then travels along a curved minimum-jerk path to a point near the element's centre and
+    clicks it. The point is hit-tested in the page first, so an overlay covering it is detected instead of clicked.
+    The element's position is read in one script call and the whole movement and click are sent as one actions
+    payload, so a click costs two round trips however long the path.
+
     Args:
         driver (WebDriver): The WebDriver instance.
         target_element (WebElement): The element to click.
-        random_clicking (bool, optional): If True, include random mouse movements. Defaults to True.
-    """
+        random_clicking (bool, optional): If True, include random mouse movements and key taps before the click.
+            Defaults to True.
+        num_movements (int, optional): The number of random movements. Defaults to 1-3 when random_clicking is set.
 
-    actions = ActionChains(driver)
+    Raises:
+        ElementClickInterceptedException: If another element, such as an overlay, covers every sampled click point.
+    """
+    geometry = click_geometry(driver, target_element)
+    point = click_point(geometry)
+    plan = PointerPlan(driver, viewport=(geometry["viewportWidth"], geometry["viewportHeight"]))
 
-    # Pause before clicking
-    actions.pause(random.random())
+    plan.pause(random.random())
+    if random_clicking:
+        _random_movements(plan, random.randint(1, 3) if num_movements is None else num_movements)
 
-    perform_random_mouse_movements(
-        driver=driver, random_clicking=random_clicking
-    )
+    plan.move_to(point, target_width=min(geometry["width"], geometry["height"]))
+    plan.pause(random.uniform(0.05, 0.3))
+    plan.click()
+    plan.perform()
 
-    actions.move_to_element_with_offset(
-        target_element, random.uniform(0, 3), random.uniform(0, 3)
-    )
-    actions.pause(random.random())
 
-    actions.perform()
-    target_element.click()
-    actions.reset_actions()
+def _random_movements(plan: PointerPlan, num_movements: int, key_taps: bool = True) -> None:
+    for _ in range(num_movements):
+        plan.wander(1)
+        # 40% chance of a null key press, simulating an idle key press
+        if key_taps and random.random() < 0.4:
+            plan.key_tap(Keys.NULL)
 
 
 def perform_random_mouse_movements(
@@ -99,32 +248,16 @@ def perform_random_mouse_movements(
     """
     Perform random mouse movements within the browser window.
 
+    The movements follow curved paths kept inside the viewport and are sent to the browser as one actions payload.
+
     Args:
         driver (WebDriver): The WebDriver instance.
         num_movements (int, optional): The number of random mouse movements to perform. Defaults to 5.
+        random_clicking (bool, optional): If True, randomly tap a null key between movements. Defaults to True.
     """
-    actions = ActionChains(driver)
-
-    for _ in range(num_movements):
-        try:
-            # Perform a random mouse movement by moving to a random offset
-            actions.move_by_offset(
-                random.uniform(-30, 30), random.uniform(-30, 30)
-            )
-            actions.perform()
-
-            # Pause briefly after each movement
-            actions.pause(random.uniform(0.5, 1.5))
-        except MoveTargetOutOfBoundsException:
-            continue
-
-        # 40% chance of key press
-        if random.random() < 0.4 and random_clicking:
-            actions.send_keys(Keys.NULL)  # Press a null key to simulate random key press
-            actions.perform()
-
-        # Reset actions for the next movement
-        actions.reset_actions()
+    plan = PointerPlan(driver, viewport=viewport_size(driver))
+    _random_movements(plan, num_movements, key_taps=random_clicking)
+    plan.perform()
 
 
 def window_scroll(driver: WebDriver, scroll_range: tuple = (0, 100)):
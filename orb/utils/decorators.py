@@ -2,23 +2,97 @@
 This script hosts several decorators that can be used for error handeling methods.
 """
 
+import asyncio
+import builtins
+import contextvars
 import functools
-import signal
+import random
+import threading
 import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple, Type
 
 from orb import log
 
+# Monotonic deadline of the innermost active timeout, inherited by nested calls, threads started with a copied
+# context and asyncio tasks
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("orb_deadline", default=None)
 
-class TimeoutError(Exception):
-    ...
 
+class TimeoutError(builtins.TimeoutError):
+    """
+    Raised when a call exceeds its timeout. Subclasses the builtin TimeoutError, so either can be caught.
+    """
+
+
+def remaining() -> Optional[float]:
+    """
+    Returns the seconds left before the innermost active deadline.
+
+    Returns:
+        Optional[float]: The seconds left, possibly negative, or None if no deadline is active.
+    """
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def check_deadline(error_message: str = "Deadline exceeded") -> None:
+    """
+    Raises if the innermost active deadline has passed. Long-running loops call this to stop cooperatively.
+
+    Args:
+        error_message (str, optional): The error message to raise. Defaults to "Deadline exceeded".
+
+    Raises:
+        TimeoutError: If the deadline has passed.
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise TimeoutError(error_message)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Context manager that sets a deadline for the enclosed code, never extending an outer one.
 
-def timeout(seconds: int = 10, error_message: str = "Function took too long, exiting"):
+    The deadline is cooperative: nothing is interrupted, but `remaining` and `check_deadline` see it, as do nested
+    `timeout` calls.
+
+    Args:
+        seconds (float): Seconds from now.
+
+    Yields:
+        float: The effective monotonic deadline.
     """
-    Decorator that adds a timeout to a function.
+    effective = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        effective = min(effective, outer)
+    token = _deadline.set(effective)
+    try:
+        yield effective
+    finally:
+        _deadline.reset(token)
+
+
+def timeout(seconds: float = 10, error_message: str = "Function took too long, exiting"):
+    """
+    Decorator that adds a timeout to a function or coroutine function.
+
+    Works from any thread, in any process and inside asyncio, with sub-second resolution. A coroutine function is
+    wrapped in `asyncio.wait_for` and cancelled on timeout.
+
+    A synchronous function runs on a worker thread that the caller stops waiting for once the deadline passes. The
+    function itself is NOT stopped: it keeps running in the abandoned thread, with all of its side effects, until it
+    returns. To make it end at the deadline, it must be cooperative: call `check_deadline` in loops and pass
+    `remaining()` as the timeout of anything that blocks, e.g. `subprocess.run(..., timeout=remaining())`. Callers
+    should not retry a timed-out call that is not cooperative, as the retry would race the abandoned one.
+
+    The deadline propagates: nested timeouts never outlive the enclosing one and `remaining` reports the time left.
 
     Args:
-        seconds (int, optional): The maximum time in seconds allowed for the function to execute. Defaults to 10.
+        seconds (float, optional): The maximum time in seconds allowed for the function to execute. Defaults to 10.
         error_message (str, optional): The error message to raise when the function exceeds the timeout. Defaults to "Function took too long, exiting".
 
     Returns:
@@ -34,6 +108,22 @@ def timeout(seconds: int = 10, error_message: str = "Function took too long, exi
         my_function()  # Call the decorated function
     """
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with deadline(seconds) as effective:
+                    left = effective - time.monotonic()
+                    if left <= 0:
+                        raise TimeoutError(error_message)
+                    try:
+                        return await asyncio.wait_for(func(*args, **kwargs), left)
+                    except TimeoutError:
+                        raise
+                    except (asyncio.TimeoutError, builtins.TimeoutError) as e:
+                        # Before Python 3.11 asyncio.TimeoutError is not the builtin TimeoutError
+                        raise TimeoutError(error_message) from e
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             """
@@ -49,41 +139,221 @@ def timeout(seconds: int = 10, error_message: str = "Function took too long, exi
             Raises:
                 TimeoutError: If the decorated function exceeds the specified timeout.
             """
-            def _handle_timeout(signum, frame):
-                raise TimeoutError(error_message)
+            with deadline(seconds) as effective:
+                left = effective - time.monotonic()
+                if left <= 0:
+                    raise TimeoutError(error_message)
+                context = contextvars.copy_context()
+
+            outcome = {}
+            done = threading.Event()
+
+            def run() -> None:
+                try:
+                    outcome["result"] = context.run(func, *args, **kwargs)
+                except BaseException as e:
+                    outcome["error"] = e
+                finally:
+                    done.set()
 
-            signal.signal(signal.SIGALRM, _handle_timeout)
-            signal.alarm(seconds)
-            try:
-                result = func(*args, **kwargs)
-            finally:
-                signal.alarm(0)
-            return result
+            threading.Thread(target=run, name=f"timeout-{func.__name__}", daemon=True).start()
+            if not done.wait(left):
+                raise TimeoutError(error_message)
+            if "error" in outcome:
+                raise outcome["error"]
+            return outcome["result"]
         return wrapper
     return decorator
 
 
-def retry_on_failure(max_retries: int = 2):
+class RetryBudget:
+    """
+    A thread-safe token bucket shared by retrying functions, capping the retry rate of a whole process.
+
+    Every retry takes one token and tokens refill at a fixed rate, so under a sustained outage workers stop retrying
+    and fail fast instead of multiplying the load.
     """
-    Decorator that retries a function multiple times before giving up.
+
+    def __init__(self, capacity: float = 100, refill_per_second: float = 10) -> None:
+        """
+        Initialise the RetryBudget.
+
+        Args:
+            capacity (float, optional): Maximum tokens held, i.e. the largest burst of retries. Defaults to 100.
+            refill_per_second (float, optional): Tokens added per second. Defaults to 10.
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """
+        Returns the tokens currently available.
+
+        Returns:
+            float: The available tokens.
+        """
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """
+        Takes one token if available.
+
+        Returns:
+            bool: True if a retry may go ahead.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+# Shared by every retry_on_failure that is not given its own budget
+DEFAULT_RETRY_BUDGET = RetryBudget()
+
+
+class RetryStats:
+    """
+    Thread-safe retry counters of one decorated function.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.budget_exhausted = 0
+        self._lock = threading.Lock()
+
+    def increment(self, **counts: int) -> None:
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+    def as_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "failures": self.failures,
+                "budget_exhausted": self.budget_exhausted,
+            }
+
+
+_retry_stats: Dict[str, RetryStats] = {}
+
+
+def retry_metrics() -> Dict[str, Dict[str, int]]:
+    """
+    Returns the retry counters of every function decorated with retry_on_failure in this process.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Counters keyed by the function's qualified name.
+    """
+    return {name: stats.as_dict() for name, stats in _retry_stats.items()}
+
+
+def retry_on_failure(
+    max_retries: int = 2,
+    backoff: float = 0.5,
+    multiplier: float = 2,
+    max_backoff: float = 30,
+    jitter: bool = True,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    give_up_on: Tuple[Type[BaseException], ...] = (),
+    budget: Optional[RetryBudget] = DEFAULT_RETRY_BUDGET,
+):
+    """
+    Decorator that retries a function or coroutine function with exponential backoff before giving up.
+
+    The n-th retry waits up to `backoff * multiplier ** n` seconds, capped at `max_backoff`; with jitter the wait is
+    drawn uniformly from zero to that cap, so workers failing together do not retry together. Only exceptions in
+    `retry_on` and not in `give_up_on` are retried, each retry takes a token from the shared budget, and no retry is
+    started that would overrun an enclosing timeout. Once retries are exhausted the last exception is re-raised.
+
+    Counters are kept in `wrapper.retry_stats` and reported by `retry_metrics`.
 
     Args:
         max_retries (int, optional): The maximum number of retries. Defaults to 2.
+        backoff (float, optional): Base delay in seconds before the first retry. Defaults to 0.5.
+        multiplier (float, optional): Growth factor of the delay per retry. Defaults to 2.
+        max_backoff (float, optional): Maximum delay in seconds. Defaults to 30.
+        jitter (bool, optional): Whether to randomise delays ("full jitter"). Defaults to True.
+        retry_on (Tuple[Type[BaseException], ...], optional): Exceptions that are retried. Defaults to Exception.
+        give_up_on (Tuple[Type[BaseException], ...], optional): Exceptions never retried, even if matched by
+            `retry_on`. Defaults to none.
+        budget (RetryBudget, optional): The token bucket retries draw from. Defaults to the process-wide budget;
+            None disables the budget.
 
     Returns:
         function: The decorated function.
 
     Usage:
-        @retry_on_failure(max_retries=2)
+        @retry_on_failure(max_retries=2, retry_on=(ConnectionError,))
         def my_function():
             # Function code here
-            # If an exception occurs, it will retry the function up to `max_retries` times
+            # If a ConnectionError occurs, it will retry the function up to `max_retries` times
 
     Example:
         my_function()  # Call the decorated function
     """
 
     def decorator_retry(func):
+        stats = _retry_stats[f"{func.__module__}.{func.__qualname__}"] = RetryStats()
+
+        def next_delay(retry: int, error: BaseException) -> Optional[float]:
+            """
+            Returns the delay before the next retry, or None if the error must be re-raised.
+            """
+            if not isinstance(error, retry_on) or isinstance(error, give_up_on) or retry >= max_retries:
+                return None
+            delay = min(max_backoff, backoff * multiplier ** retry)
+            if jitter:
+                delay = random.uniform(0, delay)
+            left = remaining()
+            if left is not None and delay >= left:
+                return None
+            if budget is not None and not budget.try_acquire():
+                stats.increment(budget_exhausted=1)
+                log.warning(f"Retry budget exhausted, not retrying {func.__name__}.")
+                return None
+            log.debug(f"Retry {retry + 1}/{max_retries} of {func.__name__} in {delay:.2f}s after: {error}")
+            stats.increment(retries=1)
+            return delay
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper_retry(*args, **kwargs):
+                stats.increment(calls=1)
+                retry = 0
+                while True:
+                    stats.increment(attempts=1)
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        delay = next_delay(retry, e)
+                        if delay is None:
+                            stats.increment(failures=1)
+                            raise
+                    retry += 1
+                    await asyncio.sleep(delay)
+
+            async_wrapper_retry.retry_stats = stats
+            return async_wrapper_retry
+
         @functools.wraps(func)
         def wrapper_retry(*args, **kwargs):
             """
@@ -94,19 +364,27 @@ def retry_on_failure(max_retries: int = 2):
                 **kwargs: Arbitrary keyword arguments.
 
             Returns:
-                The result of the decorated function if successful, or None if retries are exhausted.
+                The result of the decorated function if successful.
 
             Raises:
-                Exception: If the decorated function raises an exception after all retries are exhausted.
+                Exception: The last exception raised by the decorated function once retries are exhausted, or the
+                    first one that is not retryable.
             """
-            retries = 0
-            while retries <= max_retries:
+            stats.increment(calls=1)
+            retry = 0
+            while True:
+                stats.increment(attempts=1)
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    log.debug(f"Retry {retries+1}/{max_retries+1} failed: {e}")
-                    retries += 1
-                    time.sleep(1)  # Delay between retries
-            log.error(f"Function {func.__name__} failed after {max_retries+1} retries.")
+                    delay = next_delay(retry, e)
+                    if delay is None:
+                        stats.increment(failures=1)
+                        log.error(f"Function {func.__name__} failed after {retry + 1} attempts: {e}")
+                        raise
+                retry += 1
+                time.sleep(delay)
+
+        wrapper_retry.retry_stats = stats
         return wrapper_retry
     return decorator_retry
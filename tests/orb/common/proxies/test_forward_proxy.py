@@ -0,0 +1,145 @@
+import socket
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from orb.common.proxies.forward_proxy import ForwardProxy, spawn_forward_proxy
+from orb.common.proxies.proxy_pool import ProxyPool
+
+
+class _OriginHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path == '/early-hints':
+            self.wfile.write(b'HTTP/1.1 103 Early Hints\r\nLink: </style.css>; rel=preload\r\n\r\n')
+        body = f"origin:{self.path}".encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ForwardProxyTests(unittest.TestCase):
+    """
+    Offline tests for the ForwardProxy, using a local origin server and a second ForwardProxy as the upstream.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.origin = ThreadingHTTPServer(('127.0.0.1', 0), _OriginHandler)
+        cls.origin_address = f"127.0.0.1:{cls.origin.server_address[1]}"
+        threading.Thread(target=cls.origin.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.origin.shutdown()
+        cls.origin.server_close()
+
+    def get(self, proxy: ForwardProxy, path: str = '/page?x=1') -> requests.Response:
+        proxies = {'http': f"http://{proxy.address}"}
+        return requests.get(f"http://{self.origin_address}{path}", proxies=proxies, timeout=5)
+
+    def connect(self, proxy: ForwardProxy) -> bytes:
+        host, port = proxy.address.split(':')
+        with socket.create_connection((host, int(port)), timeout=5) as sock:
+            sock.sendall(f"CONNECT {self.origin_address} HTTP/1.1\r\nHost: {self.origin_address}\r\n\r\n".encode())
+            reply = sock.recv(1024)
+            sock.sendall(f"GET /tunnel HTTP/1.1\r\nHost: {self.origin_address}\r\nConnection: close\r\n\r\n".encode())
+            response = b""
+            while chunk := sock.recv(4096):
+                response += chunk
+        return reply + response
+
+    def test_direct_http(self):
+        with ForwardProxy() as proxy:
+            response = self.get(proxy)
+        self.assertEqual(response.text, 'origin:/page?x=1')
+
+    def test_direct_connect(self):
+        with ForwardProxy() as proxy:
+            response = self.connect(proxy)
+        self.assertIn(b'200 Connection Established', response)
+        self.assertIn(b'origin:/tunnel', response)
+
+    def test_start_raises_when_port_in_use(self):
+        with ForwardProxy() as proxy:
+            with self.assertRaises(OSError):
+                ForwardProxy(port=proxy.port).start(timeout=5)
+
+    def test_relays_through_upstream(self):
+        with ForwardProxy() as upstream, ForwardProxy(upstream=upstream.address) as proxy:
+            self.assertEqual(self.get(proxy).text, 'origin:/page?x=1')
+            self.assertIn(b'origin:/tunnel', self.connect(proxy))
+
+    def test_set_upstream(self):
+        with ForwardProxy(upstream='127.0.0.1:1') as proxy:
+            self.assertEqual(self.get(proxy).status_code, 502)
+            with ForwardProxy() as upstream:
+                proxy.set_upstream(upstream.address)
+                self.assertEqual(self.get(proxy).text, 'origin:/page?x=1')
+
+    def test_request_rotation_skips_dead_upstream(self):
+        with ForwardProxy() as live:
+            pool = ProxyPool(fetcher=lambda: ['127.0.0.1:1', live.address])
+            with ForwardProxy(pool=pool, rotation='request') as proxy:
+                for _ in range(4):
+                    self.assertEqual(self.get(proxy).text, 'origin:/page?x=1')
+                    self.assertIn(b'origin:/tunnel', self.connect(proxy))
+        self.assertGreater(pool.health.get(live.address).success_rate, 0.9)
+        self.assertLess(pool.health.get('127.0.0.1:1').success_rate, 1.0)
+
+    def test_session_rotation_is_sticky(self):
+        with ForwardProxy() as first, ForwardProxy() as second:
+            pool = ProxyPool(fetcher=lambda: [first.address, second.address])
+            with ForwardProxy(pool=pool, rotation='session') as proxy:
+                for session in ('a', 'a', 'b'):
+                    proxies = {'http': f"http://{session}:x@{proxy.address}"}
+                    response = requests.get(f"http://{self.origin_address}/", proxies=proxies, timeout=5)
+                    self.assertEqual(response.status_code, 200)
+                self.assertEqual(set(proxy._sessions), {'a', 'b'})
+                sticky = proxy._sessions['a']
+                self.assertIsNotNone(pool.health.get(sticky).ewma_latency)
+
+                proxy.rotate('a')
+                self.assertNotIn('a', proxy._sessions)
+
+    def test_reuses_upstream_connections(self):
+        with ForwardProxy() as proxy, requests.Session() as session:
+            session.proxies = {'http': f"http://{proxy.address}"}
+            for _ in range(3):
+                self.assertEqual(session.get(f"http://{self.origin_address}/").text, 'origin:/')
+            self.assertEqual(len(proxy._idle[self.origin_address]), 1)
+
+    def test_interim_responses_are_relayed(self):
+        with ForwardProxy() as proxy:
+            host, port = proxy.address.split(':')
+            with socket.create_connection((host, int(port)), timeout=5) as sock:
+                sock.sendall(f"GET http://{self.origin_address}/early-hints HTTP/1.1\r\n"
+                             f"Host: {self.origin_address}\r\n\r\n".encode())
+                response = b""
+                while b'origin:/early-hints' not in response:
+                    response += sock.recv(4096)
+            self.assertIn(b'103 Early Hints', response)
+            self.assertIn(b'200 OK', response)
+            # The pooled upstream connection carries no leftover response
+            self.assertEqual(self.get(proxy, '/next').text, 'origin:/next')
+
+    def test_subprocess(self):
+        process, address = spawn_forward_proxy(direct=True)
+        try:
+            proxies = {'http': f"http://{address}"}
+            response = requests.get(f"http://{self.origin_address}/sub", proxies=proxies, timeout=5)
+            self.assertEqual(response.text, 'origin:/sub')
+        finally:
+            process.terminate()
+            process.wait(timeout=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
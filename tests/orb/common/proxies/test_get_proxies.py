@@ -7,6 +7,8 @@ import requests
 from bs4 import BeautifulSoup, Tag
 
 from orb.common.proxies.get_proxies import GetProxies
+from orb.common.proxies.parser import (FEED_CHUNK_SIZE, ProxyTableParser,
+                                       parse_proxy_columns)
 
 log = logging.getLogger(__name__)
 
@@ -39,16 +41,40 @@ class GetProxiesTests(unittest.TestCase):
             self.assertIsInstance(table_html, Tag)
             self.assertEqual(str(table_html), '<table></table>')
 
+    PROXY_PAGE = (
+        '<html><body><table><thead><tr><th>IP Address</th><th>Port</th><th>Https</th><th>Last Checked</th></tr>'
+        '</thead><tbody><tr><td>1.2.3.4</td><td>8080</td><td>yes</td><td>5 secs ago</td></tr>'
+        '<tr><td>5.6.7.8</td><td>8888</td><td>no</td><td>1 hour 2 mins ago</td></tr></tbody></table>'
+        '<table><tr><td>ignored</td></tr></table></body></html>'
+    )
+
     def test_return_proxy_table(self):
-        with patch.object(self.getproxies, 'extract_table_html') as mock_extract:
-            soup = BeautifulSoup('<table><thead><tr><th>IP</th><th>Port</th></tr></thead><tbody><tr><td>1.2.3.4</td><td>8080</td></tr><tr><td>5.6.7.8</td><td>8888</td></tr></tbody></table>', 'html.parser')
-            mock_extract.return_value = soup
+        with patch.object(self.getproxies, 'request_proxies') as mock_request:
+            mock_request.return_value = MagicMock(
+                text='<table><thead><tr><th>IP</th><th>Port</th></tr></thead><tbody><tr><td>1.2.3.4</td>'
+                     '<td>8080</td></tr><tr><td>5.6.7.8</td><td>8888</td></tr></tbody></table>'
+            )
             proxy_table = self.getproxies.return_proxy_table(https_only=False)
-            print(proxy_table)  # Added print statement
-            print(proxy_table.shape)  # Added print statement
             self.assertIsInstance(proxy_table, pd.DataFrame)
             self.assertEqual(proxy_table.shape, (2, 2))
 
+    def test_return_proxy_table_typed(self):
+        with patch.object(self.getproxies, 'request_proxies') as mock_request:
+            mock_request.return_value = MagicMock(text=self.PROXY_PAGE)
+            proxy_table = self.getproxies.return_proxy_table(https_only=True)
+            self.assertEqual(list(proxy_table['IP_ADDRESS']), ['1.2.3.4'])
+            self.assertEqual(proxy_table['PORT'].iloc[0], 8080)
+            self.assertEqual(proxy_table['HTTPS'].dtype, bool)
+            self.assertTrue(pd.api.types.is_datetime64_any_dtype(proxy_table['LAST_CHECKED']))
+
+    def test_return_proxy_records(self):
+        with patch.object(self.getproxies, 'request_proxies') as mock_request:
+            mock_request.return_value = MagicMock(text=self.PROXY_PAGE)
+            records = self.getproxies.return_proxy_records(https_only=False)
+            self.assertEqual([(r.ip_address, r.port, r.https) for r in records],
+                             [('1.2.3.4', 8080, True), ('5.6.7.8', 8888, False)])
+            self.assertGreater(records[0].last_checked, records[1].last_checked)
+
     def test_build_proxy_dict(self):
         with patch.object(self.getproxies, 'return_proxy_table') as mock_return:
             df = pd.DataFrame({'IP_ADDRESS': ['1.2.3.4'], 'PORT': ['8080'], 'HTTPS': ['yes']})
@@ -56,6 +82,42 @@ class GetProxiesTests(unittest.TestCase):
             self.getproxies.build_proxy_dict()
             self.assertEqual(self.getproxies.proxies, {'http': '1.2.3.4:8080', 'https': '1.2.3.4:8080'})
 
+    def test_return_proxy_addresses(self):
+        with patch.object(self.getproxies, 'return_proxy_table') as mock_return:
+            df = pd.DataFrame({'IP_ADDRESS': ['1.2.3.4', '5.6.7.8'], 'PORT': ['8080', '8888'], 'HTTPS': ['yes', 'yes']})
+            mock_return.return_value = df
+            self.assertEqual(self.getproxies.return_proxy_addresses(), ['1.2.3.4:8080', '5.6.7.8:8888'])
+
+    def test_return_proxy_addresses_skips_missing_ports(self):
+        page = self.PROXY_PAGE.replace('<td>8888</td><td>no</td>', '<td>n/a</td><td>yes</td>')
+        with patch.object(self.getproxies, 'request_proxies') as mock_request:
+            mock_request.return_value = MagicMock(text=page)
+            self.assertEqual(self.getproxies.return_proxy_addresses(), ['1.2.3.4:8080'])
+
+    def test_typed_paths_skip_the_same_bad_ports(self):
+        page = self.PROXY_PAGE.replace('<td>8888</td>', '<td>n/a</td>')
+        with patch.object(self.getproxies, 'request_proxies') as mock_request:
+            mock_request.return_value = MagicMock(text=page)
+            records = self.getproxies.return_proxy_records(https_only=False)
+            proxy_table = self.getproxies.return_proxy_table(https_only=False)
+        self.assertEqual([(r.ip_address, r.port) for r in records], [('1.2.3.4', 8080)])
+        valid = proxy_table.dropna(subset=['PORT'])
+        self.assertEqual(list(zip(valid['IP_ADDRESS'], valid['PORT'])), [('1.2.3.4', 8080)])
+
+    def test_parsing_stops_after_the_table(self):
+        page = self.PROXY_PAGE + '<p>filler</p>' * (FEED_CHUNK_SIZE // 4)
+        with patch.object(ProxyTableParser, 'feed', autospec=True, side_effect=ProxyTableParser.feed) as feed:
+            columns = parse_proxy_columns(page)
+        self.assertEqual(columns['IP_ADDRESS'], ['1.2.3.4', '5.6.7.8'])
+        feed.assert_called_once()
+
+    def test_proxy_dict_uses_pool(self):
+        pool = MagicMock()
+        pool.get_proxy.return_value = {'http': '5.6.7.8:8888', 'https': '5.6.7.8:8888'}
+        with patch.object(GetProxies, 'proxy_pool', return_value=pool), \
+                patch('orb.common.proxies.test_proxies.requests.get') as mock_get:
+            self.assertEqual(self.getproxies.proxy_dict, {'http': '5.6.7.8:8888', 'https': '5.6.7.8:8888'})
+        mock_get.assert_not_called()
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+from orb.common.proxies.health import ProxyHealth, ProxyHealthRegistry
+
+
+class ProxyHealthTests(unittest.TestCase):
+
+    def test_ewma_latency(self):
+        health = ProxyHealth(alpha=0.5)
+        health.record_success(1.0)
+        health.record_success(2.0)
+        self.assertAlmostEqual(health.ewma_latency, 1.5)
+        self.assertEqual(health.success_rate, 1.0)
+
+    def test_breaker_opens_and_half_opens(self):
+        health = ProxyHealth(failure_threshold=2, cooldown=10)
+        health.record_failure()
+        self.assertEqual(health.state, ProxyHealth.CLOSED)
+        health.record_failure()
+        self.assertEqual(health.state, ProxyHealth.OPEN)
+        self.assertEqual(health.weight(), 0.0)
+
+        with patch('orb.common.proxies.health.time.time', return_value=health.opened_at + 11):
+            self.assertEqual(health.state, ProxyHealth.HALF_OPEN)
+            health.record_failure()
+            self.assertEqual(health.state, ProxyHealth.OPEN)
+
+    def test_half_open_allows_one_probe(self):
+        health = ProxyHealth(failure_threshold=1, cooldown=10)
+        health.record_failure()
+        self.assertFalse(health.acquire())
+
+        with patch('orb.common.proxies.health.time.time', return_value=health.opened_at + 11):
+            self.assertTrue(health.acquire())
+            self.assertFalse(health.acquire())
+            self.assertEqual(health.weight(), 0.0)
+        with patch('orb.common.proxies.health.time.time', return_value=health.opened_at + 22):
+            # A probe that never reported back is given up
+            self.assertTrue(health.acquire())
+
+        health.record_success(0.2)
+        self.assertTrue(health.acquire())
+        self.assertTrue(health.acquire())
+
+    def test_success_closes_breaker(self):
+        health = ProxyHealth(failure_threshold=1)
+        health.record_failure()
+        health.record_success(0.2)
+        self.assertEqual(health.state, ProxyHealth.CLOSED)
+
+
+class ProxyHealthRegistryTests(unittest.TestCase):
+
+    def test_choose_prefers_fast_proxies(self):
+        registry = ProxyHealthRegistry()
+        registry.record_success('fast:80', 0.1)
+        registry.record_success('slow:80', 2.0)
+        picks = Counter(registry.choose(['fast:80', 'slow:80']) for _ in range(500))
+        self.assertGreater(picks['fast:80'], picks['slow:80'] * 5)
+
+    def test_choose_skips_tripped_proxies(self):
+        registry = ProxyHealthRegistry(failure_threshold=1)
+        registry.record_failure('dead:80')
+        self.assertFalse(registry.is_available('dead:80'))
+        picks = {registry.choose(['dead:80', 'new:80']) for _ in range(50)}
+        self.assertEqual(picks, {'new:80'})
+
+    def test_choose_probes_half_open_proxy_once(self):
+        registry = ProxyHealthRegistry(failure_threshold=1, cooldown=10)
+        registry.record_failure('dead:80')
+        opened_at = registry.get('dead:80').opened_at
+        with patch('orb.common.proxies.health.time.time', return_value=opened_at + 11):
+            picks = [registry.choose(['dead:80', 'new:80']) for _ in range(200)]
+            self.assertLessEqual(picks.count('dead:80'), 1)
+            self.assertEqual(registry.get('dead:80').probe_in_flight, 'dead:80' in picks)
+
+    def test_choose_caches_weights_until_health_changes(self):
+        registry = ProxyHealthRegistry(failure_threshold=1, cooldown=10)
+        addresses = ('a:80', 'b:80', 'c:80')
+        with patch.object(registry, 'weights', wraps=registry.weights) as weights:
+            for _ in range(50):
+                registry.choose(addresses)
+            self.assertEqual(weights.call_count, 1)
+
+            registry.record_failure('a:80')
+            picks = {registry.choose(addresses) for _ in range(50)}
+            self.assertEqual(weights.call_count, 2)
+            self.assertNotIn('a:80', picks)
+
+            opened_at = registry.get('a:80').opened_at
+            with patch('orb.common.proxies.health.time.time', return_value=opened_at + 11):
+                # The cooldown ending invalidates the cache on its own
+                picks = [registry.choose(addresses) for _ in range(200)]
+            self.assertEqual(picks.count('a:80'), 1)
+
+    def test_choose_falls_back_when_all_tripped(self):
+        registry = ProxyHealthRegistry(failure_threshold=1)
+        registry.record_failure('dead:80')
+        self.assertEqual(registry.choose(['dead:80']), 'dead:80')
+
+
+if __name__ == '__main__':
+    unittest.main()
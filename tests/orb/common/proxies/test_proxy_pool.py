@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from orb.common.proxies.proxy_pool import ProxyPool
+from orb.common.proxies.test_proxies import ProxyCheck
+
+
+class ProxyPoolTests(unittest.TestCase):
+
+    ADDRESSES = ['1.2.3.4:8080', '5.6.7.8:8888']
+
+    def setUp(self):
+        self.fetcher = MagicMock(return_value=self.ADDRESSES)
+
+    def test_fetches_once(self):
+        pool = ProxyPool(fetcher=self.fetcher, ttl=60)
+        for _ in range(10):
+            self.assertIn(pool.get_address(), self.ADDRESSES)
+        self.fetcher.assert_called_once()
+
+    def test_concurrent_first_calls_fetch_once(self):
+        def slow_fetch():
+            time.sleep(0.1)
+            return self.ADDRESSES
+
+        self.fetcher.side_effect = slow_fetch
+        pool = ProxyPool(fetcher=self.fetcher)
+        threads = [threading.Thread(target=pool.get_address) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+        self.fetcher.assert_called_once()
+
+    def test_validating_refresh_keeps_working_proxies(self):
+        checks = [ProxyCheck(address='5.6.7.8:8888', working=True, latency=0.2)]
+        pool = ProxyPool(fetcher=self.fetcher, validate=True)
+        with patch('orb.common.proxies.proxy_pool.rank_proxies', return_value=checks) as rank:
+            pool.refresh()
+        rank.assert_called_once()
+        self.assertEqual(pool.addresses, ['5.6.7.8:8888'])
+        self.assertAlmostEqual(pool.health.get('5.6.7.8:8888').ewma_latency, 0.2)
+
+    def test_get_proxy(self):
+        pool = ProxyPool(fetcher=MagicMock(return_value=['1.2.3.4:8080']))
+        self.assertEqual(pool.get_proxy(), {'http': '1.2.3.4:8080', 'https': '1.2.3.4:8080'})
+
+    def test_stale_pool_refreshes_in_background(self):
+        pool = ProxyPool(fetcher=self.fetcher, ttl=0)
+        pool.get_address()
+        time.sleep(0.01)
+        self.assertTrue(pool.is_stale)
+
+        self.fetcher.return_value = ['9.9.9.9:3128']
+        self.assertIn(pool.get_address(), self.ADDRESSES)
+        pool._refresh_thread.join(timeout=1)
+        self.assertEqual(pool.addresses, ['9.9.9.9:3128'])
+
+    def test_empty_fetch_keeps_cached_list(self):
+        pool = ProxyPool(fetcher=self.fetcher)
+        pool.refresh()
+        self.fetcher.return_value = []
+        pool.refresh()
+        self.assertEqual(pool.addresses, self.ADDRESSES)
+
+    def test_empty_fetch_without_cache_raises(self):
+        pool = ProxyPool(fetcher=MagicMock(return_value=[]))
+        with self.assertRaises(RuntimeError):
+            pool.get_address()
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, 'proxies.json')
+            ProxyPool(fetcher=self.fetcher, cache_path=cache_path).refresh()
+
+            with open(cache_path) as file:
+                self.assertEqual(json.load(file)['proxies'], self.ADDRESSES)
+
+            fetcher = MagicMock(return_value=[])
+            pool = ProxyPool(fetcher=fetcher, ttl=60, cache_path=cache_path)
+            self.assertIn(pool.get_address(), self.ADDRESSES)
+            fetcher.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
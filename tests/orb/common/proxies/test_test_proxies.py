@@ -1,9 +1,11 @@
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 from typing import Dict
 import requests
 
-from orb.common.proxies.test_proxies import test_proxy
+from orb.common.proxies.test_proxies import (check_proxy, iter_proxy_checks,
+                                             rank_proxies, test_proxy)
 
 
 class TestProxy(unittest.TestCase):
@@ -84,5 +86,50 @@ class TestProxy(unittest.TestCase):
         mock_error.assert_called_with("Unable to connect to the proxy.")
 
 
+class ProxyBatchValidationTests(unittest.TestCase):
+    """
+    Tests for the concurrent proxy validation helpers.
+    """
+
+    DELAYS = {'1.1.1.1:80': 0.05, '2.2.2.2:80': 0.01, '3.3.3.3:80': None}
+
+    def fake_get(self, url, proxies, timeout):
+        delay = self.DELAYS[proxies['https']]
+        if delay is None:
+            raise requests.exceptions.ConnectTimeout()
+        time.sleep(delay)
+        response = MagicMock()
+        response.status_code = 200
+        return response
+
+    @patch('requests.get')
+    def test_check_proxy(self, mock_get):
+        mock_get.side_effect = self.fake_get
+        check = check_proxy('2.2.2.2:80')
+        self.assertTrue(check.working)
+        self.assertGreater(check.latency, 0)
+        self.assertFalse(check_proxy('3.3.3.3:80').working)
+
+    @patch('requests.get')
+    def test_rank_proxies(self, mock_get):
+        mock_get.side_effect = self.fake_get
+        ranked = rank_proxies(self.DELAYS, max_workers=3)
+        self.assertEqual([check.address for check in ranked], ['2.2.2.2:80', '1.1.1.1:80'])
+
+    @patch('requests.get')
+    def test_overall_deadline(self, mock_get):
+        def slow_get(url, proxies, timeout):
+            time.sleep(0.5 if proxies['https'] == 'slow:80' else 0)
+            response = MagicMock()
+            response.status_code = 200
+            return response
+
+        mock_get.side_effect = slow_get
+        start = time.perf_counter()
+        checks = list(iter_proxy_checks(['fast:80', 'slow:80'], max_workers=2, deadline=0.2))
+        self.assertLess(time.perf_counter() - start, 0.45)
+        self.assertEqual([check.address for check in checks], ['fast:80'])
+
+
 if __name__ == '__main__':
     unittest.main()
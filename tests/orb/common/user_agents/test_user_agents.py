@@ -0,0 +1,106 @@
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+from orb.common.user_agents import corpus
+from orb.common.user_agents.header_profiles import (HeaderProfileFactory,
+                                                    build_headers,
+                                                    user_agent_metadata)
+from orb.common.user_agents.user_agents import (GetUserAgent,
+                                                UserAgentCorpus,
+                                                get_user_agent_corpus)
+
+
+class UserAgentCorpusTests(unittest.TestCase):
+
+    def test_uniform_sampling(self):
+        corpus = UserAgentCorpus(['a', 'b', 'c'])
+        self.assertEqual({corpus.random for _ in range(200)}, {'a', 'b', 'c'})
+
+    def test_weighted_sampling(self):
+        corpus = UserAgentCorpus(['common', 'rare'], weights=[0.9, 0.1])
+        picks = Counter(corpus.weighted_random for _ in range(2000))
+        self.assertGreater(picks['common'], picks['rare'] * 4)
+        self.assertGreater(picks['rare'], 0)
+
+    def test_empty_corpus(self):
+        with self.assertRaises(ValueError):
+            UserAgentCorpus([])
+
+    def test_from_fake_useragent(self):
+        corpus = UserAgentCorpus.from_fake_useragent()
+        self.assertGreater(len(corpus), 0)
+        self.assertEqual(len(corpus.browsers), len(corpus))
+
+
+class GetUserAgentTests(unittest.TestCase):
+
+    def test_corpus_is_loaded_once(self):
+        with patch.object(corpus, '_corpus', None), \
+                patch.object(UserAgentCorpus, 'from_fake_useragent', return_value=UserAgentCorpus(['ua'])) as load:
+            get_user_agent_corpus()
+            get_user_agent_corpus()
+            load.assert_called_once()
+
+    def test_headers_dict(self):
+        headers = GetUserAgent().headers_dict
+        self.assertIn(headers['User-Agent'], get_user_agent_corpus().user_agents)
+
+    def test_referer_comes_from_header_profiles(self):
+        user_agent = GetUserAgent()
+        self.assertIn(user_agent.get_random_referer(), user_agent.header_profiles.referer_urls)
+
+
+class HeaderProfileTests(unittest.TestCase):
+
+    CHROME = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+              'Chrome/121.0.0.0 Safari/537.36')
+    EDGE = CHROME + ' Edg/120.0.0.0'
+    IOS_SAFARI = ('Mozilla/5.0 (iPhone; CPU iPhone OS 17_2 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) '
+                  'Version/17.2 Mobile/15E148 Safari/604.1')
+    FIREFOX = 'Mozilla/5.0 (X11; Linux x86_64; rv:122.0) Gecko/20100101 Firefox/122.0'
+
+    def test_chromium_client_hints(self):
+        headers = build_headers(self.CHROME, 'en-US,en;q=0.9')
+        self.assertIn('"Google Chrome";v="121"', headers['sec-ch-ua'])
+        self.assertEqual(headers['sec-ch-ua-platform'], '"Windows"')
+        self.assertEqual(headers['sec-ch-ua-mobile'], '?0')
+        self.assertIn('"Microsoft Edge";v="120"', build_headers(self.EDGE, 'en-US')['sec-ch-ua'])
+
+    def test_non_chromium_has_no_client_hints(self):
+        for user_agent in (self.IOS_SAFARI, self.FIREFOX):
+            headers = build_headers(user_agent, 'en-US')
+            self.assertNotIn('sec-ch-ua', headers)
+            self.assertNotIn('X-Requested-With', headers)
+
+    def test_factory_serves_profiles_by_index(self):
+        factory = HeaderProfileFactory(corpus=UserAgentCorpus([self.CHROME, self.FIREFOX]),
+                                       accept_languages=['en-US', 'fr-FR'])
+        self.assertEqual(len(factory), 4)
+        headers = factory.headers(index=3)
+        self.assertEqual(headers['User-Agent'], self.FIREFOX)
+        self.assertEqual(headers['Accept-Language'], 'fr-FR')
+        self.assertEqual(headers['Sec-Fetch-Site'], 'cross-site' if 'Referer' in headers else 'none')
+
+    def test_user_agent_metadata_matches_client_hints(self):
+        metadata = user_agent_metadata(self.EDGE)
+        self.assertEqual([b['brand'] for b in metadata['brands']], ['Chromium', 'Not(A:Brand', 'Microsoft Edge'])
+        self.assertEqual((metadata['platform'], metadata['platformVersion']), ('Windows', '10.0'))
+        self.assertFalse(metadata['mobile'])
+
+    def test_random_profile_by_engine(self):
+        factory = HeaderProfileFactory(corpus=UserAgentCorpus([self.FIREFOX, self.CHROME, self.IOS_SAFARI]))
+        for _ in range(20):
+            self.assertEqual(factory.random_profile(engine='chromium').user_agent, self.CHROME)
+        with self.assertRaises(ValueError):
+            HeaderProfileFactory(corpus=UserAgentCorpus([self.FIREFOX])).random_profile(engine='chromium')
+
+    def test_jitter_does_not_mutate_profile(self):
+        factory = HeaderProfileFactory(corpus=UserAgentCorpus([self.CHROME]))
+        for _ in range(20):
+            factory.headers(index=0)
+        self.assertNotIn('Referer', factory.profiles[0].headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
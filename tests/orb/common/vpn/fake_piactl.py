@@ -0,0 +1,82 @@
+"""
+A stand-in for piactl used by the PiaVpn tests.
+
+State lives in files inside the directory given as the first argument, and every invocation is appended to a calls
+log so tests can count subprocess calls. Connecting takes CONNECT_DELAY seconds, finished by a detached child; a
+non-empty "hang" file makes `connect` hang instead.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+CONNECT_DELAY = 0.3
+REGIONS = ["us-east", "us-west", "uk-london", "de-berlin", "japan"]
+
+
+def read(directory, name, default=""):
+    try:
+        with open(os.path.join(directory, name)) as file:
+            return file.read().strip()
+    except FileNotFoundError:
+        return default
+
+
+def write(directory, name, value):
+    tmp_path = os.path.join(directory, f"{name}.tmp")
+    with open(tmp_path, "w") as file:
+        file.write(value)
+    os.replace(tmp_path, os.path.join(directory, name))
+
+
+def start_connecting(directory):
+    write(directory, "state", "Connecting")
+    subprocess.Popen([sys.executable, __file__, directory, "_finish_connect"], start_new_session=True)
+
+
+def main(directory, *args):
+    with open(os.path.join(directory, "calls"), "a") as file:
+        file.write(" ".join(args) + "\n")
+
+    state = read(directory, "state", "Disconnected")
+    if args == ("get", "connectionstate"):
+        print(state)
+    elif args == ("monitor", "connectionstate"):
+        last = None
+        while True:
+            state = read(directory, "state", "Disconnected")
+            if state != last:
+                print(state, flush=True)
+                last = state
+            time.sleep(0.01)
+    elif args == ("connect",):
+        if read(directory, "hang"):
+            # Simulates a piactl that never returns, recording its pid so tests can check it was killed
+            write(directory, "hung_pid", str(os.getpid()))
+            time.sleep(60)
+        if state != "Connected":
+            start_connecting(directory)
+    elif args == ("disconnect",):
+        write(directory, "state", "Disconnected")
+    elif args == ("get", "region"):
+        print(read(directory, "region", "auto"))
+    elif args == ("get", "regions"):
+        print("\n".join(REGIONS))
+    elif args[:2] == ("set", "region"):
+        write(directory, "region", args[2])
+        if state == "Connected":
+            start_connecting(directory)
+    elif args == ("get", "vpnip"):
+        print("10.0.0.1" if state == "Connected" else "Unknown")
+    elif args == ("get", "pubip"):
+        print("203.0.113.7")
+    elif args == ("_finish_connect",):
+        time.sleep(CONNECT_DELAY)
+        write(directory, "state", "Connected")
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1], *sys.argv[2:])
@@ -0,0 +1,143 @@
+import asyncio
+import os
+import stat
+import sys
+import tempfile
+import time
+import unittest
+
+from orb.common.vpn.pia import PiaVpn
+from orb.common.vpn.scheduler import RegionScheduler
+from orb.utils.decorators import deadline
+from tests.orb.common.vpn import fake_piactl
+
+
+class FakePiactlTestCase(unittest.TestCase):
+    """
+    Base class running PiaVpn against the fake piactl script.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.piactl = os.path.join(self.directory.name, 'piactl')
+        with open(self.piactl, 'w') as file:
+            file.write(f'#!/bin/sh\nexec "{sys.executable}" "{fake_piactl.__file__}" "{self.directory.name}" "$@"\n')
+        os.chmod(self.piactl, os.stat(self.piactl).st_mode | stat.S_IEXEC)
+
+    def calls(self, command=None):
+        calls = fake_piactl.read(self.directory.name, 'calls').splitlines()
+        return [call for call in calls if command is None or call == command]
+
+
+class PiaVpnMonitorTests(FakePiactlTestCase):
+    """
+    Tests for PiaVpn monitor mode.
+    """
+
+    def test_connect_is_event_driven(self):
+        with PiaVpn(executable_path=self.piactl, monitor=True) as pia:
+            self.assertTrue(pia.monitoring)
+            self.assertEqual(pia.vpn_status(), 'Disconnected')
+
+            start = time.monotonic()
+            pia.connect()
+            elapsed = time.monotonic() - start
+
+            self.assertTrue(pia.vpn_status(as_bool=True))
+        # Woken by the monitor rather than rounded up to the next 1 s poll
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(self.calls('get connectionstate'), [])
+
+    def test_async_wait_for_state(self):
+        with PiaVpn(executable_path=self.piactl, monitor=True) as pia:
+            async def connect():
+                await asyncio.to_thread(fake_piactl.start_connecting, self.directory.name)
+                return await pia.async_wait_for_state('Connected', timeout=5)
+
+            self.assertTrue(asyncio.run(connect()))
+            self.assertFalse(asyncio.run(pia.async_wait_for_state('Disconnected', timeout=0.1)))
+
+    def test_stop_monitor_falls_back_to_polling(self):
+        pia = PiaVpn(executable_path=self.piactl, monitor=True)
+        pia.stop_monitor()
+        self.assertFalse(pia.monitoring)
+        self.assertEqual(pia.vpn_status(), 'Disconnected')
+        self.assertEqual(len(self.calls('get connectionstate')), 1)
+
+
+class PiaVpnPollingTests(FakePiactlTestCase):
+    """
+    Tests for PiaVpn without monitor mode.
+    """
+
+    def test_connect_and_wait(self):
+        pia = PiaVpn(executable_path=self.piactl)
+        pia.connect()
+        self.assertEqual(pia.vpn_status(), 'Connected')
+        self.assertFalse(pia.wait_for_state('Disconnected', timeout=0.1))
+
+    def test_piactl_is_killed_at_the_deadline(self):
+        fake_piactl.write(self.directory.name, 'hang', '1')
+        pia = PiaVpn(executable_path=self.piactl)
+        with self.assertRaises(TimeoutError), deadline(0.5):
+            pia._piactl('connect')
+        hung_pid = int(fake_piactl.read(self.directory.name, 'hung_pid'))
+        with self.assertRaises(ProcessLookupError):
+            os.kill(hung_pid, 0)
+
+
+class PiaVpnRotationTests(FakePiactlTestCase):
+    """
+    Tests for scheduled PiaVpn rotation.
+    """
+
+    def test_rotation_uses_scheduler(self):
+        scheduler = RegionScheduler(rotate_after_requests=1)
+        with PiaVpn(executable_path=self.piactl, monitor=True, scheduler=scheduler) as pia:
+            pia.connect()
+            self.assertFalse(pia.maybe_rotate())
+            pia.set_region('japan')
+
+            pia.record_request()
+            self.assertTrue(pia.maybe_rotate())
+            self.assertNotEqual(pia.get_current_region, 'japan')
+            self.assertIsNotNone(scheduler.stats('japan').connect_time)
+            self.assertEqual(scheduler.current, pia.get_current_region)
+
+
+class PiaVpnCacheTests(FakePiactlTestCase):
+    """
+    Tests for the PiaVpn TTL cache.
+    """
+
+    def test_caches_until_the_connection_changes(self):
+        with PiaVpn(executable_path=self.piactl, monitor=True) as pia:
+            pia.connect()
+            for _ in range(3):
+                regions = pia.get_available_regions
+                pia.get_current_region
+                pia.vpn_ip
+            self.assertEqual(regions, fake_piactl.REGIONS)
+            self.assertEqual(len(self.calls('get regions')), 1)
+            self.assertEqual(len(self.calls('get region')), 1)
+            self.assertEqual(len(self.calls('get vpnip')), 1)
+
+            pia.set_region('japan')
+            self.assertEqual(pia.get_current_region, 'japan')
+            self.assertEqual(len(self.calls('get regions')), 1)
+
+            pia.disconnect()
+            self.assertEqual(pia.vpn_ip, 'Unknown')
+            self.assertEqual(len(self.calls('get vpnip')), 2)
+
+    def test_expires(self):
+        pia = PiaVpn(executable_path=self.piactl)
+        pia.IP_TTL = 0
+        pia.public_ip
+        pia.public_ip
+        self.assertEqual(len(self.calls('get pubip')), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from orb.common.proxies.forward_proxy import ForwardProxy
+from orb.common.vpn.rotator import FakeRotator, NoOpRotator, PiaRotator, ProxyPoolRotator
+
+
+class IpRotatorTests(unittest.TestCase):
+    """
+    Tests for the IpRotator gate, using the FakeRotator backend.
+    """
+
+    def test_rotate(self):
+        rotator = FakeRotator()
+        rotator.rotate()
+        rotator.rotate()
+        self.assertEqual(rotator.history, ['192.0.2.1', '192.0.2.2', '192.0.2.3'])
+        self.assertEqual(rotator.rotations, 2)
+
+    def test_async_rotation_drains_in_flight_work(self):
+        rotator = FakeRotator(switch_seconds=0.1)
+        release = threading.Event()
+        seen = []
+
+        def task():
+            with rotator.work():
+                release.wait(5)
+                seen.append(rotator.current_ip)
+
+        worker = threading.Thread(target=task)
+        worker.start()
+        while rotator.in_flight == 0:
+            time.sleep(0.01)
+
+        future = rotator.rotate_async()
+        time.sleep(0.05)
+        # The switch waits for the in-flight task, and new work waits for the switch
+        self.assertFalse(future.done())
+        self.assertTrue(rotator.rotating)
+        self.assertIs(rotator.rotate_async(), future)
+
+        release.set()
+        worker.join(5)
+        with rotator.work(timeout=5):
+            self.assertEqual(rotator.current_ip, '192.0.2.2')
+        self.assertTrue(future.done())
+        self.assertEqual(seen, ['192.0.2.1'])
+
+    def test_work_timeout(self):
+        rotator = FakeRotator(switch_seconds=0.5)
+        rotator.rotate_async()
+        time.sleep(0.05)
+        with self.assertRaises(TimeoutError):
+            with rotator.work(timeout=0.05):
+                pass
+
+    def test_arotate_and_maybe_rotate(self):
+        rotator = FakeRotator()
+        self.assertIsNone(rotator.maybe_rotate())
+        rotator.due = True
+        asyncio.run(rotator.arotate())
+        self.assertEqual(rotator.rotations, 1)
+        self.assertFalse(rotator.should_rotate())
+
+    def test_no_op(self):
+        rotator = NoOpRotator()
+        rotator.rotate()
+        self.assertEqual(rotator.rotations, 1)
+
+
+class BackendTests(unittest.TestCase):
+    """
+    Tests for the PIA and proxy pool backends.
+    """
+
+    def test_pia_rotator(self):
+        pia = MagicMock()
+        pia.vpn_status.return_value = False
+        rotator = PiaRotator(pia)
+        rotator.rotate()
+        pia.connect.assert_called_once()
+
+        pia.vpn_status.return_value = True
+        rotator.rotate()
+        pia.rotate_vpn.assert_called_once()
+
+    def test_pia_rotator_records_requests(self):
+        pia = MagicMock()
+        pia.scheduler.should_rotate.return_value = False
+        rotator = PiaRotator(pia)
+        rotator.record_request(bytes_transferred=100, seconds=0.5)
+        pia.record_request.assert_called_once_with(bytes_transferred=100, seconds=0.5)
+        self.assertIsNone(rotator._pending)
+
+    def test_proxy_pool_rotator(self):
+        forward_proxy = MagicMock(spec=ForwardProxy)
+        forward_proxy.pool = None
+        forward_proxy.upstream = None
+        pool = MagicMock()
+        pool.get_address.return_value = '1.2.3.4:8080'
+
+        ProxyPoolRotator(forward_proxy, pool=pool).rotate()
+        forward_proxy.set_upstream.assert_called_once_with('1.2.3.4:8080')
+
+        forward_proxy.pool = pool
+        ProxyPoolRotator(forward_proxy).rotate()
+        forward_proxy.rotate.assert_called_once_with()
+
+    def test_package_star_import(self):
+        namespace = {}
+        exec('from orb.common.vpn import *', namespace)
+        self.assertIs(namespace['PiaRotator'], PiaRotator)
+        self.assertIn('RegionScheduler', namespace)
+
+
+if __name__ == '__main__':
+    unittest.main()
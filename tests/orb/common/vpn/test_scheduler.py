@@ -0,0 +1,56 @@
+import unittest
+from collections import Counter
+from unittest.mock import patch
+
+from orb.common.vpn.scheduler import RegionScheduler
+
+REGIONS = ['us-east', 'us-west', 'uk-london', 'de-berlin', 'japan']
+
+
+class RegionSchedulerTests(unittest.TestCase):
+    """
+    Tests for the RegionScheduler.
+    """
+
+    def test_avoids_current_and_recent_regions(self):
+        scheduler = RegionScheduler(recent=2, cooldown=0)
+        for region in ['us-east', 'us-west', 'uk-london']:
+            scheduler.record_connect(region, 1.0)
+
+        for _ in range(50):
+            self.assertIn(scheduler.choose(REGIONS), {'de-berlin', 'japan'})
+
+    def test_falls_back_to_least_recently_used(self):
+        scheduler = RegionScheduler(recent=5, cooldown=600)
+        for region in REGIONS:
+            scheduler.record_connect(region, 1.0)
+        self.assertEqual(scheduler.choose(REGIONS), 'us-east')
+
+    def test_prefers_fast_regions(self):
+        scheduler = RegionScheduler(recent=0, cooldown=0)
+        scheduler.record_connect('us-east', 0.5)
+        scheduler.record_connect('japan', 10.0)
+        scheduler.record_connect('uk-london', 1.0)
+        scheduler.record_request(bytes_transferred=10_000_000, seconds=1)
+
+        counts = Counter(scheduler.choose(['us-east', 'japan'], current='uk-london') for _ in range(500))
+        self.assertGreater(counts['us-east'], counts['japan'] * 5)
+        self.assertGreater(counts['japan'], 0)
+
+    def test_should_rotate(self):
+        scheduler = RegionScheduler(rotate_after_requests=2)
+        scheduler.record_connect('us-east', 1.0)
+        scheduler.record_request()
+        self.assertFalse(scheduler.should_rotate())
+        scheduler.record_request()
+        self.assertTrue(scheduler.should_rotate())
+        scheduler.record_connect('japan', 1.0)
+        self.assertFalse(scheduler.should_rotate())
+
+        scheduler = RegionScheduler(rotate_after_seconds=60)
+        with patch('orb.common.vpn.scheduler.time.monotonic', return_value=scheduler._since + 61):
+            self.assertTrue(scheduler.should_rotate())
+
+
+if __name__ == '__main__':
+    unittest.main()
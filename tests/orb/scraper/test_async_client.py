@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from orb.scraper.async_client import AsyncSpoofClient, aspoof_request, gather_urls
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+
+@unittest.skipUnless(web, 'aiohttp is not installed')
+class AsyncClientTests(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def handler(request):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.02)
+            self.in_flight -= 1
+            if request.path == '/missing':
+                return web.Response(status=404)
+            return web.Response(text=request.headers.get('User-Agent', 'none'))
+
+        app = web.Application()
+        app.router.add_get('/{tail:.*}', handler)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        self.base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    async def asyncTearDown(self):
+        await self.runner.cleanup()
+
+    async def test_aspoof_request_sets_user_agent(self):
+        response = await aspoof_request(f"{self.base_url}/page", use_proxies=False)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.text, 'none')
+
+    async def test_gather_urls_bounds_concurrency(self):
+        urls = [f"{self.base_url}/page/{i}" for i in range(20)] + [f"{self.base_url}/missing"]
+        results = {}
+        async for url, response in gather_urls(urls, concurrency=5, use_proxies=False, use_user_agent=False):
+            results[url] = response.status_code
+        self.assertEqual(len(results), 21)
+        self.assertEqual(results[f"{self.base_url}/missing"], 404)
+        self.assertLessEqual(self.max_in_flight, 5)
+
+    async def test_host_limits_are_dropped_when_idle(self):
+        async with AsyncSpoofClient(per_host=2, use_proxies=False, use_user_agent=False) as client:
+            await asyncio.gather(*(client.get(f"{self.base_url}/page/{i}") for i in range(6)))
+            self.assertLessEqual(self.max_in_flight, 2)
+            self.assertEqual(client._host_limits, {})
+            self.assertEqual(client._host_users, {})
+
+    async def test_gather_urls_yields_exceptions(self):
+        urls = ["http://127.0.0.1:1/unreachable"]
+        results = [result async for result in gather_urls(urls, use_proxies=False, use_user_agent=False)]
+        self.assertIsInstance(results[0][1], Exception)
+
+    async def test_records_proxy_health(self):
+        pool = MagicMock()
+        pool.get_address.return_value = '127.0.0.1:1'
+        with patch('orb.scraper.async_client.GetProxies.proxy_pool', return_value=pool):
+            async with AsyncSpoofClient(use_user_agent=False) as client:
+                with self.assertRaises(Exception):
+                    await client.get(f"{self.base_url}/page")
+        pool.record_failure.assert_called_once_with('127.0.0.1:1')
+
+    async def test_first_proxy_fetch_runs_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        refresh_threads = []
+        pool = MagicMock()
+        pool.__len__.return_value = 0
+        pool.fill.side_effect = lambda: refresh_threads.append(threading.get_ident())
+        pool.get_address.return_value = '127.0.0.1:1'
+        with patch('orb.scraper.async_client.GetProxies.proxy_pool', return_value=pool):
+            async with AsyncSpoofClient(use_user_agent=False) as client:
+                with self.assertRaises(Exception):
+                    await client.get(f"{self.base_url}/page")
+        self.assertEqual(len(refresh_threads), 1)
+        self.assertNotEqual(refresh_threads[0], loop_thread)
+
+
+if __name__ == '__main__':
+    unittest.main()
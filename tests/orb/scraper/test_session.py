@@ -0,0 +1,72 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from orb.scraper.session import SpoofSession
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    connections = set()
+
+    def do_GET(self):
+        _Handler.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+class SpoofSessionTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _Handler.connections.clear()
+
+    def test_reuses_connection_across_user_agents(self):
+        with SpoofSession() as session:
+            for user_agent in 'abcde':
+                self.assertEqual(session.get(self.url, headers={'User-Agent': user_agent}).text, 'ok')
+            self.assertEqual(len(session), 1)
+        self.assertEqual(len(_Handler.connections), 1)
+
+    def test_separate_sessions_per_proxy(self):
+        with SpoofSession() as session:
+            self.assertIsNot(session.session_for(proxies={'https': '1.2.3.4:80'}),
+                             session.session_for(proxies={'https': '5.6.7.8:80'}))
+            self.assertIs(session.session_for(), session.session_for())
+            self.assertEqual(len(session), 3)
+
+    def test_evicts_least_recently_used(self):
+        session = SpoofSession(max_sessions=2)
+        first = session.session_for(proxies={'https': 'a:1'})
+        session.session_for(proxies={'https': 'b:1'})
+        session.session_for(proxies={'https': 'a:1'})
+        session.session_for(proxies={'https': 'c:1'})
+        self.assertEqual(len(session), 2)
+        self.assertIs(session.session_for(proxies={'https': 'a:1'}), first)
+
+    def test_session_key(self):
+        self.assertEqual(SpoofSession.session_key(proxies={'https': '1.2.3.4:80'}), '1.2.3.4:80')
+        self.assertEqual(SpoofSession.session_key(proxies={'http': '1.2.3.4:80'}), '1.2.3.4:80')
+        self.assertIsNone(SpoofSession.session_key())
+
+    def test_pool_sizes_are_separate(self):
+        adapter = SpoofSession(max_sessions=2, pool_connections=7).session_for().get_adapter('https://example.com')
+        self.assertEqual(adapter._pool_connections, 7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from orb.scraper.utils import spoof_request
+
+
+class SpoofRequestTests(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = MagicMock()
+        self.pool.get_proxy.return_value = {'http': '1.2.3.4:8080', 'https': '1.2.3.4:8080'}
+        patcher = patch('orb.scraper.utils.GetProxies.proxy_pool', return_value=self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session = MagicMock()
+
+    def test_records_success(self):
+        self.session.get.return_value = MagicMock(status_code=200)
+        spoof_request('http://example.com', use_user_agent=False, session=self.session)
+        self.pool.record_success.assert_called_once()
+        self.assertEqual(self.pool.record_success.call_args[0][0], '1.2.3.4:8080')
+
+    def test_records_blocked_status(self):
+        self.session.get.return_value = MagicMock(status_code=429)
+        spoof_request('http://example.com', use_user_agent=False, session=self.session)
+        self.pool.record_failure.assert_called_once_with('1.2.3.4:8080')
+
+    def test_records_connection_error(self):
+        self.session.get.side_effect = requests.exceptions.ProxyError()
+        with self.assertRaises(requests.exceptions.ProxyError):
+            spoof_request('http://example.com', use_user_agent=False, session=self.session)
+        self.pool.record_failure.assert_called_once_with('1.2.3.4:8080')
+
+    def test_runs_as_rotator_work(self):
+        rotator = MagicMock()
+        self.session.get.return_value = MagicMock(status_code=200, content=b'hello')
+        spoof_request('http://example.com', use_user_agent=False, session=self.session, ip_rotator=rotator)
+        rotator.work.assert_called_once_with()
+        rotator.work.return_value.__enter__.assert_called_once()
+        self.assertEqual(rotator.record_request.call_args.kwargs['bytes_transferred'], 5)
+
+    def test_forward_proxy(self):
+        spoof_request('http://example.com', use_user_agent=False, session=self.session, forward_proxy='127.0.0.1:8899')
+        proxies = self.session.get.call_args.kwargs['proxies']
+        self.assertEqual(proxies['https'], 'http://127.0.0.1:8899')
+        self.pool.get_proxy.assert_not_called()
+
+
+class SpoofRequestSessionTests(unittest.TestCase):
+
+    @patch('orb.scraper.utils.get_spoof_session')
+    def test_uses_default_session(self, mock_get_session):
+        spoof_request('http://example.com', use_proxies=False, use_user_agent=False)
+        mock_get_session.return_value.get.assert_called_once_with('http://example.com', headers=None, timeout=None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,12 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from selenium.webdriver import Chrome
 from selenium.webdriver.common.proxy import ProxyType
 
 from orb import REPO_PATH
+from orb.common.proxies.forward_proxy import ForwardProxy
+from orb.common.vpn.rotator import FakeRotator, NoOpRotator
 from orb.spinner.core.driver import OrbDriver
 
 
@@ -45,5 +47,125 @@ class OrbDriverTestCase(unittest.TestCase):
         self.assertEqual(orb_driver.driver.proxy, self.mock_proxy)
 
 
+class OrbDriverRotateIdentityTestCase(unittest.TestCase):
+    """
+    Unit tests for OrbDriver.rotate_identity.
+    """
+
+    def setUp(self):
+        self.mock_driver = MagicMock(spec=Chrome)
+        self.mock_driver.execute_script.return_value = 'https://example.com'
+        self.mock_driver.window_handles = ['main']
+        self.mock_driver.current_window_handle = 'main'
+
+    def test_rotate_identity_without_forward_proxy(self):
+        orb_driver = OrbDriver(use_pia=False)
+        orb_driver.set_driver(self.mock_driver)
+
+        user_agent = orb_driver.rotate_identity()
+
+        override = self.mock_driver.execute_cdp_cmd.call_args_list[0]
+        self.assertEqual(override.args[0], 'Network.setUserAgentOverride')
+        self.assertEqual(override.args[1]['userAgent'], user_agent)
+        self.assertIn('Chrome/', user_agent)
+        brands = [brand['brand'] for brand in override.args[1]['userAgentMetadata']['brands']]
+        self.assertIn('Chromium', brands)
+        self.mock_driver.execute_cdp_cmd.assert_any_call('Network.clearBrowserCookies', {})
+        self.mock_driver.quit.assert_not_called()
+
+        with self.assertRaises(RuntimeError):
+            orb_driver.rotate_identity(rotate_proxy=True)
+
+    def test_rotate_identity_overrides_every_tab(self):
+        self.mock_driver.window_handles = ['main', 'popup']
+        orb_driver = OrbDriver(use_pia=False)
+        orb_driver.set_driver(self.mock_driver)
+
+        orb_driver.rotate_identity()
+
+        overrides = [c for c in self.mock_driver.execute_cdp_cmd.call_args_list
+                     if c.args[0] == 'Network.setUserAgentOverride']
+        self.assertEqual(len(overrides), 2)
+        self.mock_driver.switch_to.window.assert_called_once_with('popup')
+
+    def test_rotate_identity_swaps_upstream(self):
+        forward_proxy = MagicMock(spec=ForwardProxy)
+        forward_proxy.pool = None
+        orb_driver = OrbDriver(use_pia=False, forward_proxy=forward_proxy)
+        orb_driver.set_driver(self.mock_driver)
+
+        orb_driver.rotate_identity(upstream='1.2.3.4:8080')
+        forward_proxy.set_upstream.assert_called_once_with('1.2.3.4:8080')
+
+        pool = MagicMock()
+        pool.get_address.return_value = '5.6.7.8:3128'
+        with patch('orb.spinner.core.driver.GetProxies.proxy_pool', return_value=pool):
+            orb_driver.rotate_identity()
+        forward_proxy.set_upstream.assert_called_with('5.6.7.8:3128')
+
+        forward_proxy.pool = MagicMock()
+        orb_driver.rotate_identity()
+        forward_proxy.rotate.assert_called_once_with()
+
+
+class OrbDriverChangeIpAddressTestCase(unittest.TestCase):
+    """
+    Unit tests for OrbDriver.change_ip_address.
+    """
+
+    def test_change_ip_address(self):
+        rotator = FakeRotator()
+        orb_driver = OrbDriver(use_pia=False, ip_rotator=rotator)
+
+        orb_driver.change_ip_address()
+        self.assertEqual(rotator.current_ip, '192.0.2.2')
+
+        orb_driver.change_ip_address(wait=False).result(timeout=5)
+        self.assertEqual(rotator.current_ip, '192.0.2.3')
+
+    def test_defaults_to_no_op_without_pia(self):
+        self.assertIsInstance(OrbDriver(use_pia=False).ip_rotator, NoOpRotator)
+
+    def test_work_records_requests_and_rotates_when_due(self):
+        rotator = FakeRotator()
+        orb_driver = OrbDriver(use_pia=False, ip_rotator=rotator)
+        with patch.object(rotator, 'record_request', wraps=rotator.record_request) as record_request:
+            with orb_driver.work():
+                self.assertEqual(rotator.in_flight, 1)
+                rotator.due = True
+        record_request.assert_called_once()
+        self.assertEqual(rotator.in_flight, 0)
+        rotator._pending.result(timeout=5)
+        self.assertEqual(rotator.current_ip, '192.0.2.2')
+
+    @patch('orb.spinner.core.driver.webdriver.Chrome')
+    @patch('orb.spinner.core.driver.Service')
+    def test_page_loads_run_as_work(self, _, chrome):
+        rotator = FakeRotator()
+        orb_driver = OrbDriver(webdriver_path='chromedriver', use_pia=False, ip_rotator=rotator)
+        chrome.return_value.get.side_effect = lambda url: self.assertEqual(rotator.in_flight, 1)
+        with patch.object(rotator, 'record_request') as record_request:
+            orb_driver.get_webdriver(url='https://example.com')
+        chrome.return_value.get.assert_called_once_with(url='https://example.com')
+        record_request.assert_called_once()
+
+
+class OrbDriverSnapshotTestCase(unittest.TestCase):
+    """
+    Unit tests for OrbDriver.snapshot.
+    """
+
+    def test_snapshot_in_one_round_trip(self):
+        driver = MagicMock()
+        driver.execute_script.return_value = ['<html><body><h1>Hi</h1></body></html>', 'https://example.com/']
+        orb_driver = OrbDriver(use_pia=False)
+        orb_driver.set_driver(driver)
+
+        snapshot = orb_driver.snapshot(parser='html.parser')
+        driver.execute_script.assert_called_once()
+        self.assertEqual(snapshot.url, 'https://example.com/')
+        self.assertEqual(snapshot.extract(lambda soup: soup.h1.text).result(timeout=5), 'Hi')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from orb.spinner.core import driver_cache
+from orb.spinner.core.driver_cache import (ChromeDriverResolutionError,
+                                           resolve_chromedriver_path)
+
+
+class ResolveChromedriverPathTests(unittest.TestCase):
+    """
+    Unit tests for the cached chromedriver resolution.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache_path = os.path.join(self.tmp_dir.name, 'chromedriver.json')
+        self.binary = os.path.join(self.tmp_dir.name, 'chromedriver')
+        open(self.binary, 'w').close()
+
+        patcher = patch.dict(driver_cache._resolved_paths, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.install = patch('orb.spinner.core.driver_cache.ChromeDriverManager').start().return_value.install
+        self.install.return_value = self.binary
+        patch('orb.spinner.core.driver_cache.get_chrome_version', return_value='121.0').start()
+        self.addCleanup(patch.stopall)
+
+    def test_resolves_once_and_caches_on_disk(self):
+        self.assertEqual(resolve_chromedriver_path(cache_path=self.cache_path), self.binary)
+        driver_cache._resolved_paths.clear()
+        self.assertEqual(resolve_chromedriver_path(cache_path=self.cache_path), self.binary)
+        self.install.assert_called_once()
+        with open(self.cache_path) as file:
+            self.assertEqual(json.load(file)['121.0']['path'], self.binary)
+
+    def test_expired_entry_is_re_resolved(self):
+        with open(self.cache_path, 'w') as file:
+            json.dump({'121.0': {'path': self.binary, 'resolved_at': time.time() - 100}}, file)
+        resolve_chromedriver_path(cache_path=self.cache_path, ttl=10)
+        self.install.assert_called_once()
+
+    def test_offline_uses_cache_only(self):
+        with open(self.cache_path, 'w') as file:
+            json.dump({'120.0': {'path': self.binary, 'resolved_at': 0}}, file)
+        self.assertEqual(resolve_chromedriver_path(cache_path=self.cache_path, offline=True), self.binary)
+        self.install.assert_not_called()
+
+    def test_offline_without_cache_raises(self):
+        with self.assertRaises(ChromeDriverResolutionError):
+            resolve_chromedriver_path(cache_path=self.cache_path, offline=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
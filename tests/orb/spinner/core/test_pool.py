@@ -0,0 +1,180 @@
+import queue
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from selenium.common.exceptions import WebDriverException
+
+from orb.spinner.core.pool import OrbDriverPool
+
+
+class OrbDriverPoolTests(unittest.TestCase):
+    """
+    Unit tests for the OrbDriverPool class.
+    """
+
+    def setUp(self):
+        self.drivers = []
+        self.factory = MagicMock(side_effect=self.build_orb_driver)
+        # Resident memory of each fake browser's processes, keyed by chromedriver pid
+        self.memory = {}
+        patcher = patch('orb.spinner.core.pool.psutil.Process', side_effect=self.build_process)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def build_process(self, pid):
+        child = MagicMock()
+        child.memory_info.side_effect = lambda: MagicMock(rss=self.memory[pid] * 1024 * 1024)
+        service = MagicMock()
+        service.children.return_value = [child]
+        return service
+
+    def build_orb_driver(self):
+        driver = MagicMock()
+        driver.window_handles = ['main', 'popup']
+        driver.service.process.pid = len(self.drivers)
+        self.memory[len(self.drivers)] = 300
+        history = {
+            'main': {'entries': [{'url': 'data:,'}, {'url': 'https://example.com/a'}]},
+            'popup': {'entries': [{'url': 'https://ads.example.net/frame?id=1'}]},
+        }
+        driver.execute_cdp_cmd.side_effect = lambda command, params: (
+            history[driver.switch_to.window.call_args.args[0]] if command == 'Page.getNavigationHistory' else {}
+        )
+        self.drivers.append(driver)
+        orb_driver = MagicMock()
+        orb_driver.get_webdriver.return_value = driver
+        return orb_driver
+
+    def build_orb_driver_or_raise(self, errors):
+        error = next(errors, None)
+        if error:
+            raise error
+        return self.build_orb_driver()
+
+    def test_warm_launches_up_front(self):
+        OrbDriverPool(size=3, driver_factory=self.factory)
+        self.assertEqual(self.factory.call_count, 3)
+
+    def test_lease_reuses_and_resets_driver(self):
+        pool = OrbDriverPool(size=1, driver_factory=self.factory)
+        with pool.lease() as first:
+            pass
+        with pool.lease() as second:
+            pass
+        self.assertIs(first, second)
+        self.assertEqual(self.factory.call_count, 1)
+        for origin in ('https://example.com', 'https://ads.example.net'):
+            first.execute_cdp_cmd.assert_any_call(
+                'Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'}
+            )
+        first.execute_cdp_cmd.assert_any_call('Network.clearBrowserCookies', {})
+        first.close.assert_called()
+        first.get.assert_called_with('about:blank')
+
+    def test_recycles_after_max_uses(self):
+        pool = OrbDriverPool(size=1, driver_factory=self.factory, max_uses=2)
+        for _ in range(2):
+            with pool.lease():
+                pass
+        self.assertEqual(self.factory.call_count, 2)
+        self.drivers[0].quit.assert_called_once()
+
+    def test_recycles_after_memory_growth(self):
+        pool = OrbDriverPool(size=1, driver_factory=self.factory, max_memory_growth_mb=50)
+        with pool.lease():
+            self.memory[0] = 340
+        self.assertEqual(self.factory.call_count, 1)
+
+        with pool.lease() as driver:
+            self.memory[0] = 400
+        self.assertEqual(self.factory.call_count, 2)
+        driver.quit.assert_called_once()
+        # The browser is recycled as it was left, without a reset first
+        driver.get.assert_called_once_with('about:blank')
+
+    def test_browser_memory_sums_chrome_processes(self):
+        self.memory[7] = 120
+        driver = MagicMock()
+        driver.service.process.pid = 7
+        self.assertEqual(OrbDriverPool.browser_memory(driver), 120)
+        del driver.service
+        self.assertIsNone(OrbDriverPool.browser_memory(driver))
+
+    def test_recycles_when_reset_fails(self):
+        pool = OrbDriverPool(size=1, driver_factory=self.factory)
+        with pool.lease() as driver:
+            driver.execute_cdp_cmd.side_effect = WebDriverException('crashed')
+        self.assertEqual(self.factory.call_count, 2)
+
+    def test_recycles_when_every_window_was_closed(self):
+        pool = OrbDriverPool(size=1, driver_factory=self.factory)
+        with pool.lease() as driver:
+            driver.window_handles = []
+        self.assertEqual(self.factory.call_count, 2)
+
+    def test_failed_relaunch_does_not_hide_task_error(self):
+        pool = OrbDriverPool(size=1, driver_factory=self.factory, max_uses=1)
+        self.factory.side_effect = WebDriverException('cannot launch')
+        with self.assertRaises(ValueError):
+            with pool.lease():
+                raise ValueError('task failed')
+
+        self.factory.side_effect = self.build_orb_driver
+        with pool.lease(timeout=1) as driver:
+            self.assertIs(driver, self.drivers[-1])
+
+    def test_lazy_pool_waits_when_full(self):
+        pool = OrbDriverPool(size=1, driver_factory=self.factory, warm=False)
+        self.assertEqual(self.factory.call_count, 0)
+        pooled = pool.acquire()
+        with self.assertRaises(queue.Empty):
+            pool.acquire(timeout=0.01)
+        pool.release(pooled)
+
+    def test_waiter_launches_after_failed_replacement(self):
+        pool = OrbDriverPool(size=1, driver_factory=self.factory, max_uses=1)
+        pooled = pool.acquire()
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire()), daemon=True)
+        waiter.start()
+        time.sleep(0.05)
+
+        launches = iter([WebDriverException('cannot launch')])
+        self.factory.side_effect = lambda: self.build_orb_driver_or_raise(launches)
+        pool.release(pooled)
+        waiter.join(timeout=5)
+
+        self.assertFalse(waiter.is_alive())
+        self.assertIs(acquired[0].driver, self.drivers[-1])
+        self.assertEqual(len(pool._all), 1)
+
+    def test_close_wakes_waiters(self):
+        pool = OrbDriverPool(size=1, driver_factory=self.factory)
+        pool.acquire()
+        errors = []
+
+        def wait():
+            try:
+                pool.acquire()
+            except RuntimeError as e:
+                errors.append(e)
+
+        waiter = threading.Thread(target=wait, daemon=True)
+        waiter.start()
+        time.sleep(0.05)
+        pool.close()
+        waiter.join(timeout=5)
+        self.assertFalse(waiter.is_alive())
+        self.assertEqual(len(errors), 1)
+
+    def test_close_quits_drivers(self):
+        with OrbDriverPool(size=2, driver_factory=self.factory):
+            pass
+        for driver in self.drivers:
+            driver.quit.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
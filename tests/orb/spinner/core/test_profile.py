@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from orb.spinner.core.driver import OrbDriver
+from orb.spinner.core.profile import DriverProfile, dedupe_arguments
+
+
+class DriverProfileTests(unittest.TestCase):
+    """
+    Unit tests for the DriverProfile class.
+    """
+
+    def test_dedupe_arguments(self):
+        arguments = ['--a', '--user-agent=one', '--b', '--user-agent=two', '--a']
+        self.assertEqual(dedupe_arguments(arguments), ['--a', '--user-agent=two', '--b'])
+
+    def test_arguments(self):
+        arguments = DriverProfile(headless=True, extra_arguments=['--window-size=800x600']).arguments(
+            user_agent='ua', proxy='127.0.0.1:8899'
+        )
+        self.assertIn('--headless=new', arguments)
+        self.assertIn('--user-agent=ua', arguments)
+        self.assertIn('--proxy-server=127.0.0.1:8899', arguments)
+        self.assertIn('--window-size=800x600', arguments)
+        self.assertNotIn('--window-size=1920x1080', arguments)
+
+    def test_performance_preset(self):
+        profile = DriverProfile.performance()
+        self.assertIn('--disable-background-networking', profile.arguments())
+        self.assertIn('*.woff2', profile.blocked_url_patterns)
+        self.assertIn('*.css', profile.blocked_url_patterns)
+
+    def test_unknown_resource(self):
+        with self.assertRaises(ValueError):
+            DriverProfile(block_resources=['scripts'])
+
+    def test_apply(self):
+        driver = MagicMock()
+        DriverProfile(block_resources=['fonts']).apply(driver)
+        urls = driver.execute_cdp_cmd.call_args.args[1]['urls']
+        self.assertEqual(driver.execute_cdp_cmd.call_args.args[0], 'Network.setBlockedURLs')
+        self.assertEqual(urls[:2], ['*.woff', '*.woff?*'])
+        self.assertEqual(len(urls), 10)
+
+    def test_set_headless_copies_shared_profile(self):
+        profile = DriverProfile(block_resources=['css'])
+        orb_driver = OrbDriver(webdriver_path='chromedriver', use_pia=False, profile=profile).set_headless()
+        self.assertTrue(orb_driver.profile.headless)
+        self.assertEqual(orb_driver.profile.block_resources, ('css',))
+        self.assertFalse(profile.headless)
+
+    @patch('orb.spinner.core.driver.Service')
+    def test_relaunch_does_not_accumulate_arguments(self, _):
+        orb_driver = OrbDriver(webdriver_path='chromedriver', use_pia=False).set_headless()
+        orb_driver._webdriver_init__()
+        first = list(orb_driver.webdriver_options.arguments)
+        orb_driver._webdriver_init__()
+        second = orb_driver.webdriver_options.arguments
+        self.assertEqual(len(first), len(second))
+        self.assertEqual(sum(argument.startswith('--user-agent=') for argument in second), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
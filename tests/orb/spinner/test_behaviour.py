@@ -0,0 +1,115 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from orb.spinner.behaviour import BehaviourScheduler, BehaviourSession, DelayBudget
+from orb.spinner.utils import FOCUS_SCRIPT
+
+
+def fake_driver():
+    driver = MagicMock()
+
+    def execute_script(script, *args):
+        if 'scrollHeight' in script:
+            return [1000, 0]
+        if 'innerWidth, window.innerHeight' in script:
+            return [800, 600]
+        if 'getBoundingClientRect' in script:
+            return {'x': 10, 'y': 20, 'width': 50, 'height': 20, 'viewportWidth': 800, 'viewportHeight': 600,
+                    'point': [35, 30], 'blocker': None}
+        return None
+
+    driver.execute_script.side_effect = execute_script
+    return driver
+
+
+class DelayBudgetTests(unittest.TestCase):
+    """
+    Tests for DelayBudget.
+    """
+
+    def test_counts_without_clamping_by_default(self):
+        budget = DelayBudget(total=1.0)
+        self.assertEqual(budget.take(0.7), 0.7)
+        self.assertFalse(budget.exhausted)
+        self.assertEqual(budget.take(0.7), 0.7)
+        self.assertTrue(budget.exhausted)
+
+    def test_clamps_to_total(self):
+        budget = DelayBudget(total=1.0, clamp=True)
+        self.assertEqual(budget.take(0.7), 0.7)
+        self.assertAlmostEqual(budget.take(0.7), 0.3)
+        self.assertEqual(budget.take(0.5), 0.0)
+        self.assertEqual(budget.remaining, 0.0)
+
+    def test_unlimited(self):
+        budget = DelayBudget()
+        self.assertEqual(budget.take(5), 5)
+        self.assertIsNone(budget.remaining)
+
+
+class BehaviourSessionTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for BehaviourSession and BehaviourScheduler.
+    """
+
+    async def test_scroll_in_steps(self):
+        driver = fake_driver()
+        session = BehaviourSession(driver, budget=DelayBudget(0, clamp=True))
+        target = await session.scroll(scroll_range=(50, 50), steps=4)
+
+        self.assertEqual(target, 500)
+        scrolls = [c.args[0] for c in driver.execute_script.call_args_list if 'scrollTo' in c.args[0]]
+        self.assertEqual(scrolls[-1], 'window.scrollTo(0, 500);')
+        self.assertEqual(len(scrolls), 4)
+
+    async def test_type_sends_every_key(self):
+        driver = fake_driver()
+        element = MagicMock(spec=WebElement)
+        element.parent = driver
+        session = BehaviourSession(driver, budget=DelayBudget(0, clamp=True))
+        await session.type(element, 'ab cd')
+
+        element.click.assert_not_called()
+        driver.execute_script.assert_called_once_with(FOCUS_SCRIPT, element)
+        typed = []
+        for call in driver.execute.call_args_list:
+            command, payload = call.args
+            self.assertEqual(command, Command.W3C_ACTIONS)
+            for device in payload['actions']:
+                typed += [a['value'] for a in device['actions'] if a['type'] == 'keyDown']
+        self.assertEqual(typed, list('ab cd'))
+        # One payload per word rather than per key
+        self.assertEqual(driver.execute.call_count, 2)
+
+    async def test_click_ends_with_press(self):
+        driver = fake_driver()
+        session = BehaviourSession(driver, budget=DelayBudget(0, clamp=True))
+        await session.click(MagicMock(spec=WebElement), num_movements=2)
+
+        _, payload = driver.execute.call_args.args
+        pointer = next(d for d in payload['actions'] if d['type'] == 'pointer')['actions']
+        self.assertEqual([a['type'] for a in pointer if a['type'] != 'pause'], ['pointerDown', 'pointerUp'])
+
+    async def test_sessions_interleave_on_one_loop(self):
+        with BehaviourScheduler(max_workers=4, budget=2.0) as scheduler:
+            sessions = [scheduler.session(fake_driver()) for _ in range(20)]
+
+            async def job(session):
+                for _ in range(4):
+                    await session.sleep(0.1)
+                return session.budget.spent
+
+            start = time.monotonic()
+            results = await scheduler.run(job(session) for session in sessions)
+
+        # Twenty sessions each pause for 0.4s in total, concurrently rather than one after another
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertTrue(all(abs(spent - 0.4) < 1e-9 for spent in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
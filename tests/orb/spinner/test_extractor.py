@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import MagicMock, call
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from orb.spinner.extractor import Element, Field, PageExtractor
+
+
+class PageExtractorTests(unittest.TestCase):
+    """
+    Tests for PageExtractor.
+    """
+
+    def setUp(self):
+        self.driver = MagicMock()
+        self.driver.timeouts.script = 30
+        self.extractor = PageExtractor(self.driver, {
+            'title': (By.CSS_SELECTOR, 'h1'),
+            'links': Field((By.XPATH, '//a'), attributes=['href'], many=True),
+            'price': (By.ID, 'price'),
+        })
+
+    def test_extracts_all_fields_in_one_call(self):
+        self.driver.execute_script.return_value = {
+            'title': {'text': 'Hello', 'attributes': {}},
+            'links': [{'text': 'a', 'attributes': {'href': '/a'}}, {'text': 'b', 'attributes': {'href': '/b'}}],
+            'price': None,
+        }
+        results = self.extractor.extract()
+
+        self.driver.execute_script.assert_called_once()
+        payload = self.driver.execute_script.call_args.args[1]
+        self.assertEqual(payload['links'], {'by': 'xpath', 'value': '//a', 'attributes': ['href'], 'many': True})
+        self.assertEqual(results['title'], Element('Hello', {}))
+        self.assertEqual([link.attributes['href'] for link in results['links']], ['/a', '/b'])
+        self.assertIsNone(results['price'])
+
+    def test_wait_returns_results(self):
+        self.driver.execute_async_script.return_value = {
+            'results': {'title': {'text': 'Hello', 'attributes': {}}, 'links': [], 'price': None},
+            'missing': [],
+        }
+        results = self.extractor.wait(timeout=2, required=['title'])
+
+        _, _, required, timeout_ms = self.driver.execute_async_script.call_args.args
+        self.assertEqual((required, timeout_ms), (['title'], 2000))
+        self.driver.set_script_timeout.assert_not_called()
+        self.assertEqual(results['title'].text, 'Hello')
+
+    def test_wait_raises_and_restores_script_timeout(self):
+        self.driver.timeouts.script = 3
+        self.driver.execute_async_script.side_effect = TimeoutException('script timeout')
+        with self.assertRaises(TimeoutException):
+            self.extractor.wait(timeout=2)
+        self.assertEqual(self.driver.set_script_timeout.call_args_list, [call(7), call(3)])
+
+    def test_wait_times_out(self):
+        self.driver.execute_async_script.return_value = {'results': {}, 'missing': ['price']}
+        with self.assertRaises(TimeoutException):
+            self.extractor.wait(timeout=1)
+
+    def test_rejects_bad_fields(self):
+        with self.assertRaises(ValueError):
+            PageExtractor(self.driver, {'x': ('nonsense', 'h1')})
+        with self.assertRaises(ValueError):
+            self.extractor.wait(required=['missing'])
+
+
+if __name__ == '__main__':
+    unittest.main()
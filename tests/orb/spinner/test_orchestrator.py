@@ -0,0 +1,169 @@
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from orb.common.vpn.rotator import NoOpRotator
+from orb.spinner.core.driver import OrbDriver
+from orb.spinner.orchestrator import CrawlOrchestrator
+
+
+class _FakeOrbDriver:
+
+    work = OrbDriver.work
+
+    def __init__(self):
+        self.ip_rotator = NoOpRotator()
+
+    def get_webdriver(self):
+        driver = MagicMock()
+        driver.window_handles = ['main']
+        driver.execute_script.return_value = None
+        return driver
+
+
+def fake_driver_factory():
+    return _FakeOrbDriver()
+
+
+def _refuse_to_load():
+    raise ImportError('only importable in the worker')
+
+
+class _UnloadableResult:
+
+    def __reduce__(self):
+        return _refuse_to_load, ()
+
+
+def handler(driver, task):
+    kind, value = task
+    if kind == 'ok':
+        return value * 2
+    if kind == 'raise':
+        raise ValueError(value)
+    if kind == 'crash_once':
+        # Crash the worker the first time only, using a marker file shared across processes
+        if not os.path.exists(value):
+            open(value, 'w').close()
+            os._exit(1)
+        return 'recovered'
+    if kind == 'crash':
+        os._exit(1)
+    if kind == 'unloadable':
+        return _UnloadableResult()
+    if kind == 'hang':
+        time.sleep(60)
+    if kind == 'sleep':
+        time.sleep(value)
+        return value
+    if kind == 'hang_once':
+        # Hangs the first time, when it was only started after a sibling that overruns, then succeeds
+        if not os.path.exists(value):
+            open(value, 'w').close()
+            time.sleep(60)
+        return 'retried'
+    if kind == 'hang_with_child':
+        child = subprocess.Popen(['sleep', '60'])
+        with open(value, 'w') as file:
+            file.write(str(child.pid))
+        time.sleep(60)
+    return os.getpid()
+
+
+def process_running(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as file:
+            return file.read().split(')')[-1].split()[0] != 'Z'
+    except FileNotFoundError:
+        return False
+
+
+class CrawlOrchestratorTests(unittest.TestCase):
+    """
+    Tests for the CrawlOrchestrator using real worker processes with fake drivers.
+    """
+
+    def orchestrator(self, **kwargs):
+        kwargs.setdefault('processes', 2)
+        kwargs.setdefault('poll_interval', 0.1)
+        return CrawlOrchestrator(handler, driver_factory=fake_driver_factory, **kwargs)
+
+    def test_streams_results(self):
+        tasks = [('ok', i) for i in range(20)] + [('raise', 'bad')]
+        results = list(self.orchestrator(concurrency=2).run(tasks))
+
+        self.assertEqual(len(results), 21)
+        values = sorted(result.result for result in results if result.ok)
+        self.assertEqual(values, [i * 2 for i in range(20)])
+        errors = [result.error for result in results if not result.ok]
+        self.assertEqual(errors, ['ValueError: bad'])
+
+    def test_reports_results_that_cannot_be_unpickled(self):
+        results = {result.task[0]: result for result in self.orchestrator().run([('unloadable', None), ('ok', 4)])}
+        self.assertIsNone(results['unloadable'].result)
+        self.assertEqual(
+            results['unloadable'].error, 'Failed to unpickle result: ImportError: only importable in the worker'
+        )
+        self.assertEqual(results['ok'].result, 8)
+
+    def test_restarts_crashed_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            marker = os.path.join(directory, 'crashed')
+            tasks = [('crash_once', marker), ('crash', None), ('ok', 1)]
+            results = {result.task[0]: result for result in self.orchestrator(max_attempts=2).run(tasks)}
+
+        self.assertEqual(results['crash_once'].result, 'recovered')
+        self.assertEqual(results['crash_once'].attempts, 2)
+        self.assertFalse(results['crash'].ok)
+        self.assertEqual(results['crash'].attempts, 2)
+        self.assertEqual(results['ok'].result, 2)
+
+    def test_kills_stuck_workers(self):
+        results = list(self.orchestrator(processes=1, max_attempts=1, task_timeout=2).run([('hang', None), ('ok', 3)]))
+        by_kind = {result.task[0]: result for result in results}
+        self.assertIn('timed out', by_kind['hang'].error)
+        self.assertEqual(by_kind['ok'].result, 6)
+
+    def test_timeout_does_not_charge_siblings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            marker = os.path.join(directory, 'hung')
+            tasks = [('hang', None), ('sleep', 1.5), ('hang_once', marker)]
+            orchestrator = self.orchestrator(processes=1, concurrency=2, max_attempts=1, task_timeout=3)
+            by_kind = {result.task[0]: result for result in orchestrator.run(tasks)}
+
+        self.assertIn('timed out', by_kind['hang'].error)
+        self.assertEqual(by_kind['sleep'].result, 1.5)
+        self.assertEqual(by_kind['hang_once'].result, 'retried')
+        self.assertEqual(by_kind['hang_once'].attempts, 1)
+
+    @unittest.skipUnless(os.path.isdir('/proc') and hasattr(os, 'killpg'), 'needs POSIX process groups')
+    def test_kills_worker_children(self):
+        with tempfile.TemporaryDirectory() as directory:
+            pid_file = os.path.join(directory, 'child')
+            orchestrator = self.orchestrator(processes=1, max_attempts=1, task_timeout=2)
+            results = list(orchestrator.run([('hang_with_child', pid_file)]))
+            with open(pid_file) as file:
+                child = int(file.read())
+
+        self.assertIn('timed out', results[0].error)
+        self.assertFalse(process_running(child))
+
+    def test_reads_tasks_lazily(self):
+        consumed = []
+
+        def tasks():
+            for i in range(100):
+                consumed.append(i)
+                yield ('ok', i)
+
+        results = self.orchestrator(processes=1, concurrency=2).run(tasks())
+        next(results)
+        results.close()
+        self.assertLessEqual(len(consumed), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
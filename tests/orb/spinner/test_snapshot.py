@@ -0,0 +1,48 @@
+import threading
+import unittest
+
+from bs4 import BeautifulSoup
+
+from orb.spinner import snapshot as snapshot_module
+from orb.spinner.snapshot import PageSnapshot
+
+HTML = '<html><body><a href="/a">A</a><a href="/b">B</a></body></html>'
+
+
+class PageSnapshotTests(unittest.TestCase):
+    """
+    Tests for PageSnapshot.
+    """
+
+    def test_fallback_parser(self):
+        snapshot = PageSnapshot(HTML, 'https://example.com/', parser='html.parser')
+        self.assertIsInstance(snapshot.document, BeautifulSoup)
+        hrefs = snapshot.extract(lambda soup: [a['href'] for a in soup.find_all('a')])
+        self.assertEqual(hrefs.result(timeout=5), ['/a', '/b'])
+
+    @unittest.skipIf(snapshot_module.lxml is None, 'lxml is not installed')
+    def test_lxml_parser(self):
+        snapshot = PageSnapshot(HTML, 'https://example.com/', parser='lxml')
+        self.assertIsInstance(snapshot.document, BeautifulSoup)
+        links = snapshot.extract(lambda soup: [a['href'] for a in soup.select('a')]).result(timeout=5)
+        self.assertEqual(links, ['/a', '/b'])
+
+    def test_parses_once(self):
+        snapshot = PageSnapshot(HTML, 'https://example.com/', parser='html.parser')
+        documents = []
+        threads = [threading.Thread(target=lambda: documents.append(snapshot.document)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertIs(snapshot.prefetch().result(timeout=5), documents[0])
+        self.assertEqual(len({id(document) for document in documents}), 1)
+
+    def test_extract_errors_surface(self):
+        snapshot = PageSnapshot(HTML, 'https://example.com/', parser='html.parser')
+        with self.assertRaises(AttributeError):
+            snapshot.extract(lambda soup: soup.missing.text).result(timeout=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from orb.spinner.trajectory import (MAX_PATH_STEPS, MIN_PATH_STEPS,
+                                    TEMPLATE_VARIANTS, build_path,
+                                    minimum_jerk, path_template)
+
+
+class TrajectoryTests(unittest.TestCase):
+    """
+    Tests for the human-like trajectory generator.
+    """
+
+    def test_minimum_jerk_profile(self):
+        profile = minimum_jerk(21)
+        self.assertEqual((profile[0], profile[-1]), (0.0, 1.0))
+        self.assertTrue(np.all(np.diff(profile) >= 0))
+        # Slow at both ends, fast in the middle
+        self.assertLess(profile[1] - profile[0], profile[11] - profile[10])
+
+    def test_path_ends_at_target_inside_viewport(self):
+        for _ in range(200):
+            path = build_path((5, 5), (1270, 710), viewport=(1280, 720))
+            self.assertEqual(tuple(path[-1]), (1270, 710))
+            self.assertTrue(np.all(path >= 0))
+            self.assertTrue(np.all(path[:, 0] < 1280) and np.all(path[:, 1] < 720))
+            self.assertTrue(8 <= len(path) <= 40)
+
+    def test_path_is_curved(self):
+        deviations = []
+        for _ in range(50):
+            path = build_path((100, 300), (900, 300), viewport=(1280, 720))
+            deviations.append(np.abs(path[:, 1] - 300).max())
+        self.assertGreater(max(deviations), 20)
+
+    def test_templates_are_cached(self):
+        path_template.cache_clear()
+        for _ in range(100):
+            build_path((0, 0), (400, 300), viewport=(800, 600), steps=20)
+        info = path_template.cache_info()
+        self.assertLessEqual(info.misses, 32)
+        self.assertGreater(info.hits, 0)
+        with self.assertRaises(ValueError):
+            path_template(0, 20)[0, 0] = 1.0
+
+    def test_cache_holds_every_default_template(self):
+        path_template.cache_clear()
+        for steps in range(MIN_PATH_STEPS, MAX_PATH_STEPS + 1):
+            for variant in range(TEMPLATE_VARIANTS):
+                path_template(variant, steps)
+        path_template(0, MIN_PATH_STEPS)
+        self.assertEqual(path_template.cache_info().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
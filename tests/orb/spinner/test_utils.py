@@ -0,0 +1,123 @@
+import unittest
+from statistics import median
+from unittest.mock import MagicMock
+
+from selenium.common.exceptions import ElementClickInterceptedException
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+from orb.spinner.utils import (FOCUS_SCRIPT, human_clicking, keystroke_chunks,
+                               keystroke_plan, perform_random_mouse_movements,
+                               slow_type)
+
+
+class SlowTypeTests(unittest.TestCase):
+    """
+    Tests for slow_type and its keystroke plan.
+    """
+
+    def setUp(self):
+        self.driver = MagicMock()
+        self.element = MagicMock(spec=WebElement)
+        self.element.parent = self.driver
+
+    def key_actions(self):
+        _, payload = self.driver.execute.call_args.args
+        return next(device for device in payload['actions'] if device['type'] == 'key')['actions']
+
+    def test_types_in_one_round_trip(self):
+        slow_type(self.element, 'Hi there', send_keys=True)
+
+        self.driver.execute.assert_called_once()
+        self.assertEqual(self.driver.execute.call_args.args[0], Command.W3C_ACTIONS)
+        typed = [action['value'] for action in self.key_actions() if action['type'] == 'keyDown']
+        self.assertEqual(typed, list('Hi there') + [Keys.ENTER])
+        self.element.send_keys.assert_not_called()
+
+    def test_focuses_without_clicking(self):
+        slow_type(self.element, 'abc')
+
+        self.driver.execute_script.assert_called_once_with(FOCUS_SCRIPT, self.element)
+        self.element.click.assert_not_called()
+        types = [a['type'] for d in self.driver.execute.call_args.args[1]['actions'] for a in d['actions']]
+        self.assertNotIn('pointerDown', types)
+
+    def test_long_texts_are_chunked(self):
+        plan = keystroke_plan('a' * 500, delay=0.2)
+        chunks = keystroke_chunks(plan, max_seconds=10)
+
+        self.assertEqual([k for chunk in chunks for k in chunk], plan)
+        self.assertGreater(len(chunks), 5)
+        self.assertTrue(all(sum(k.hold + k.gap for k in chunk) <= 10 for chunk in chunks))
+
+    def test_async_mode(self):
+        future = slow_type(self.element, 'abc', delay=0.01, wait=False)
+        future.result(timeout=5)
+        self.driver.execute.assert_called_once()
+
+    def test_plan_timings(self):
+        plan = keystroke_plan('a' * 400, delay=0.2)
+        self.assertAlmostEqual(median(keystroke.gap for keystroke in plan), 0.2, delta=0.03)
+        self.assertTrue(all(keystroke.hold > 0 for keystroke in plan))
+        self.assertGreater(len({keystroke.gap for keystroke in plan}), 300)
+
+    def test_default_delay_varies_per_call(self):
+        medians = {round(median(k.gap for k in keystroke_plan('a' * 50)), 3) for _ in range(5)}
+        self.assertGreater(len(medians), 1)
+
+
+class MouseTests(unittest.TestCase):
+    """
+    Tests for the batched mouse movement helpers.
+    """
+
+    def setUp(self):
+        self.driver = MagicMock()
+        self.element = MagicMock(spec=WebElement)
+
+    def pointer_actions(self):
+        self.driver.execute.assert_called_once()
+        command, payload = self.driver.execute.call_args.args
+        self.assertEqual(command, Command.W3C_ACTIONS)
+        devices = {device['type']: device['actions'] for device in payload['actions']}
+        # Both devices advance on the same ticks
+        self.assertEqual(len(devices['pointer']), len(devices['key']))
+        return devices['pointer']
+
+    def test_click_in_one_actions_payload(self):
+        self.driver.execute_script.return_value = {
+            'x': 100, 'y': 200, 'width': 80, 'height': 30, 'viewportWidth': 1280, 'viewportHeight': 720,
+            'point': [140.5, 215.2], 'blocker': None,
+        }
+        human_clicking(self.driver, self.element)
+
+        self.driver.execute_script.assert_called_once()
+        actions = self.pointer_actions()
+        moves = [action for action in actions if action['type'] == 'pointerMove']
+        self.assertGreaterEqual(len(moves), 8)
+        self.assertTrue(all(0 <= m['x'] < 1280 and 0 <= m['y'] < 720 for m in moves))
+        self.assertEqual((moves[-1]['x'], moves[-1]['y']), (140, 215))
+        self.assertEqual([a['type'] for a in actions if a['type'] in ('pointerDown', 'pointerUp')],
+                         ['pointerDown', 'pointerUp'])
+        self.element.click.assert_not_called()
+
+    def test_click_refuses_covered_elements(self):
+        self.driver.execute_script.return_value = {
+            'x': 100, 'y': 200, 'width': 80, 'height': 30, 'viewportWidth': 1280, 'viewportHeight': 720,
+            'point': None, 'blocker': 'div#cookie-banner',
+        }
+        with self.assertRaisesRegex(ElementClickInterceptedException, 'div#cookie-banner'):
+            human_clicking(self.driver, self.element)
+        self.driver.execute.assert_not_called()
+
+    def test_random_movements_stay_in_viewport(self):
+        self.driver.execute_script.return_value = [300, 200]
+        perform_random_mouse_movements(self.driver, num_movements=5)
+
+        moves = [action for action in self.pointer_actions() if action['type'] == 'pointerMove']
+        self.assertTrue(all(0 <= m['x'] < 300 and 0 <= m['y'] < 200 for m in moves))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+import asyncio
+import builtins
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from orb.utils.decorators import (RetryBudget, TimeoutError, check_deadline, deadline, remaining, retry_metrics,
+                                  retry_on_failure, timeout)
+
+
+class TimeoutTests(unittest.TestCase):
+    """
+    Tests for the timeout decorator and deadline helpers.
+    """
+
+    def test_returns_result(self):
+        @timeout(seconds=1)
+        def add(a, b):
+            return a + b
+
+        self.assertEqual(add(1, b=2), 3)
+
+    def test_sub_second_timeout(self):
+        @timeout(seconds=0.1, error_message="too slow")
+        def slow():
+            time.sleep(1)
+
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError) as context:
+            slow()
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual(str(context.exception), "too slow")
+        self.assertIsInstance(context.exception, builtins.TimeoutError)
+
+    def test_works_off_the_main_thread(self):
+        @timeout(seconds=0.1)
+        def slow():
+            time.sleep(1)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(slow) for _ in range(4)]
+            for future in futures:
+                self.assertIsInstance(future.exception(), TimeoutError)
+
+    def test_propagates_exceptions(self):
+        @timeout(seconds=1)
+        def fail():
+            raise ValueError("bad")
+
+        with self.assertRaises(ValueError):
+            fail()
+
+    def test_nested_deadline(self):
+        @timeout(seconds=10)
+        def inner():
+            return remaining()
+
+        @timeout(seconds=0.5)
+        def outer():
+            return inner()
+
+        self.assertLessEqual(outer(), 0.5)
+        self.assertIsNone(remaining())
+
+    def test_abandoned_call_stops_cooperatively(self):
+        stopped = threading.Event()
+
+        @timeout(seconds=0.1)
+        def poll():
+            try:
+                while True:
+                    check_deadline()
+                    time.sleep(0.01)
+            finally:
+                stopped.set()
+
+        with self.assertRaises(TimeoutError):
+            poll()
+        self.assertTrue(stopped.wait(1))
+
+    def test_deadline_context(self):
+        with deadline(1):
+            with deadline(5):
+                self.assertLessEqual(remaining(), 1)
+        with deadline(0):
+            with self.assertRaises(TimeoutError):
+                check_deadline()
+
+    def test_coroutine(self):
+        @timeout(seconds=0.1)
+        async def slow():
+            await asyncio.sleep(1)
+
+        @timeout(seconds=1)
+        async def fast():
+            return remaining()
+
+        with self.assertRaisesRegex(TimeoutError, 'Function took too long'):
+            asyncio.run(slow())
+        self.assertLessEqual(asyncio.run(fast()), 1)
+
+    def test_coroutine_legacy_asyncio_timeout(self):
+        # Before Python 3.11, asyncio.wait_for raises an asyncio.TimeoutError unrelated to the builtin one
+        class LegacyTimeoutError(Exception):
+            pass
+
+        async def wait_for(coroutine, _):
+            coroutine.close()
+            raise LegacyTimeoutError
+
+        @timeout(seconds=1, error_message='too slow')
+        async def func():
+            return None
+
+        with patch.object(asyncio, 'TimeoutError', LegacyTimeoutError), patch.object(asyncio, 'wait_for', wait_for):
+            with self.assertRaisesRegex(TimeoutError, 'too slow'):
+                asyncio.run(func())
+
+
+class RetryOnFailureTests(unittest.TestCase):
+    """
+    Tests for the retry_on_failure decorator and RetryBudget.
+    """
+
+    def flaky(self, failures, error=ConnectionError, **kwargs):
+        calls = []
+        kwargs.setdefault('backoff', 0.001)
+
+        @retry_on_failure(budget=None, **kwargs)
+        def func():
+            calls.append(1)
+            if len(calls) <= failures:
+                raise error("fail")
+            return len(calls)
+
+        return func, calls
+
+    def test_retries_then_succeeds(self):
+        func, _ = self.flaky(failures=2, max_retries=2)
+        self.assertEqual(func(), 3)
+        self.assertEqual(func.retry_stats.as_dict()["retries"], 2)
+
+    def test_reraises_when_exhausted(self):
+        func, calls = self.flaky(failures=5, max_retries=2)
+        with self.assertRaises(ConnectionError):
+            func()
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(func.retry_stats.failures, 1)
+
+    def test_filters_exceptions(self):
+        func, calls = self.flaky(failures=1, error=ValueError, retry_on=(ConnectionError,))
+        with self.assertRaises(ValueError):
+            func()
+        self.assertEqual(len(calls), 1)
+
+        func, calls = self.flaky(failures=1, error=ConnectionRefusedError, give_up_on=(ConnectionRefusedError,))
+        with self.assertRaises(ConnectionRefusedError):
+            func()
+        self.assertEqual(len(calls), 1)
+
+    def test_budget(self):
+        budget = RetryBudget(capacity=1, refill_per_second=0)
+        calls = []
+
+        @retry_on_failure(max_retries=5, backoff=0.001, budget=budget)
+        def func():
+            calls.append(1)
+            raise ConnectionError("fail")
+
+        with self.assertRaises(ConnectionError):
+            func()
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(func.retry_stats.budget_exhausted, 1)
+        self.assertIn(f"{__name__}.{func.__qualname__}", retry_metrics())
+
+    def test_respects_deadline(self):
+        func, calls = self.flaky(failures=5, max_retries=5, backoff=1, jitter=False)
+        with deadline(0.5):
+            with self.assertRaises(ConnectionError):
+                func()
+        self.assertEqual(len(calls), 1)
+
+    def test_coroutine(self):
+        calls = []
+
+        @retry_on_failure(max_retries=2, backoff=0.001, budget=None)
+        async def func():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError("fail")
+            return "ok"
+
+        self.assertEqual(asyncio.run(func()), "ok")
+        self.assertEqual(len(calls), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()